@@ -0,0 +1,73 @@
+class_name MapLoader
+
+## Loads a map compiled offline by tools/map_compiler.py.
+## Returns the same {tile_map, buildings} shape as MapGenerator.generate, plus
+## props and spawns, or an empty Dictionary if the file is missing or stale.
+## Each spawn is {"position": snapped tile, "requested": the tile it was
+## compiled from}; the caller checks "requested" against its own data.
+
+const MAGIC = "SSMP"
+const FORMAT_VERSION = 2
+
+static func load_map(path: String, map_width: int, map_height: int) -> Dictionary:
+	var file = FileAccess.open(path, FileAccess.READ)
+	if file == null:
+		return {}
+
+	# Header (22 bytes, little-endian)
+	if file.get_buffer(4).get_string_from_ascii() != MAGIC:
+		push_warning("MapLoader: %s is not a compiled map" % path)
+		return {}
+	var version = file.get_16()
+	if version != FORMAT_VERSION:
+		push_warning("MapLoader: %s is format v%d, expected v%d — re-run tools/map_compiler.py" % [path, version, FORMAT_VERSION])
+		return {}
+	var width = file.get_16()
+	var height = file.get_16()
+	if width != map_width or height != map_height:
+		push_warning("MapLoader: %s is %dx%d, expected %dx%d" % [path, width, height, map_width, map_height])
+		return {}
+	var map_seed = file.get_32()
+	var building_count = file.get_16()
+	var prop_count = file.get_16()
+	var spawn_count = file.get_16()
+	file.get_16()
+
+	# Tile grid
+	var tiles = file.get_buffer(width * height)
+	var tile_map: Array = []
+	for y in range(height):
+		var row = []
+		row.resize(width)
+		for x in range(width):
+			row[x] = tiles[y * width + x]
+		tile_map.append(row)
+
+	var buildings: Array = []
+	for _i in range(building_count):
+		var bx = file.get_16()
+		var by = file.get_16()
+		var bw = file.get_8()
+		var bh = file.get_8()
+		var wt = file.get_8()
+		file.get_8()
+		buildings.append({"x": bx, "y": by, "w": bw, "h": bh, "wall_type": wt})
+
+	var props: Array = []
+	for _i in range(prop_count):
+		var px = file.get_16()
+		var py = file.get_16()
+		var pt = file.get_8()
+		file.get_8()
+		props.append({"x": px, "y": py, "type": pt})
+
+	var spawns = {}
+	for _i in range(spawn_count):
+		var id = file.get_buffer(16).get_string_from_ascii()
+		var sx = file.get_16()
+		var sy = file.get_16()
+		var rx = file.get_16()
+		var ry = file.get_16()
+		spawns[id] = {"position": Vector2i(sx, sy), "requested": Vector2i(rx, ry)}
+
+	return {"tile_map": tile_map, "buildings": buildings, "props": props, "spawns": spawns, "seed": map_seed}
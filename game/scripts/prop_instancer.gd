@@ -0,0 +1,89 @@
+class_name PropInstancer
+
+## Draws a compiled map's props as one MultiMeshInstance2D per texture, from
+## the instance buffers written by tools/prop_instances.py, instead of one
+## Sprite2D per prop. Returns false (and builds nothing) if the file is
+## missing, does not belong to the loaded map, or names a prop texture that
+## cannot be loaded.
+
+const MAGIC = "SSPI"
+const FORMAT_VERSION = 1
+const FLOATS_PER_INSTANCE = 12  # Transform2D (8) + Color (4)
+
+static func build(path: String, map_width: int, map_height: int, map_seed: int,
+		tile_size: int, parent_node: Node) -> bool:
+	var file = FileAccess.open(path, FileAccess.READ)
+	if file == null:
+		return false
+
+	# Header (20 bytes, little-endian)
+	if file.get_buffer(4).get_string_from_ascii() != MAGIC:
+		push_warning("PropInstancer: %s is not a prop buffer" % path)
+		return false
+	var version = file.get_16()
+	if version != FORMAT_VERSION:
+		push_warning("PropInstancer: %s is format v%d, expected v%d — re-run tools/prop_instances.py" % [path, version, FORMAT_VERSION])
+		return false
+	var width = file.get_16()
+	var height = file.get_16()
+	var group_count = file.get_16()
+	var file_seed = file.get_32()
+	var file_tile_size = file.get_16()
+	var floats = file.get_16()
+	if width != map_width or height != map_height or file_seed != map_seed \
+			or file_tile_size != tile_size or floats != FLOATS_PER_INSTANCE:
+		push_warning("PropInstancer: %s does not match the loaded map — re-run tools/prop_instances.py" % path)
+		return false
+
+	# Read every group before adding nodes, so a truncated file builds nothing
+	var groups: Array = []
+	for _i in range(group_count):
+		var tile_type = file.get_8()
+		file.get_8()  # flags
+		file.get_16()
+		var count = file.get_32()
+		var buffer = file.get_buffer(count * FLOATS_PER_INSTANCE * 4)
+		if buffer.size() != count * FLOATS_PER_INSTANCE * 4:
+			push_warning("PropInstancer: %s is truncated" % path)
+			return false
+		groups.append({"type": tile_type, "count": count, "buffer": buffer.to_float32_array()})
+
+	# Likewise resolve every texture first: TileRenderer skips prop sprites
+	# when this returns true, so a group without one would silently vanish
+	for g in groups:
+		g["name"] = MapGenerator.TileType.keys()[g.type].to_lower()
+		var texture_path = "res://assets/tiles/%s.png" % g.name
+		g["texture"] = load(texture_path) if ResourceLoader.exists(texture_path) else null
+		if g.texture == null:
+			push_warning("PropInstancer: cannot load %s — drawing props as sprites" % texture_path)
+			return false
+
+	var quad = _unit_quad()
+	for g in groups:
+		var multimesh = MultiMesh.new()
+		multimesh.transform_format = MultiMesh.TRANSFORM_2D
+		multimesh.use_colors = true
+		multimesh.mesh = quad
+		multimesh.instance_count = g.count
+		multimesh.buffer = g.buffer
+
+		var node = MultiMeshInstance2D.new()
+		node.name = "Props_" + g.name
+		node.multimesh = multimesh
+		node.texture = g.texture
+		node.z_index = -1
+		parent_node.add_child(node)
+	return true
+
+## 1×1 quad centred on the origin, +y down, UV (0, 0) at the top-left.
+static func _unit_quad() -> ArrayMesh:
+	var arrays = []
+	arrays.resize(Mesh.ARRAY_MAX)
+	arrays[Mesh.ARRAY_VERTEX] = PackedVector2Array([
+		Vector2(-0.5, -0.5), Vector2(0.5, -0.5), Vector2(0.5, 0.5), Vector2(-0.5, 0.5)])
+	arrays[Mesh.ARRAY_TEX_UV] = PackedVector2Array([
+		Vector2(0, 0), Vector2(1, 0), Vector2(1, 1), Vector2(0, 1)])
+	arrays[Mesh.ARRAY_INDEX] = PackedInt32Array([0, 1, 2, 0, 2, 3])
+	var mesh = ArrayMesh.new()
+	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
+	return mesh
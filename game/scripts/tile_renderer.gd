@@ -2,7 +2,10 @@ class_name TileRenderer
 
 const TileType = MapGenerator.TileType
 
+const BUILDING_INDEX = "res://assets/buildings/index.json"
+
 static var _tile_textures: Dictionary = {}
+static var _building_index = null  # {type name: {"WxH": rel path}} from tools/generate_procedural.py --buildings
 
 static func _ensure_textures():
 	if _tile_textures.size() > 0:
@@ -33,9 +36,36 @@ static func _ensure_textures():
 		TileType.SIGN_SHOP: load("res://assets/tiles/sign_shop.png"),
 	}
 
+## Footprint-exact texture for a building (drawn at its w×h aspect ratio),
+## or null if none was generated for this type and size. The footprint
+## textures are not committed, so on a fresh checkout (no index) every
+## building gets null and render() stretches its roof tile instead.
+static func _building_texture(b) -> Texture2D:
+	if _building_index == null:
+		_building_index = {}
+		if FileAccess.file_exists(BUILDING_INDEX):
+			var data = JSON.parse_string(FileAccess.get_file_as_string(BUILDING_INDEX))
+			if data is Dictionary:
+				_building_index = data.get("textures", {})
+	var type_name = TileType.keys()[b.wall_type].to_lower()
+	var sizes = _building_index.get(type_name, {})
+	var key = "%dx%d" % [b.w, b.h]
+	var rel_path = sizes.get(key, "")
+	if rel_path == "":
+		return null
+	var texture = load("res://assets/" + rel_path) if ResourceLoader.exists("res://assets/" + rel_path) else null
+	if texture == null:
+		# Listed but missing or unloadable: warn once, then use the roof tile
+		push_warning("TileRenderer: %s lists %s, which did not load — re-run tools/generate_procedural.py --buildings" % [BUILDING_INDEX, rel_path])
+		sizes.erase(key)
+	return texture
+
 ## Render all tiles and buildings as Sprite2D children of parent_node.
+## With props_instanced, prop tiles only get their grass underlay (the props
+## themselves are drawn by PropInstancer).
 static func render(tile_map: Array, buildings: Array, walkable_tiles: Array,
-		tile_size: int, map_width: int, map_height: int, parent_node: Node):
+		tile_size: int, map_width: int, map_height: int, parent_node: Node,
+		props_instanced: bool = false):
 	_ensure_textures()
 
 	# Track which tiles belong to a building (skip per-tile rendering for these)
@@ -66,22 +96,27 @@ static func render(tile_map: Array, buildings: Array, walkable_tiles: Array,
 					bg.position = pos
 					var gs = grass_tex.get_size()
 					bg.scale = Vector2(float(tile_size) / gs.x, float(tile_size) / gs.y)
+					bg.texture_filter = CanvasItem.TEXTURE_FILTER_LINEAR_WITH_MIPMAPS
 					bg.z_index = -2
 					parent_node.add_child(bg)
 				continue
 
+			var is_prop = tile_type not in walkable_tiles and tile_type not in wall_types
 			var texture = _tile_textures.get(tile_type)
-			if texture:
+			if texture and not (is_prop and props_instanced):
 				var sprite = Sprite2D.new()
 				sprite.texture = texture
 				sprite.position = pos
 				var tex_size = texture.get_size()
 				sprite.scale = Vector2(float(tile_size) / tex_size.x, float(tile_size) / tex_size.y)
+				if tile_type in walkable_tiles:
+					# Ground imports with mipmaps (see tools/godot_import.py)
+					sprite.texture_filter = CanvasItem.TEXTURE_FILTER_LINEAR_WITH_MIPMAPS
 				sprite.z_index = -1
 				parent_node.add_child(sprite)
 
 			# Props sit on grass — render grass underneath
-			if tile_type not in walkable_tiles and tile_type not in wall_types:
+			if is_prop:
 				var grass_tex = _tile_textures.get(TileType.GROUND_GRASS)
 				if grass_tex:
 					var bg = Sprite2D.new()
@@ -89,12 +124,16 @@ static func render(tile_map: Array, buildings: Array, walkable_tiles: Array,
 					bg.position = pos
 					var gs = grass_tex.get_size()
 					bg.scale = Vector2(float(tile_size) / gs.x, float(tile_size) / gs.y)
+					bg.texture_filter = CanvasItem.TEXTURE_FILTER_LINEAR_WITH_MIPMAPS
 					bg.z_index = -2
 					parent_node.add_child(bg)
 
-	# Render each building as ONE sprite scaled to cover the full footprint
+	# Render each building as ONE sprite covering the full footprint —
+	# its footprint-exact texture if there is one, else the stretched roof tile
 	for b in buildings:
-		var texture = _tile_textures.get(b.wall_type)
+		var texture = _building_texture(b)
+		if texture == null:
+			texture = _tile_textures.get(b.wall_type)
 		if texture:
 			var pixel_w = b.w * tile_size
 			var pixel_h = b.h * tile_size
@@ -15,6 +15,18 @@ var tile_map: Array = []
 # Building footprints
 var buildings: Array = []
 
+# Precompiled map (tools/map_compiler.py); falls back to MapGenerator if missing or stale
+const MAP_FILE = "res://resources/maps/indiranagar.ssmap"
+
+# Prop instance buffers for the compiled map (tools/prop_instances.py)
+const PROPS_FILE = "res://resources/maps/indiranagar.props"
+
+# Player spawn; tools/map_compiler.py compiles this and the npc_data positions
+const PLAYER_SPAWN = Vector2i(5, 23)
+
+# Spawn points from the compiled map, already snapped to walkable tiles
+var map_spawns: Dictionary = {}
+
 # Walkable tile types
 var walkable_tiles = [
 	TileType.GROUND, TileType.GROUND_GRASS, TileType.GROUND_DIRT, TileType.GROUND_SAND,
@@ -154,13 +166,18 @@ var controls_hint: Label
 @onready var interact_prompt: Label = $CanvasLayer/InteractPrompt
 
 func _ready():
-	# Generate map
-	var result = MapGenerator.generate(MAP_WIDTH, MAP_HEIGHT)
+	# Load the compiled map, or generate it
+	var result = MapLoader.load_map(MAP_FILE, MAP_WIDTH, MAP_HEIGHT)
+	if result.is_empty():
+		result = MapGenerator.generate(MAP_WIDTH, MAP_HEIGHT)
 	tile_map = result.tile_map
 	buildings = result.buildings
+	map_spawns = result.get("spawns", {})
 
-	# Render tiles
-	TileRenderer.render(tile_map, buildings, walkable_tiles, TILE_SIZE, MAP_WIDTH, MAP_HEIGHT, self)
+	# Render tiles; props are instanced per texture when the compiled map has buffers
+	var props_instanced = result.has("seed") and PropInstancer.build(
+		PROPS_FILE, MAP_WIDTH, MAP_HEIGHT, result.seed, TILE_SIZE, self)
+	TileRenderer.render(tile_map, buildings, walkable_tiles, TILE_SIZE, MAP_WIDTH, MAP_HEIGHT, self, props_instanced)
 
 	# Spawn entities
 	_spawn_player()
@@ -179,10 +196,18 @@ func _ready():
 func _spawn_player():
 	var player_scene = preload("res://scenes/player.tscn")
 	player = player_scene.instantiate()
-	var spawn = _find_nearest_walkable(Vector2i(5, 23))
-	player.set_grid_position(spawn, false)
+	player.set_grid_position(_spawn_point("player", PLAYER_SPAWN), false)
 	add_child(player)
 
+# Compiled spawn for id if it was compiled from pos, else pos snapped now
+func _spawn_point(id: String, pos: Vector2i) -> Vector2i:
+	var compiled = map_spawns.get(id)
+	if compiled != null:
+		if compiled.requested == pos:
+			return compiled.position
+		push_warning("World: spawn '%s' changed since %s was compiled — re-run tools/map_compiler.py" % [id, MAP_FILE])
+	return _find_nearest_walkable(pos)
+
 func _find_nearest_walkable(pos: Vector2i) -> Vector2i:
 	if pos.x >= 0 and pos.x < MAP_WIDTH and pos.y >= 0 and pos.y < MAP_HEIGHT:
 		if tile_map[pos.y][pos.x] in walkable_tiles:
@@ -200,7 +225,7 @@ func _find_nearest_walkable(pos: Vector2i) -> Vector2i:
 func _spawn_npcs():
 	var npc_scene = preload("res://scenes/npc.tscn")
 	for data in npc_data:
-		data.position = _find_nearest_walkable(data.position)
+		data.position = _spawn_point(data.id, data.position)
 		var npc = npc_scene.instantiate()
 		npc.setup(data)
 		npcs.append(npc)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Animated Prop Frames for Startup Simulator
+Looping sprite sheets for the fountain, lamp post and trees, drawn in the
+same style as generate_procedural.
+
+Each prop is a rig: a static base (stone rings, pole, ...) and an optional
+static overlay, both drawn once, plus a draw(t) function that renders only
+the animated box — water ripples, canopy sway, lamp glow — for loop phase
+t in [0, 1). A frame is the base pasted into its sheet cell with the
+animated layer and overlay composited over the box, so per-frame cost
+follows the animated area, not a full redraw of the prop.
+
+The base, overlay and animated layer are generate_procedural's own layer
+helpers (draw_fountain_basin, tree_blobs, lamp_light, ...), the same ones
+its gen_* functions draw with, and every layer is at rest at t = 0: frame 0
+of each sheet is the static asset.
+
+- fountain:  fountain_ripples, sin(2π(r/λ − t) + noise) over a fixed noise
+             field, so rings wobble but loop exactly
+- tree:      gen_tree's canopy blobs sway on per-blob phases, outer blobs
+             more; trunk on top
+- tree_pine: the two canopy layers sway with a lag between them
+- lamp_post: the lamp core and halo pulse, with a faster flicker
+
+Output per prop, next to the static asset: tiles/<name>_anim.png, a grid
+of frames (left to right, top to bottom), and tiles/<name>_anim.json with
+frame size, grid, frame count, fps, per-frame durations and loop flag —
+what SpriteFrames / Sprite2D hframes+vframes need.
+
+Usage:
+  python animated_props.py                  # all props in ANIMATIONS
+  python animated_props.py --only tiles/fountain.png --output /tmp/anim
+"""
+
+import sys
+import math
+import json
+import time
+import random
+from pathlib import Path
+
+try:
+    import numpy  # noqa: F401 — fountain_ripples and lamp_light need it
+    from PIL import Image, ImageDraw
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+import generate_procedural as gp
+from generate_procedural import TILE, SEED, save_if_changed
+from godot_import import write_import_settings
+
+
+class Rig:
+    """Static base/overlay plus an animated layer confined to box (x0, y0, x1, y1)."""
+
+    def __init__(self, base, box, draw, overlay=None):
+        self.base, self.box, self.draw, self.overlay = base, box, draw, overlay
+
+    @property
+    def box_size(self):
+        return self.box[2] - self.box[0], self.box[3] - self.box[1]
+
+
+def _blank(size=(TILE, TILE)):
+    return Image.new("RGBA", size, (0, 0, 0, 0))
+
+
+def _box_around(cx, cy, r):
+    return (max(0, cx - r), max(0, cy - r), min(TILE, cx + r + 1), min(TILE, cy + r + 1))
+
+
+# ─── Rigs ───
+# Drawing comes from generate_procedural's layer helpers, with the random
+# draws replayed from the asset's own seed, so frame 0 is the static asset.
+
+def _rng(rel_path, seed, stream=None):
+    """The asset's draw sequence, or a separate named stream for animation-only randomness."""
+    key = gp.asset_seed(rel_path, seed)
+    return random.Random(key if stream is None else f"{key}:{stream}")
+
+
+def rig_fountain(seed=SEED):
+    cx, cy = TILE // 2, TILE // 2
+    base = _blank()
+    gp.draw_fountain_basin(ImageDraw.Draw(base), cx, cy)
+
+    radius = gp.FOUNTAIN_WATER
+    box = _box_around(cx, cy, radius)
+    overlay = _blank((box[2] - box[0], box[3] - box[1]))
+    gp.draw_fountain_centre(ImageDraw.Draw(overlay), cx - box[0], cy - box[1])
+    return Rig(base, box, gp.fountain_ripples(_rng("tiles/fountain.png", seed), radius), overlay)
+
+
+def rig_tree(seed=SEED, sway=4.0):
+    cx, cy = TILE // 2, TILE // 2
+    blobs = gp.tree_blobs(cx, cy, _rng("tiles/tree.png", seed))
+    phase_rng = _rng("tiles/tree.png", seed, "sway")
+    phases = [phase_rng.uniform(0, math.tau) for _ in blobs]
+    pad = math.ceil(sway * 2)
+    box = (max(0, min(ox - r for ox, _, r, _ in blobs) - pad), max(0, min(oy - r for _, oy, r, _ in blobs) - pad),
+           min(TILE, max(ox + r for ox, _, r, _ in blobs) + pad + 1),
+           min(TILE, max(oy + r for _, oy, r, _ in blobs) + pad + 1))
+    bx, by = box[0], box[1]
+
+    overlay = _blank((box[2] - bx, box[3] - by))
+    gp.draw_tree_trunk(ImageDraw.Draw(overlay), cx - bx, cy - by)
+
+    def draw_frame(t):
+        offsets = []
+        for (ox, oy, _, _), phase in zip(blobs, phases):
+            # Outer blobs move more; offsets are zero at t = 0
+            k = sway * (0.5 + math.hypot(ox - cx, oy - cy) / 70)
+            offsets.append((round(k * (math.sin(math.tau * t + phase) - math.sin(phase))),
+                            round(k * 0.5 * (math.cos(math.tau * t + phase) - math.cos(phase)))))
+        layer = _blank((box[2] - bx, box[3] - by))
+        gp.draw_tree_canopy(ImageDraw.Draw(layer), blobs, offsets, origin=(bx, by))
+        return layer
+
+    return Rig(_blank(), box, draw_frame, overlay)
+
+
+def rig_tree_pine(seed=SEED, sway=3.0):
+    cx, cy = TILE // 2, TILE // 2
+    pad = math.ceil(sway * 2)
+    box = (cx - 25 - pad, cy - 70 - pad, cx + 26 + pad, cy + 71 + pad)
+    bx, by = box[0], box[1]
+
+    overlay = _blank((box[2] - bx, box[3] - by))
+    gp.draw_pine_trunk(ImageDraw.Draw(overlay), cx - bx, cy - by)
+
+    def shift(t, lag):
+        return round(sway * math.sin(math.tau * (t - lag)) - sway * math.sin(-math.tau * lag))
+
+    def draw_frame(t):
+        layer = _blank((box[2] - bx, box[3] - by))
+        # Outer layer leads, inner layer lags a quarter cycle behind
+        gp.draw_pine_canopy(ImageDraw.Draw(layer), cx - bx, cy - by, shift(t, 0.0), shift(t, 0.25))
+        return layer
+
+    return Rig(_blank(), box, draw_frame, overlay)
+
+
+def rig_lamp_post(seed=SEED):
+    cx, cy = TILE // 2, TILE // 2
+    base = _blank()
+    gp.draw_lamp_base(ImageDraw.Draw(base), cx, cy)
+    flicker_phase = _rng("tiles/lamp_post.png", seed, "flicker").uniform(0, math.tau)
+
+    def draw_frame(t):
+        # Slow pulse plus a faster flicker; 1.0 (the static lamp) at t = 0
+        flicker = math.sin(3 * math.tau * t + flicker_phase) - math.sin(flicker_phase)
+        return gp.lamp_light(1.0 + 0.1 * math.sin(math.tau * t) + 0.05 * flicker)
+
+    return Rig(base, _box_around(cx, cy, gp.LAMP_GLOW), draw_frame)
+
+
+# frames × 1/fps is the loop length
+ANIMATIONS = {
+    "tiles/fountain.png": {"rig": rig_fountain, "frames": 12, "fps": 12},
+    "tiles/tree.png": {"rig": rig_tree, "frames": 16, "fps": 8},
+    "tiles/tree_pine.png": {"rig": rig_tree_pine, "frames": 16, "fps": 8},
+    "tiles/lamp_post.png": {"rig": rig_lamp_post, "frames": 8, "fps": 8},
+}
+
+
+# ─── Sheets ───
+
+def grid_shape(frames):
+    """(columns, rows) of the most nearly square grid holding frames."""
+    cols = math.ceil(math.sqrt(frames))
+    return cols, math.ceil(frames / cols)
+
+
+def render_sheet(rig, frames):
+    """Sheet image with frames laid out by grid_shape; frame i has phase i / frames."""
+    fw, fh = rig.base.size
+    cols, rows = grid_shape(frames)
+    sheet = _blank((cols * fw, rows * fh))
+    static = rig.base.crop(rig.box)
+    for i in range(frames):
+        x, y = (i % cols) * fw, (i // cols) * fh
+        sheet.paste(rig.base, (x, y))
+        region = static.copy()
+        region.alpha_composite(rig.draw(i / frames))
+        if rig.overlay is not None:
+            region.alpha_composite(rig.overlay)
+        sheet.paste(region, (x + rig.box[0], y + rig.box[1]))
+    return sheet
+
+
+def sheet_metadata(rel_path, rig, frames, fps):
+    cols, rows = grid_shape(frames)
+    return {
+        "source": rel_path,
+        "frame_size": list(rig.base.size),
+        "columns": cols,
+        "rows": rows,
+        "frames": frames,
+        "fps": fps,
+        "durations_ms": [round(1000 / fps)] * frames,
+        "loop": True,
+        "animated_box": list(rig.box),
+    }
+
+
+def anim_path(rel_path, suffix):
+    """tiles/fountain.png → tiles/fountain_anim.png / .json"""
+    p = Path(rel_path)
+    return (p.parent / f"{p.stem}_anim{suffix}").as_posix()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Render looping sprite sheets for animated props")
+    parser.add_argument("--output", "-o", default=None, help="Output root (default: game/assets/ in repo)")
+    parser.add_argument("--only", nargs="*", help=f"Props to render (default: {', '.join(ANIMATIONS)})")
+    args = parser.parse_args()
+
+    out_root = Path(args.output) if args.output else Path(__file__).parent.parent / "game" / "assets"
+    targets = {k: v for k, v in ANIMATIONS.items() if not args.only or k in args.only}
+
+    print("=" * 60)
+    print("Animated Props — Startup Simulator")
+    print(f"Output: {out_root}")
+    print("=" * 60)
+
+    fail = 0
+    for rel_path, spec in targets.items():
+        try:
+            start = time.perf_counter()
+            rig = spec["rig"]()
+            sheet = render_sheet(rig, spec["frames"])
+            per_frame = (time.perf_counter() - start) / spec["frames"]
+
+            sheet_rel, meta_rel = anim_path(rel_path, ".png"), anim_path(rel_path, ".json")
+            (out_root / sheet_rel).parent.mkdir(parents=True, exist_ok=True)
+            status = save_if_changed(sheet, out_root / sheet_rel)
+            write_import_settings(out_root / sheet_rel, sheet_rel)
+            meta = json.dumps(sheet_metadata(rel_path, rig, spec["frames"], spec["fps"]), indent=2) + "\n"
+            meta_path = out_root / meta_rel
+            if not meta_path.exists() or meta_path.read_text() != meta:
+                meta_path.write_text(meta)
+
+            bw, bh = rig.box_size
+            share = bw * bh / (rig.base.width * rig.base.height)
+            print(f"  ✓ {sheet_rel} ({spec['frames']} frames @ {spec['fps']} fps, {sheet.width}×{sheet.height}, {status})")
+            print(f"      animated box {bw}×{bh} ({share:.0%} of frame), {per_frame * 1000:.1f} ms/frame")
+        except Exception as e:
+            print(f"  ✗ {rel_path}: {e}")
+            fail += 1
+
+    print(f"\nDone: {len(targets) - fail} sheets, {fail} failed")
+    if fail:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
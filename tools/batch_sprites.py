@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Batch Sprite Generation for Startup Simulator
+Bulk (re)generation through a provider's batch API instead of one
+synchronous call per sprite: higher throughput per quota and cheaper, in
+exchange for latency (a job may take minutes to hours).
+
+1. Build one JSONL job file from SPRITES — every sprite, or --variants N
+   alternate takes of each — in the Gemini Batch request format:
+   {"key": <output path>, "request": {"contents": [...], "generation_config": ...}}
+2. Submit it, then poll with exponential backoff (reset whenever results
+   arrive).
+3. Stream each result into the output tree as soon as it is received —
+   same keying/transparency and .import sidecar as generate_sprites.py.
+4. Progress is checkpointed in a state file after every result, so an
+   interrupted run picks up where it stopped: re-running the same command
+   finds the job by name (a hash of the job file and output root) and
+   neither resubmits it nor rewrites finished sprites. Re-running after the job has finished
+   resubmits only the requests that failed or never came back.
+
+Backends:
+- gemini: Gemini Batch API with the Gemini image model (Imagen has no batch
+  endpoint, so tiles and props go through Gemini too). Results arrive when
+  the whole job has finished.
+- local:  the stand-in server below (`serve`), which answers the same way
+  from generate_procedural art at a configurable rate and failure rate, and
+  hands out results as they complete. For exercising the pipeline offline.
+
+Job files and state live in tools/output/batch/<name>/. Variants are written
+under <output>/variants/batch/<category>/<name>_v<k>.png, with <output>
+defaulting to tools/output (outside the Godot project, like recolor.py's
+themes); plain runs write game/assets. .import sidecars are only written
+when the output root is game/assets.
+
+Usage:
+  python batch_sprites.py serve --rate 4 --fail-rate 0.05 &
+  python batch_sprites.py run --backend local --variants 8
+  python batch_sprites.py run --backend gemini             # resumable; re-run after Ctrl+C
+"""
+
+import os
+import re
+import io
+import sys
+import json
+import time
+import base64
+import random
+import hashlib
+import threading
+import urllib.request
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import generate_sprites as gs
+from generate_procedural import MANIFEST, generate as generate_procedural
+from godot_import import write_import_settings
+
+BATCH_MODEL = "gemini-2.5-flash-image"
+LOCAL_URL = "http://127.0.0.1:8765"
+POLL_MIN = 2.0       # seconds
+POLL_MAX = 120.0
+BACKOFF = 1.6
+JOBS_ROOT = Path(__file__).parent / "output" / "batch"
+ASSETS_ROOT = Path(__file__).parent.parent / "game" / "assets"
+
+
+# ─── Job file ───
+
+def build_requests(variants=0, only=None):
+    """[(key, prompt)] for every SPRITES entry, or `variants` takes of each."""
+    requests = []
+    for category, sprites in gs.SPRITES.items():
+        for filename, config in sprites.items():
+            rel_path = f"{category}/{filename}"
+            if only and rel_path not in only:
+                continue
+            prompt = gs._provider_prompt(config, "google")
+            if not variants:
+                requests.append((rel_path, prompt))
+                continue
+            stem = Path(filename).stem
+            for k in range(1, variants + 1):
+                requests.append((f"variants/batch/{category}/{stem}_v{k}.png", f"{prompt}, alternate take {k}"))
+    return requests
+
+
+def job_lines(requests):
+    """Gemini Batch JSONL request lines."""
+    return [json.dumps({
+        "key": key,
+        "request": {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generation_config": {"responseModalities": ["IMAGE"]},
+        },
+    }) for key, prompt in requests]
+
+
+def parse_result(line):
+    """(key, image bytes or None, error or None) from one result line."""
+    record = json.loads(line)
+    key = record.get("key")
+    if record.get("error"):
+        return key, None, str(record["error"].get("message", record["error"]))
+    for candidate in record.get("response", {}).get("candidates", []):
+        for part in candidate.get("content", {}).get("parts", []):
+            data = part.get("inlineData") or part.get("inline_data")
+            if data and data.get("data"):
+                return key, base64.b64decode(data["data"]), None
+    return key, None, "no image data returned"
+
+
+# ─── Backends ───
+# submit(job_path, name) -> job id
+# poll(job_id, after) -> {"state": "running" | "succeeded" | "failed",
+#                         "results": result lines after the first `after`}
+
+class LocalBatch:
+    """Client for the stand-in server."""
+
+    def __init__(self, url=LOCAL_URL):
+        self.url = url.rstrip("/")
+
+    def _call(self, method, path, body=None):
+        req = urllib.request.Request(self.url + path, data=body, method=method)
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return json.loads(resp.read())
+
+    def submit(self, job_path, name):
+        return self._call("POST", f"/v1/batches?name={name}", Path(job_path).read_bytes())["name"]
+
+    def poll(self, job_id, after):
+        return self._call("GET", f"/v1/{job_id}?after={after}")
+
+
+class GeminiBatch:
+    """Gemini Batch API via google-genai (file-based job)."""
+
+    STATES = {"JOB_STATE_SUCCEEDED": "succeeded", "JOB_STATE_FAILED": "failed",
+              "JOB_STATE_CANCELLED": "failed", "JOB_STATE_EXPIRED": "failed"}
+
+    def __init__(self, client, model=BATCH_MODEL):
+        self.client, self.model = client, model
+
+    def submit(self, job_path, name):
+        uploaded = self.client.files.upload(
+            file=str(job_path), config=gs.types.UploadFileConfig(display_name=name, mime_type="jsonl"))
+        job = self.client.batches.create(model=self.model, src=uploaded.name, config={"display_name": name})
+        return job.name
+
+    def poll(self, job_id, after):
+        job = self.client.batches.get(name=job_id)
+        state = self.STATES.get(job.state.name, "running")
+        results = []
+        if state == "succeeded" and job.dest and job.dest.file_name:
+            data = self.client.files.download(file=job.dest.file_name)
+            results = data.decode("utf-8").splitlines()[after:]
+        return {"state": state, "results": results}
+
+
+def make_backend(name, server=LOCAL_URL):
+    if name == "local":
+        return LocalBatch(server)
+    api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        print("ERROR: No Google API key found")
+        print("  export GOOGLE_API_KEY=your_api_key_here")
+        sys.exit(1)
+    return GeminiBatch(gs.genai.Client(api_key=api_key))
+
+
+# ─── Run / resume ───
+
+def save_state(path, state):
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(path)
+
+
+def stream_results(backend, state, state_path, prompts, out_root, poll_min=POLL_MIN, poll_max=POLL_MAX):
+    """Poll until the job finishes, writing every result as it arrives."""
+    delay = poll_min
+    sidecars = out_root.resolve() == ASSETS_ROOT.resolve()
+    while True:
+        status = backend.poll(state["job_id"], state["received"])
+        for line in status["results"]:
+            key, image_bytes, error = parse_result(line)
+            state["received"] += 1
+            if key in state["written"] or key not in prompts:
+                continue
+            if image_bytes is None:
+                state["failed"][key] = error
+                print(f"  ✗ {key}: {error}")
+            else:
+                try:
+                    output_path = out_root / key
+                    image, status_ = gs._save_sprite(image_bytes, prompts[key], "google", output_path)
+                    if sidecars:
+                        write_import_settings(output_path, key)
+                    state["written"][key] = status_
+                    state["failed"].pop(key, None)
+                    print(f"  ✓ {key} ({image.size[0]}×{image.size[1]}, {status_})")
+                except Exception as e:
+                    state["failed"][key] = str(e)
+                    print(f"  ✗ {key}: {e}")
+            save_state(state_path, state)
+
+        if status["state"] != "running":
+            state["state"] = status["state"]
+            save_state(state_path, state)
+            return state
+        delay = poll_min if status["results"] else min(poll_max, delay * BACKOFF)
+        print(f"  … {status['state']}: {len(state['written'])}/{state['total']} written, next poll in {delay:.1f}s")
+        time.sleep(delay * random.uniform(0.9, 1.1))
+
+
+def run(args):
+    requests = build_requests(args.variants, args.only)
+    if not requests:
+        print("  ✗ No sprites selected")
+        sys.exit(1)
+    lines = job_lines(requests)
+    body = ("\n".join(lines) + "\n").encode()
+    if args.output:
+        out_root = Path(args.output)
+    elif args.variants:
+        out_root = Path(__file__).parent / "output"
+    else:
+        out_root = ASSETS_ROOT
+    output = str(out_root.resolve())
+    name = args.name or f"sprites-{hashlib.sha256(body + output.encode()).hexdigest()[:12]}"
+    job_dir = JOBS_ROOT / name
+    job_dir.mkdir(parents=True, exist_ok=True)
+    job_path, state_path = job_dir / "job.jsonl", job_dir / "state.json"
+
+    print("=" * 60)
+    print("Batch Sprite Generation — Startup Simulator")
+    print(f"Job: {name} ({len(requests)} requests)  Backend: {args.backend}")
+    print(f"Output: {out_root}")
+    print("=" * 60)
+
+    backend = make_backend(args.backend, args.server)
+    if state_path.exists():
+        state = json.loads(state_path.read_text())
+        if state.get("output", output) != output:
+            print(f"  ✗ Job {name} writes to {state['output']}, not {output}; pass a different --name")
+            sys.exit(1)
+        print(f"Resuming {state['job_id']}: {len(state['written'])} written, {state['received']} results received")
+        outstanding = [i for i, (key, _) in enumerate(requests) if key not in state["written"]]
+        if state["state"] != "running" and outstanding:
+            # Finished with failures or gaps: resubmit just those requests
+            retry_path = job_dir / f"retry{state['attempt']}.jsonl"
+            retry_path.write_text("".join(lines[i] + "\n" for i in outstanding))
+            state.update(job_id=backend.submit(retry_path, f"{name}-retry{state['attempt']}"),
+                         attempt=state["attempt"] + 1, received=0, state="running")
+            save_state(state_path, state)
+            print(f"Resubmitted {len(outstanding)} outstanding as {state['job_id']}")
+    else:
+        job_path.write_bytes(body)
+        job_id = backend.submit(job_path, name)
+        state = {"name": name, "backend": args.backend, "output": output, "job_id": job_id, "attempt": 1,
+                 "total": len(requests), "received": 0, "state": "running", "written": {}, "failed": {}}
+        save_state(state_path, state)
+        print(f"Submitted {job_id}")
+    if args.no_wait:
+        print(f"\nNot waiting; re-run the same command to collect results ({state_path})")
+        return
+
+    if state["state"] == "running":
+        stream_results(backend, state, state_path, dict(requests), out_root, args.poll_min, args.poll_max)
+
+    missing = state["total"] - len(state["written"]) - len(state["failed"])
+    print(f"\nDone ({state['state']}): {len(state['written'])} written, "
+          f"{len(state['failed'])} failed, {missing} without a result")
+    if state["failed"] or missing or state["state"] != "succeeded":
+        sys.exit(1)
+
+
+# ─── Stand-in server ───
+
+class _Job:
+    def __init__(self, lines):
+        self.requests = [json.loads(line) for line in lines if line.strip()]
+        self.results = []
+        self.lock = threading.Lock()
+
+
+def _standin_png(key, prompt):
+    """Provider-shaped PNG for a job key, drawn by generate_procedural."""
+    from PIL import Image
+    match = re.fullmatch(r"(?:variants/batch/)?(.+?)(?:_v\d+)?\.png", key)
+    rel_path = f"{match.group(1)}.png" if match else key
+    if rel_path not in MANIFEST:
+        raise KeyError(f"no procedural asset for {key}")
+    img = generate_procedural(rel_path, seed=key, size=gs.FALLBACK_SIZE)
+    if gs.BG_MAGENTA in prompt:
+        keyed = Image.new("RGBA", img.size, (255, 0, 255, 255))
+        keyed.alpha_composite(img)
+        img = keyed.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _work(job, rate, fail_rate, rng):
+    for request in job.requests:
+        time.sleep(1 / rate)
+        key = request["key"]
+        prompt = request["request"]["contents"][0]["parts"][0]["text"]
+        if rng.random() < fail_rate:
+            result = {"key": key, "error": {"code": 500, "message": "stand-in: simulated failure"}}
+        else:
+            try:
+                data = base64.b64encode(_standin_png(key, prompt)).decode()
+                result = {"key": key, "response": {"candidates": [{"content": {"parts": [
+                    {"inlineData": {"mimeType": "image/png", "data": data}}]}}]}}
+            except Exception as e:
+                result = {"key": key, "error": {"code": 400, "message": str(e)}}
+        with job.lock:
+            job.results.append(json.dumps(result))
+
+
+def serve(port=8765, rate=4.0, fail_rate=0.0, seed=0):
+    """Stand-in batch server: POST /v1/batches (JSONL), GET /v1/batches/<n>?after=N."""
+    jobs, rng = {}, random.Random(seed)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if not self.path.startswith("/v1/batches"):
+                return self._send(404, {"error": "not found"})
+            lines = self.rfile.read(int(self.headers["Content-Length"])).decode().splitlines()
+            name = f"batches/{len(jobs) + 1}"
+            jobs[name] = _Job(lines)
+            threading.Thread(target=_work, args=(jobs[name], rate, fail_rate, rng), daemon=True).start()
+            self._send(200, {"name": name, "total": len(jobs[name].requests)})
+
+        def do_GET(self):
+            path, _, query = self.path.partition("?")
+            job = jobs.get(path.removeprefix("/v1/"))
+            if job is None:
+                return self._send(404, {"error": "no such job"})
+            after = int(dict(p.split("=", 1) for p in query.split("&") if "=" in p).get("after", 0))
+            with job.lock:
+                results = job.results[after:]
+                done = len(job.results) == len(job.requests)
+            self._send(200, {"state": "succeeded" if done else "running",
+                             "total": len(job.requests), "results": results})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    print(f"Stand-in batch server on http://127.0.0.1:{port} ({rate:g} results/s, {fail_rate:.0%} failures)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Batch-job sprite generation")
+    sub = parser.add_subparsers(dest="command", required=True)
+    r = sub.add_parser("run", help="Build, submit (or resume) and collect a batch job")
+    r.add_argument("--backend", choices=["gemini", "local"], default="gemini")
+    r.add_argument("--server", default=LOCAL_URL, help=f"Stand-in server URL (default: {LOCAL_URL})")
+    r.add_argument("--variants", type=int, default=0, help="Alternate takes per sprite (default: 0, the sprites themselves)")
+    r.add_argument("--only", nargs="*", help="Limit to these sprites (e.g. tiles/tree.png)")
+    r.add_argument("--output", "-o", default=None,
+                   help="Output root (default: game/assets/ in repo; tools/output/ with --variants)")
+    r.add_argument("--name", default=None, help="Job name (default: hash of the job file)")
+    r.add_argument("--no-wait", action="store_true", help="Submit and exit; re-run to collect")
+    r.add_argument("--poll-min", type=float, default=POLL_MIN, help=f"Initial poll interval (default: {POLL_MIN:g}s)")
+    r.add_argument("--poll-max", type=float, default=POLL_MAX, help=f"Backoff cap (default: {POLL_MAX:g}s)")
+    s = sub.add_parser("serve", help="Run the local stand-in batch server")
+    s.add_argument("--port", type=int, default=8765)
+    s.add_argument("--rate", type=float, default=4.0, help="Results per second (default: 4)")
+    s.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests that fail (default: 0)")
+    s.add_argument("--seed", type=int, default=0, help="Seed for simulated failures")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.port, args.rate, args.fail_rate, args.seed)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark for the AI Sprite Pipeline
+Times generate_sprites.py without spending API quota or measuring the network.
+
+Fake Google (Imagen + Gemini) and OpenAI (GPT Image) clients answer the exact
+calls generate_sprites.py makes, replaying recorded image payloads after a
+configurable synthetic latency. Two things are measured:
+
+1. Local pipeline stages per sprite — decode, _process_transparency, save,
+   and the .import sidecar (import), each into a fresh directory.
+2. Orchestration — the whole generate_sprite() path run through a thread pool
+   at each requested concurrency level. Overhead is wall time minus the best
+   possible schedule for the same work (latency plus all of the stages
+   above), so GIL contention and scheduling costs show up there.
+
+Payloads come from --fixtures (written by `generate_sprites.py --record DIR`,
+layout <provider>/<category>/<file>). Sprites without a recording are
+synthesised from game/assets: props and characters are flattened onto the
+magenta key colour for Google, the way Imagen/Gemini return them.
+
+Usage:
+  python bench_sprites.py --provider google --concurrency 1 4 8
+  python bench_sprites.py --latency 2 --jitter 0.5 --report after.json --compare before.json
+"""
+
+import io
+import sys
+import json
+import time
+import base64
+import random
+import platform
+import tempfile
+import threading
+import contextlib
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+import generate_sprites as gs
+
+MAGENTA = (255, 0, 255)
+
+
+# ─── Fixtures ───
+
+def sprite_jobs(provider, only=None):
+    """(category, filename, prompt, aspect_ratio) in generate_sprites.main order."""
+    jobs = []
+    for category, sprites in gs.SPRITES.items():
+        for filename, config in sprites.items():
+            if only and f"{category}/{filename}" not in only:
+                continue
+            prompt = config["prompt"]
+            if provider == "openai":
+                prompt = prompt.replace(gs.BG_MAGENTA, gs.BG_TRANSPARENT)
+            jobs.append((category, filename, prompt, config["aspect_ratio"]))
+    return jobs
+
+
+def _synthesise(asset_path, provider, prompt):
+    """Provider-shaped PNG payload built from an existing asset."""
+    img = Image.open(asset_path).convert("RGBA")
+    if provider != "openai" and "background" in prompt.lower():
+        keyed = Image.new("RGBA", img.size, MAGENTA + (255,))
+        keyed.alpha_composite(img)
+        img = keyed.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def load_payloads(jobs, provider, fixture_dir, asset_root):
+    """{prompt: payload bytes} plus how many were recorded vs synthesised."""
+    payloads, recorded = {}, 0
+    for category, filename, prompt, _ in jobs:
+        path = fixture_dir / provider / category / filename
+        if path.exists():
+            payloads[prompt] = path.read_bytes()
+            recorded += 1
+        else:
+            payloads[prompt] = _synthesise(asset_root / category / filename, provider, prompt)
+    return payloads, recorded, len(jobs) - recorded
+
+
+# ─── Fake providers ───
+
+class FakeLatency:
+    """Thread-safe, seeded per-call delay: mean ± uniform jitter seconds."""
+
+    def __init__(self, mean, jitter, seed=0):
+        self.mean, self.jitter = mean, jitter
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.total = 0.0
+        self.longest = 0.0
+
+    def wait(self):
+        with self._lock:
+            delay = max(0.0, self.mean + self._rng.uniform(-self.jitter, self.jitter))
+            self.total += delay
+            self.longest = max(self.longest, delay)
+        time.sleep(delay)
+        return delay
+
+
+class FakeGoogleClient:
+    """Answers client.models.generate_images / generate_content like google-genai."""
+
+    def __init__(self, payloads, latency):
+        self.models = SimpleNamespace(generate_images=self._generate_images,
+                                      generate_content=self._generate_content)
+        self._payloads, self._latency = payloads, latency
+
+    def _generate_images(self, model, prompt, config):
+        self._latency.wait()
+        image = SimpleNamespace(image_bytes=self._payloads[prompt])
+        return SimpleNamespace(generated_images=[SimpleNamespace(image=image)])
+
+    def _generate_content(self, model, contents, config):
+        self._latency.wait()
+        part = SimpleNamespace(inline_data=SimpleNamespace(data=self._payloads[contents]))
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+class FakeOpenAIClient:
+    """Answers client.images.generate like the OpenAI SDK (b64_json)."""
+
+    def __init__(self, payloads, latency):
+        self.images = SimpleNamespace(generate=self._generate)
+        self._b64 = {prompt: base64.b64encode(data).decode() for prompt, data in payloads.items()}
+        self._latency = latency
+
+    def _generate(self, model, prompt, **kwargs):
+        self._latency.wait()
+        return SimpleNamespace(data=[SimpleNamespace(b64_json=self._b64[prompt], url=None)])
+
+
+def make_client(provider, payloads, latency):
+    return FakeOpenAIClient(payloads, latency) if provider == "openai" else FakeGoogleClient(payloads, latency)
+
+
+# ─── Benchmarks ───
+
+def bench_stages(jobs, provider, payloads, out_root, repeat=1):
+    """Seconds per local stage, summed over all sprites (best of repeat).
+
+    The stages are everything generate_sprite does after the provider call:
+    decode, transparency, save and the .import sidecar. Each repeat writes
+    into a fresh directory, so "save" is always a real PNG write rather than
+    save_if_changed finding the previous repeat's identical file.
+    """
+    best = None
+    for i in range(repeat):
+        timings = {}
+        run_root = out_root / f"run{i}"
+        with contextlib.redirect_stdout(io.StringIO()):
+            for category, filename, prompt, _ in jobs:
+                output_path = run_root / category / filename
+                gs._save_sprite(payloads[prompt], prompt, provider, output_path, timings)
+                start = time.perf_counter()
+                gs.write_import_settings(output_path, f"{category}/{filename}")
+                timings["import"] = timings.get("import", 0.0) + time.perf_counter() - start
+        if best is None or sum(timings.values()) < sum(best.values()):
+            best = timings
+    return best
+
+
+def bench_concurrency(jobs, provider, payloads, out_root, workers, latency_args, local_total):
+    """Run generate_sprite for every job through a pool of `workers` threads."""
+    latency = FakeLatency(*latency_args)
+    client = make_client(provider, payloads, latency)
+
+    def run(job):
+        category, filename, prompt, aspect_ratio = job
+        return gs.generate_sprite(client, filename, prompt, aspect_ratio,
+                                  out_root / category / filename,
+                                  is_character=(category == "characters"), provider=provider)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run, jobs))
+    wall = time.perf_counter() - start
+
+    # Best case: all work (latency + local) perfectly spread over the workers
+    ideal = max((latency.total + local_total) / workers, latency.longest)
+    return {
+        "workers": workers,
+        "wall_s": round(wall, 3),
+        "sprites_per_s": round(len(jobs) / wall, 2),
+        "ideal_s": round(ideal, 3),
+        "overhead_s": round(wall - ideal, 3),
+        "failed": results.count(False),
+    }
+
+
+def print_report(report, baseline=None):
+    def delta(now, before):
+        if before in (None, 0):
+            return ""
+        return f"  ({(now - before) / before:+.0%})"
+
+    base_stages = (baseline or {}).get("stages_s", {})
+    print(f"\nLocal stages ({report['sprites']} sprites, {report['provider']}):")
+    for stage, secs in report["stages_s"].items():
+        per = secs / report["sprites"] * 1000
+        print(f"  {stage:<13} {secs:7.3f}s  {per:7.1f} ms/sprite{delta(secs, base_stages.get(stage))}")
+
+    base_levels = {c["workers"]: c for c in (baseline or {}).get("concurrency", [])}
+    print(f"\nOrchestration (latency {report['latency']['mean_s']}±{report['latency']['jitter_s']}s):")
+    print(f"  {'workers':>7} {'wall':>9} {'ideal':>9} {'overhead':>9} {'sprites/s':>10}")
+    for level in report["concurrency"]:
+        before = base_levels.get(level["workers"], {})
+        print(f"  {level['workers']:>7} {level['wall_s']:>8.2f}s {level['ideal_s']:>8.2f}s "
+              f"{level['overhead_s']:>8.2f}s {level['sprites_per_s']:>10.2f}"
+              f"{delta(level['wall_s'], before.get('wall_s'))}")
+
+
+def main():
+    import argparse
+    tools_root = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Offline benchmark for generate_sprites.py")
+    parser.add_argument("--provider", choices=["google", "openai"], default="google")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 8],
+                        help="Worker counts to run the orchestration benchmark at (default: 1 4 8)")
+    parser.add_argument("--latency", type=float, default=0.5, help="Mean synthetic provider latency in s")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Uniform ± jitter on latency in s")
+    parser.add_argument("--seed", type=int, default=0, help="Latency RNG seed")
+    parser.add_argument("--repeat", type=int, default=1, help="Stage benchmark repetitions (best of)")
+    parser.add_argument("--only", nargs="*", help="Limit to these sprites (e.g. tiles/tree.png)")
+    parser.add_argument("--fixtures", default=str(tools_root / "fixtures" / "sprites"),
+                        help="Recorded payloads from generate_sprites.py --record")
+    parser.add_argument("--assets", default=str(tools_root.parent / "game" / "assets"),
+                        help="Asset root used to synthesise missing fixtures")
+    parser.add_argument("--report", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Earlier JSON report to diff against")
+    args = parser.parse_args()
+
+    jobs = sprite_jobs(args.provider, args.only)
+    if not jobs:
+        parser.error("no sprites selected")
+
+    print("=" * 70)
+    print("Sprite Pipeline Benchmark (offline)")
+    print(f"Provider: {args.provider}  Sprites: {len(jobs)}  Concurrency: {args.concurrency}")
+    print("=" * 70)
+
+    payloads, recorded, synthesised = load_payloads(jobs, args.provider, Path(args.fixtures), Path(args.assets))
+    print(f"Payloads: {recorded} recorded, {synthesised} synthesised from assets")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stages = bench_stages(jobs, args.provider, payloads, Path(tmp) / "stages", args.repeat)
+        local_total = sum(stages.values())
+        levels = [bench_concurrency(jobs, args.provider, payloads, Path(tmp) / f"c{c}", c,
+                                    (args.latency, args.jitter, args.seed), local_total)
+                  for c in args.concurrency]
+
+    report = {
+        "provider": args.provider,
+        "sprites": len(jobs),
+        "payloads": {"recorded": recorded, "synthesised": synthesised},
+        "latency": {"mean_s": args.latency, "jitter_s": args.jitter, "seed": args.seed},
+        "stages_s": {k: round(v, 4) for k, v in stages.items()},
+        "concurrency": levels,
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    if baseline and baseline.get("provider") != args.provider:
+        print(f"WARNING: comparing against a {baseline.get('provider')} baseline")
+    print_report(report, baseline)
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2))
+        print(f"\nReport saved to {args.report}")
+    if any(level["failed"] for level in levels):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
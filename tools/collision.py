@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Collision Polygon Extraction for Startup Simulator
+Derives tight, cheap collision outlines for props and buildings from alpha.
+
+Pipeline per asset:
+1. Threshold alpha at a reduced working resolution (collision does not need
+   every texel of a 1024px sprite).
+2. Trace the outer boundary of each solid region along pixel edges.
+3. Simplify with Douglas-Peucker, raising epsilon until the asset fits the
+   vertex budget.
+4. Optionally split each outline into convex pieces (ear clipping followed by
+   Hertel-Mehlhorn merging) for engines that want convex shapes.
+
+Each asset gets a sidecar next to it (tiles/tree.png → tiles/tree.collision.json)
+with polygons as flat [x0, y0, x1, y1, …] lists in source-pixel coordinates
+and an error report: vertex count, epsilon, and intersection-over-union of
+the polygons against the alpha mask. An asset that cannot meet the vertex
+budget still gets its sidecar, but the run exits 1.
+
+Usage:
+  python collision.py                      # every prop and building in MANIFEST
+  python collision.py tiles/bench.png --budget 8 --convex
+"""
+
+import sys
+import json
+import math
+from collections import deque
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+from generate_procedural import MANIFEST, asset_category
+from pixel_cache import PixelCache
+
+WORK_SIZE = 128        # longest side of the working mask, in px
+ALPHA_CUTOFF = 128     # alpha at or above this is solid
+MIN_AREA = 0.002       # drop regions smaller than this fraction of the image
+VERTEX_BUDGET = 24     # total vertices per asset
+COLLIDABLE = ("prop", "building")
+
+
+# ─── Mask ───
+
+def alpha_mask(img, work_size=WORK_SIZE):
+    """Boolean solid mask at working resolution, plus the source→mask scale.
+
+    img is a PIL image or an (h, w, 4) RGBA array (e.g. from pixel_cache).
+    """
+    if isinstance(img, np.ndarray):
+        alpha = Image.fromarray(np.ascontiguousarray(img[..., 3]))
+    else:
+        alpha = img.convert("RGBA").getchannel("A")
+    scale = max(alpha.size) / work_size if max(alpha.size) > work_size else 1.0
+    if scale > 1.0:
+        size = (max(1, round(alpha.width / scale)), max(1, round(alpha.height / scale)))
+        alpha = alpha.resize(size, Image.BOX)
+    return np.asarray(alpha) >= ALPHA_CUTOFF, scale
+
+
+def _regions(mask, min_pixels):
+    """Yield (top-left pixel, pixel count) of each 8-connected solid region."""
+    h, w = mask.shape
+    seen = np.zeros_like(mask)
+    for y, x in zip(*np.nonzero(mask)):
+        if seen[y, x]:
+            continue
+        seen[y, x] = True
+        queue, count = deque([(y, x)]), 0
+        while queue:
+            cy, cx = queue.popleft()
+            count += 1
+            for ny in (cy - 1, cy, cy + 1):
+                for nx in (cx - 1, cx, cx + 1):
+                    if 0 <= ny < h and 0 <= nx < w and mask[ny, nx] and not seen[ny, nx]:
+                        seen[ny, nx] = True
+                        queue.append((ny, nx))
+        if count >= min_pixels:
+            yield (int(x), int(y)), count
+
+
+# ─── Contour tracing ───
+
+def trace_outline(mask, start):
+    """Outer boundary of the region whose first raster pixel is start.
+
+    Walks pixel edges clockwise (y down) keeping the region on the right, so
+    the polygon's vertices are pixel corners and it encloses the region
+    exactly. Diagonal neighbours count as connected.
+    """
+    h, w = mask.shape
+
+    def solid(px, py):
+        return 0 <= px < w and 0 <= py < h and mask[py, px]
+
+    # The start corner touches only one solid pixel, so the walk passes it
+    # exactly once: leaving along the top edge and coming back up the left.
+    dx, dy = 1, 0
+    points = [start]
+    x, y = start[0] + 1, start[1]
+    while (x, y) != start:
+        rx, ry = -dy, dx                      # right of the heading
+        left = solid(math.floor(x + 0.5 * dx - 0.5 * rx), math.floor(y + 0.5 * dy - 0.5 * ry))
+        right = solid(math.floor(x + 0.5 * dx + 0.5 * rx), math.floor(y + 0.5 * dy + 0.5 * ry))
+        if left:
+            ndx, ndy = dy, -dx                # turn left
+        elif right:
+            ndx, ndy = dx, dy                 # straight on
+        else:
+            ndx, ndy = rx, ry                 # turn right
+        if (ndx, ndy) != (dx, dy):
+            points.append((x, y))
+        dx, dy = ndx, ndy
+        x, y = x + dx, y + dy
+    return points
+
+
+# ─── Simplification ───
+
+def _point_segment_distance(p, a, b):
+    (px, py), (ax, ay), (bx, by) = p, a, b
+    vx, vy = bx - ax, by - ay
+    length2 = vx * vx + vy * vy
+    if length2 == 0:
+        return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * vx + (py - ay) * vy) / length2))
+    return math.hypot(px - (ax + t * vx), py - (ay + t * vy))
+
+
+def _douglas_peucker(points, epsilon):
+    """Simplify an open chain, keeping both ends."""
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        best, best_d = None, epsilon
+        for i in range(lo + 1, hi):
+            d = _point_segment_distance(points[i], points[lo], points[hi])
+            if d > best_d:
+                best, best_d = i, d
+        if best is not None:
+            keep[best] = True
+            stack += [(lo, best), (best, hi)]
+    return [p for p, k in zip(points, keep) if k]
+
+
+def simplify_polygon(points, epsilon):
+    """Douglas-Peucker on a closed polygon, split at its two farthest vertices."""
+    if len(points) <= 4:
+        return list(points)
+    far = max(range(len(points)), key=lambda i: math.dist(points[0], points[i]))
+    first = _douglas_peucker(points[:far + 1], epsilon)
+    second = _douglas_peucker(points[far:] + points[:1], epsilon)
+    simplified = first[:-1] + second[:-1]
+    return simplified if len(simplified) >= 3 else list(points)
+
+
+# ─── Convex decomposition ───
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _area2(poly):
+    return sum(poly[i - 1][0] * p[1] - p[0] * poly[i - 1][1] for i, p in enumerate(poly))
+
+
+def _is_convex(poly):
+    signs = {_cross(poly[i - 2], poly[i - 1], poly[i]) > 0
+             for i in range(len(poly)) if _cross(poly[i - 2], poly[i - 1], poly[i]) != 0}
+    return len(signs) <= 1
+
+
+def _triangulate(poly):
+    """Ear-clipping triangulation of a simple clockwise (y-down) polygon."""
+    idx = list(range(len(poly)))
+    triangles = []
+    while len(idx) > 3:
+        for k in range(len(idx)):
+            a, b, c = idx[k - 1], idx[k], idx[(k + 1) % len(idx)]
+            if _cross(poly[a], poly[b], poly[c]) <= 0:
+                continue                      # reflex or degenerate, not an ear
+            tri = (poly[a], poly[b], poly[c])
+            if any(_cross(tri[0], tri[1], poly[j]) >= 0 and _cross(tri[1], tri[2], poly[j]) >= 0
+                   and _cross(tri[2], tri[0], poly[j]) >= 0 for j in idx if j not in (a, b, c)):
+                continue                      # another vertex inside
+            triangles.append([a, b, c])
+            idx.pop(k)
+            break
+        else:
+            return None                       # not simple after simplification
+    triangles.append(idx)
+    return triangles
+
+
+def convex_decompose(poly):
+    """Split a polygon into convex pieces (Hertel-Mehlhorn over ear clipping).
+
+    Falls back to the convex hull if simplification left the outline
+    self-intersecting.
+    """
+    if _area2(poly) < 0:
+        poly = poly[::-1]
+    if _is_convex(poly):
+        return [poly]
+    pieces = _triangulate(poly)
+    if pieces is None:
+        return [_convex_hull(poly)]
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(pieces)):
+            for j in range(i + 1, len(pieces)):
+                union = _merge_pieces(pieces[i], pieces[j])
+                if union and _is_convex([poly[k] for k in union]):
+                    pieces[i] = union
+                    pieces.pop(j)
+                    merged = True
+                    break
+            if merged:
+                break
+    return [[poly[k] for k in piece] for piece in pieces]
+
+
+def _merge_pieces(a, b):
+    """Join two index cycles sharing an edge, or None."""
+    for i in range(len(a)):
+        u, v = a[i], a[(i + 1) % len(a)]
+        for j in range(len(b)):
+            if b[j] == v and b[(j + 1) % len(b)] == u:
+                around_a = a[i + 1:] + a[:i + 1]          # v … u
+                around_b = b[j + 1:] + b[:j + 1]          # u … v
+                return around_a + around_b[1:-1]
+    return None
+
+
+def _convex_hull(points):
+    pts = sorted(set(points))
+    if len(pts) < 3:
+        return pts
+    lower, upper = [], []
+    for p in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+# ─── Per-asset extraction ───
+
+def _fill(shape, polygons):
+    """Mask of the pixels whose centres lie inside any polygon (even-odd rule)."""
+    h, w = shape
+    cx, cy = np.meshgrid(np.arange(w) + 0.5, np.arange(h) + 0.5)
+    filled = np.zeros(shape, dtype=bool)
+    for poly in polygons:
+        inside = np.zeros(shape, dtype=bool)
+        for (x0, y0), (x1, y1) in zip(poly, poly[1:] + poly[:1]):
+            if y0 == y1:
+                continue
+            crosses = (y0 > cy) != (y1 > cy)
+            inside ^= crosses & (cx < x0 + (cy - y0) * (x1 - x0) / (y1 - y0))
+        filled |= inside
+    return filled
+
+
+def _iou(mask, polygons):
+    filled = _fill(mask.shape, polygons)
+    union = np.logical_or(mask, filled).sum()
+    return float(np.logical_and(mask, filled).sum() / union) if union else 1.0
+
+
+def extract(img, budget=VERTEX_BUDGET, epsilon=1.0, convex=False, work_size=WORK_SIZE):
+    """Collision data for one image (see module docstring for the fields)."""
+    mask, scale = alpha_mask(img, work_size)
+    min_pixels = max(1, int(MIN_AREA * mask.size))
+    outlines = [trace_outline(mask, start) for start, _ in _regions(mask, min_pixels)]
+
+    polygons = [simplify_polygon(o, epsilon) for o in outlines]
+    while outlines and sum(map(len, polygons)) > budget and epsilon < max(mask.shape):
+        epsilon *= 1.25
+        polygons = [simplify_polygon(o, epsilon) for o in outlines]
+
+    report = {
+        "size": [img.shape[1], img.shape[0]] if isinstance(img, np.ndarray) else list(img.size),
+        "vertices": sum(map(len, polygons)),
+        "budget": budget,
+        "epsilon_px": round(epsilon * scale, 2),
+        "iou": round(_iou(mask, polygons), 4),
+        "polygons": [_flat(p, scale) for p in polygons],
+    }
+    if convex:
+        report["convex"] = [_flat(piece, scale) for p in polygons for piece in convex_decompose(p)]
+    return report
+
+
+def _flat(poly, scale):
+    """[x0, y0, x1, y1, …] in source pixels, the PackedVector2Array layout."""
+    return [round(v * scale, 1) for point in poly for v in point]
+
+
+def write_sidecar(path, report):
+    """One key per line; each polygon stays on a single line."""
+    lines = [f"  {json.dumps(k)}: {json.dumps(v)}" for k, v in report.items()]
+    path.write_text("{\n" + ",\n".join(lines) + "\n}\n")
+
+
+def sidecar_path(asset_path):
+    """tiles/tree.png → tiles/tree.collision.json"""
+    return asset_path.with_name(asset_path.stem + ".collision.json")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Extract collision polygons from asset alpha")
+    parser.add_argument("assets", nargs="*",
+                        help="Asset paths relative to --input (default: every prop and building in MANIFEST)")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--budget", type=int, default=VERTEX_BUDGET, help="Max vertices per asset (default: 24)")
+    parser.add_argument("--epsilon", type=float, default=1.0,
+                        help="Starting Douglas-Peucker tolerance in working px (default: 1.0)")
+    parser.add_argument("--work-size", type=int, default=WORK_SIZE, help="Working mask resolution (default: 128)")
+    parser.add_argument("--convex", action="store_true", help="Also write a convex decomposition")
+    parser.add_argument("--no-cache", action="store_true", help="Decode PNGs directly instead of via pixel_cache")
+    args = parser.parse_args()
+
+    in_root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+    assets = args.assets or [k for k in MANIFEST if asset_category(k) in COLLIDABLE]
+
+    print("=" * 60)
+    print("Collision Polygon Extraction — Startup Simulator")
+    print(f"Input: {in_root}  Budget: {args.budget} vertices")
+    print("=" * 60)
+
+    cache = None if args.no_cache else PixelCache()
+    ok, fail, over_budget = 0, 0, []
+    for rel_path in assets:
+        path = in_root / rel_path
+        try:
+            if cache:
+                report = extract(cache.pixels(path), args.budget, args.epsilon, args.convex, args.work_size)
+            else:
+                with Image.open(path) as img:
+                    report = extract(img, args.budget, args.epsilon, args.convex, args.work_size)
+            report["source"] = rel_path
+            write_sidecar(sidecar_path(path), report)
+            over = ""
+            if report["vertices"] > args.budget:
+                over = " OVER BUDGET"
+                over_budget.append(rel_path)
+            print(f"  ✓ {rel_path}: {len(report['polygons'])} polygon(s), {report['vertices']} vertices, "
+                  f"IoU {report['iou']:.3f}, ε {report['epsilon_px']}px{over}")
+            ok += 1
+        except Exception as e:
+            print(f"  ✗ {rel_path}: {e}")
+            fail += 1
+
+    print(f"\nDone: {ok} sidecars written, {fail} failed")
+    if over_budget:
+        print(f"✗ {len(over_budget)} over the {args.budget}-vertex budget: {', '.join(over_budget)}")
+    if fail or over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,24 @@ Style: Illustrated top-down, warm Indiranagar palette, shadowless.
 All props/characters have transparent backgrounds.
 Ground tiles are seamless-tileable.
 Buildings are top-down roof views.
+
+Library use (no disk round-trip):
+    import generate_procedural as gp
+    img = gp.generate("tree", seed=7, size=128)       # PIL RGBA image
+    arr = gp.as_array(img)                            # (h, w, 4) uint8 view
+    for rel_path, img in gp.generate_many(["tiles/bench.png", {"name": "player", "size": 64}]):
+        ...
 """
 
 import os
 import sys
 import math
+import time
 import random
+import hashlib
+import functools
+import threading
+import importlib.util
 from pathlib import Path
 
 try:
@@ -21,6 +33,8 @@ except ImportError:
     print("ERROR: pip install pillow")
     sys.exit(1)
 
+import shards
+
 # ─── Palette (from art-direction.md) ───
 PAL = {
     "terracotta":   (196, 92, 62),
@@ -72,8 +86,6 @@ TILE = 320
 CHAR_SIZE = 320
 SEED = 42
 
-random.seed(SEED)
-
 
 # ─── Utility ───
 
@@ -194,13 +206,13 @@ def _draw_roof_tiles(draw, x0, y0, x1, y1, color, dark_color, tile_h=12):
             draw.line([(tx, row_y + tile_h//2), (tx + tile_h, row_y + tile_h//2)], fill=dark_color, width=1)
 
 def _building_base(w, h, roof_color, roof_dark, edge_color, roof_style="flat"):
-    """Create a building tile — fills ENTIRE tile, thick wall border for visibility."""
-    img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
+    """Create a w×h px building — fills the ENTIRE canvas, thick wall border for visibility."""
+    img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
     border = 8  # thick visible wall border
     x0, y0 = 0, 0
-    x1, y1 = TILE - 1, TILE - 1
+    x1, y1 = w - 1, h - 1
     
     # Outer wall border — clearly visible
     draw.rectangle([x0, y0, x1, y1], fill=edge_color)
@@ -214,9 +226,13 @@ def _building_base(w, h, roof_color, roof_dark, edge_color, roof_style="flat"):
     elif roof_style == "pitched":
         draw.rectangle([rx0, ry0, rx1, ry1], fill=roof_color)
         _draw_roof_tiles(draw, rx0, ry0, rx1, ry1, roof_color, roof_dark)
-        # ridge line
-        cx = TILE // 2
-        draw.line([(cx, ry0+10), (cx, ry1-10)], fill=roof_dark, width=3)
+        # ridge line along the long axis
+        if w > h:
+            cy = h // 2
+            draw.line([(rx0+10, cy), (rx1-10, cy)], fill=roof_dark, width=3)
+        else:
+            cx = w // 2
+            draw.line([(cx, ry0+10), (cx, ry1-10)], fill=roof_dark, width=3)
     elif roof_style == "flat":
         draw.rectangle([rx0, ry0, rx1, ry1], fill=roof_color)
         noise_fill(draw, rx0, ry0, rx1, ry1, roof_color, variance=6)
@@ -234,47 +250,47 @@ def _building_base(w, h, roof_color, roof_dark, edge_color, roof_style="flat"):
     
     return img, draw, (rx0, ry0, rx1, ry1)
 
-def gen_wall():
+def gen_wall(w=TILE, h=TILE):
     """Apartment — flat concrete roof with water tank."""
-    img, draw, (x0, y0, x1, y1) = _building_base(200, 180, PAL["concrete"], PAL["concrete_dk"], PAL["asphalt_dark"], "flat")
+    img, draw, (x0, y0, x1, y1) = _building_base(w, h, PAL["concrete"], PAL["concrete_dk"], PAL["asphalt_dark"], "flat")
     # water tank
     tx, ty = x1 - 50, y0 + 15
     draw.rectangle([tx, ty, tx+35, ty+28], fill=PAL["concrete_dk"])
     draw.rectangle([tx+2, ty+2, tx+33, ty+26], fill=PAL["blue_glass"])
     return img
 
-def gen_wall_brick():
+def gen_wall_brick(w=TILE, h=TILE):
     """Traditional house — terracotta tiled roof."""
-    img, draw, _ = _building_base(180, 160, PAL["roof_tile"], PAL["roof_dark"], PAL["brick"], "tiled")
+    img, draw, _ = _building_base(w, h, PAL["roof_tile"], PAL["roof_dark"], PAL["brick"], "tiled")
     return img
 
-def gen_wall_wood():
+def gen_wall_wood(w=TILE, h=TILE):
     """Shophouse — corrugated metal roof."""
-    img, draw, (x0, y0, x1, y1) = _building_base(160, 120, PAL["metal_grey"], PAL["asphalt_dark"], PAL["wood_dark"], "flat")
+    img, draw, (x0, y0, x1, y1) = _building_base(w, h, PAL["metal_grey"], PAL["asphalt_dark"], PAL["wood_dark"], "flat")
     # corrugation lines
     for gy in range(y0+3, y1-3, 6):
         draw.line([(x0+3, gy), (x1-3, gy)], fill=PAL["concrete_dk"], width=1)
     return img
 
-def gen_roof():
+def gen_roof(w=TILE, h=TILE):
     """Residential — pitched tile roof."""
-    img, draw, _ = _building_base(190, 170, PAL["roof_tile"], PAL["roof_dark"], PAL["brick"], "pitched")
+    img, draw, _ = _building_base(w, h, PAL["roof_tile"], PAL["roof_dark"], PAL["brick"], "pitched")
     return img
 
-def gen_wall_school():
+def gen_wall_school(w=TILE, h=TILE):
     """School — cream flat roof with border."""
-    img, draw, (x0, y0, x1, y1) = _building_base(200, 180, PAL["cream"], PAL["sand"], PAL["sand"], "flat")
+    img, draw, (x0, y0, x1, y1) = _building_base(w, h, PAL["cream"], PAL["sand"], PAL["sand"], "flat")
     # courtyard marking
-    cx, cy = TILE//2, TILE//2
+    cx, cy = w//2, h//2
     draw.rectangle([cx-30, cy-30, cx+30, cy+30], fill=PAL["park_light"])
     draw.rectangle([cx-28, cy-28, cx+28, cy+28], outline=PAL["sand"], width=2)
     return img
 
-def gen_wall_office():
+def gen_wall_office(w=TILE, h=TILE):
     """Office — glass/steel flat roof."""
-    img, draw, (x0, y0, x1, y1) = _building_base(220, 200, PAL["blue_glass"], PAL["blue_glass_dk"], PAL["concrete_dk"], "glass")
-    # AC units
-    for i in range(3):
+    img, draw, (x0, y0, x1, y1) = _building_base(w, h, PAL["blue_glass"], PAL["blue_glass_dk"], PAL["concrete_dk"], "glass")
+    # AC units, one per 80px of roof width
+    for i in range(max(1, (x1 - x0 - 40) // 80)):
         ax = x0 + 15 + i * 80
         ay = y0 + 12
         if ax + 25 < x1:
@@ -282,9 +298,9 @@ def gen_wall_office():
             draw.ellipse([ax+8, ay+4, ax+18, ay+14], fill=PAL["asphalt_dark"])
     return img
 
-def gen_wall_bungalow():
+def gen_wall_bungalow(w=TILE, h=TILE):
     """Bungalow — warm tiled pitched roof."""
-    img, draw, (x0, y0, x1, y1) = _building_base(200, 170, PAL["terracotta"], PAL["brick"], PAL["cream"], "pitched")
+    img, draw, (x0, y0, x1, y1) = _building_base(w, h, PAL["terracotta"], PAL["brick"], PAL["cream"], "pitched")
     return img
 
 
@@ -292,32 +308,60 @@ def gen_wall_bungalow():
 # PROPS (transparent bg, top-down view)
 # ═══════════════════════════════════════════════════════════════
 
+# Props that animated_props.py animates are split into layers: a static
+# base/overlay and a layer taking offsets or a loop phase t, whose rest
+# state (zero offsets, t = 0) is the static asset. Both the gen_* below and
+# the animation rigs draw through these helpers, so frame 0 of every sheet
+# is the static asset. Random draws come from rng, which the gen_* leave as
+# the module (seeded per asset by generate) and rigs pass as
+# random.Random(asset_seed(rel_path, seed)) — the same sequence.
+
+def tree_blobs(cx, cy, rng=random):
+    """Canopy of gen_tree as [(x, y, r, colour)]."""
+    blobs = []
+    for _ in range(12):
+        ox = cx + rng.randint(-50, 50)
+        oy = cy + rng.randint(-50, 50)
+        r = rng.randint(35, 65)
+        c = rng.choice([PAL["leaf_green"], PAL["leaf_dark"], PAL["grass"]])
+        blobs.append((ox, oy, r, c))
+    return blobs
+
+def draw_tree_canopy(draw, blobs, offsets=None, origin=(0, 0)):
+    """Canopy blobs, each shifted by offsets[i] (dx, dy); origin is the canvas's top-left."""
+    for i, (ox, oy, r, c) in enumerate(blobs):
+        dx, dy = offsets[i] if offsets else (0, 0)
+        x, y = ox + dx - origin[0], oy + dy - origin[1]
+        draw.ellipse([x-r, y-r, x+r, y+r], fill=c)
+
+def draw_tree_trunk(draw, cx, cy):
+    draw.ellipse([cx-8, cy-8, cx+8, cy+8], fill=PAL["trunk_brown"])
+
 def gen_tree():
     """Large spreading tree canopy — top-down."""
     img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     cx, cy = TILE//2, TILE//2
-    # canopy blobs
-    for _ in range(12):
-        ox = cx + random.randint(-50, 50)
-        oy = cy + random.randint(-50, 50)
-        r = random.randint(35, 65)
-        c = random.choice([PAL["leaf_green"], PAL["leaf_dark"], PAL["grass"]])
-        draw.ellipse([ox-r, oy-r, ox+r, oy+r], fill=c)
+    draw_tree_canopy(draw, tree_blobs(cx, cy))
     # trunk hint at center
-    draw.ellipse([cx-8, cy-8, cx+8, cy+8], fill=PAL["trunk_brown"])
+    draw_tree_trunk(draw, cx, cy)
     return img
 
+def draw_pine_canopy(draw, cx, cy, outer_dx=0, inner_dx=0):
+    """Elongated two-layer canopy; each layer can be shifted sideways."""
+    draw.ellipse([cx-25+outer_dx, cy-70, cx+25+outer_dx, cy+70], fill=PAL["leaf_dark"])
+    draw.ellipse([cx-20+inner_dx, cy-60, cx+20+inner_dx, cy+60], fill=PAL["leaf_green"])
+
+def draw_pine_trunk(draw, cx, cy):
+    draw.ellipse([cx-5, cy-5, cx+5, cy+5], fill=PAL["trunk_brown"])
+
 def gen_tree_pine():
     """Narrow columnar tree (ashoka/cypress) — top-down."""
     img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     cx, cy = TILE//2, TILE//2
-    # elongated canopy
-    draw.ellipse([cx-25, cy-70, cx+25, cy+70], fill=PAL["leaf_dark"])
-    draw.ellipse([cx-20, cy-60, cx+20, cy+60], fill=PAL["leaf_green"])
-    # trunk
-    draw.ellipse([cx-5, cy-5, cx+5, cy+5], fill=PAL["trunk_brown"])
+    draw_pine_canopy(draw, cx, cy)
+    draw_pine_trunk(draw, cx, cy)
     return img
 
 def gen_bush():
@@ -372,16 +416,37 @@ def gen_bench():
             draw.rectangle([lx-3, ly-3, lx+3, ly+3], fill=PAL["dark"])
     return img
 
-def gen_lamp_post():
-    """Street lamp — top-down (circle head + thin pole shadow)."""
-    img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    cx, cy = TILE//2, TILE//2
+LAMP_GLOW = 42    # halo radius, px
+
+def draw_lamp_base(draw, cx, cy):
     # pole
     draw.line([(cx, cy-30), (cx, cy+30)], fill=PAL["metal_grey"], width=3)
     # lamp head
     draw.ellipse([cx-15, cy-15, cx+15, cy+15], fill=PAL["metal_grey"])
-    draw.ellipse([cx-10, cy-10, cx+10, cy+10], fill=PAL["yellow"])
+
+def lamp_light(level=1.0, glow=LAMP_GLOW):
+    """Lamp core and soft halo as a (2·glow+1)² RGBA image centred on the lamp.
+
+    level scales the halo and core brightness; 1.0 is the static lamp.
+    """
+    import numpy as np
+    size = 2 * glow + 1
+    yy, xx = np.mgrid[:size, :size].astype(np.float32)
+    halo = np.clip(1 - np.hypot(xx - glow, yy - glow) / glow, 0, 1) ** 2
+    layer = np.empty((size, size, 4), dtype=np.uint8)
+    layer[..., :3] = np.clip(np.array(PAL["yellow"], dtype=np.float32) + 35 * level, 0, 255).astype(np.uint8)
+    layer[..., 3] = (halo * 150 * level).astype(np.uint8)
+    img = Image.fromarray(layer, "RGBA")
+    core = tuple(int(min(255, v * (0.75 + 0.25 * level))) for v in PAL["yellow"])
+    ImageDraw.Draw(img).ellipse([glow-10, glow-10, glow+10, glow+10], fill=core)
+    return img
+
+def gen_lamp_post():
+    """Street lamp — top-down (circle head + thin pole shadow, lit)."""
+    img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
+    cx, cy = TILE//2, TILE//2
+    draw_lamp_base(ImageDraw.Draw(img), cx, cy)
+    img.alpha_composite(lamp_light(), (cx - LAMP_GLOW, cy - LAMP_GLOW))
     return img
 
 def gen_fence():
@@ -400,23 +465,54 @@ def gen_fence():
         draw.ellipse([px-2, cy-4, px+2, cy+4], fill=PAL["dark"])
     return img
 
-def gen_fountain():
-    """Park fountain — top-down."""
-    img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    cx, cy = TILE//2, TILE//2
+FOUNTAIN_WATER = 52    # basin water radius, px; the ripple layer covers it
+
+def draw_fountain_basin(draw, cx, cy):
     # outer stone ring
     draw.ellipse([cx-60, cy-60, cx+60, cy+60], fill=PAL["concrete"])
     # water
     draw.ellipse([cx-52, cy-52, cx+52, cy+52], fill=PAL["water_blue"])
     draw.ellipse([cx-35, cy-35, cx+35, cy+35], fill=PAL["water_light"])
+
+def draw_fountain_centre(draw, cx, cy):
     # inner ring
     draw.ellipse([cx-20, cy-20, cx+20, cy+20], fill=PAL["concrete_dk"])
     # center spout
     draw.ellipse([cx-6, cy-6, cx+6, cy+6], fill=PAL["water_light"])
-    # ripples
-    for r in [25, 40, 50]:
-        draw.ellipse([cx-r, cy-r, cx+r, cy+r], outline=(150, 195, 225, 100), width=1)
+
+def fountain_ripples(rng=random, radius=FOUNTAIN_WATER, wavelength=14.0):
+    """ripples(t) → (2·radius+1)² RGBA ripple layer centred on the spout, loop phase t.
+
+    Rings are sin(2π(r/λ − t) + noise), where the noise is a fixed field of
+    random plane waves drawn once from rng, so they wobble but loop exactly.
+    """
+    import numpy as np
+    size = 2 * radius + 1
+    yy, xx = np.mgrid[:size, :size].astype(np.float32)
+    r = np.hypot(xx - radius, yy - radius)
+    waves = np.random.default_rng(rng.getrandbits(32))
+    noise = np.zeros((size, size), dtype=np.float32)
+    for _ in range(6):
+        angle, freq, phase = waves.uniform(0, math.tau), waves.uniform(0.05, 0.15), waves.uniform(0, math.tau)
+        noise += np.sin(freq * (xx * math.cos(angle) + yy * math.sin(angle)) + phase).astype(np.float32)
+    noise *= 0.6 / 6 * 2
+    water = (r > 21) & (r < radius - 1)
+
+    def ripples(t=0.0):
+        wave = np.sin(math.tau * (r / wavelength - t) + noise)
+        layer = np.empty((size, size, 4), dtype=np.uint8)
+        layer[..., :3] = (150, 195, 225)
+        layer[..., 3] = np.where(water, np.clip(wave, 0, 1) ** 3 * 130, 0).astype(np.uint8)
+        return Image.fromarray(layer, "RGBA")
+    return ripples
+
+def gen_fountain():
+    """Park fountain — top-down."""
+    img = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
+    cx, cy = TILE//2, TILE//2
+    draw_fountain_basin(ImageDraw.Draw(img), cx, cy)
+    img.alpha_composite(fountain_ripples()(0.0), (cx - FOUNTAIN_WATER, cy - FOUNTAIN_WATER))
+    draw_fountain_centre(ImageDraw.Draw(img), cx, cy)
     return img
 
 def gen_mailbox():
@@ -627,16 +723,402 @@ MANIFEST = {
     "characters/npc_priya.png": gen_npc_priya,
 }
 
+# Asset categories for downstream tools (collision, import settings, budgets).
+# Anything under characters/ is a character, under buildings/ a building
+# (footprint textures, see below) and under ui/ is UI. *_sdf.png are the
+# distance fields tools/sdf.py writes next to their assets.
+GROUND_TILES = {"ground", "ground_grass", "ground_dirt", "ground_sand", "park_ground"}
+BUILDING_TILES = {"wall", "wall_brick", "wall_wood", "roof", "wall_school", "wall_office", "wall_bungalow"}
+
+
+def asset_category(rel_path):
+    """Category of an asset path: ground, building, prop, character, ui or sdf."""
+    top, _, name = str(rel_path).replace("\\", "/").partition("/")
+    stem = Path(name).stem
+    if stem.endswith("_sdf"):
+        return "sdf"
+    if top == "characters":
+        return "character"
+    if top == "ui":
+        return "ui"
+    if top == "buildings":
+        return "building"
+    if stem in GROUND_TILES:
+        return "ground"
+    if stem in BUILDING_TILES:
+        return "building"
+    return "prop"
+
+
+# ─── Footprint-exact buildings ───
+# The tiles/wall*.png roofs are single squares that TileRenderer would have
+# to stretch over a building's footprint. These are drawn at the footprint's
+# own aspect ratio instead, one per distinct (type, w, h) the map places.
+
+BUILDING_DENSITY = 128   # texels per map tile; a multiple of 4 for block compression
+BUILDING_INDEX = "buildings/index.json"
+
+
+def building_footprints(layout="indiranagar"):
+    """Sorted distinct (type name, w, h) of the buildings map_compiler places."""
+    import map_compiler
+    _, buildings, _, _ = map_compiler.compile_map(map_compiler.LAYOUTS[layout])
+    return sorted({(map_compiler.TILE_TYPES[b["wall_type"]].lower(), b["w"], b["h"]) for b in buildings})
+
+
+def building_path(name, w, h):
+    return f"buildings/{name}_{w}x{h}.png"
+
+
+def building_targets(footprints, density=BUILDING_DENSITY):
+    """{rel_path: gen_fn} drawing each footprint with its type's roof generator."""
+    return {building_path(name, w, h): functools.partial(MANIFEST[f"tiles/{name}.png"], w=w * density, h=h * density)
+            for name, w, h in footprints}
+
+
+def write_building_index(out_root, footprints, density=BUILDING_DENSITY, listed=None):
+    """Write buildings/index.json: {"textures": {type: {"WxH": rel_path}}}.
+
+    Only footprints whose texture exists under out_root are listed, or, if
+    listed is given, those whose rel_path is in it (a shard lists what the
+    whole shard set produces, so every shard writes the same index).
+    Returns True if the file changed (unchanged files keep their mtime).
+    """
+    import json
+    textures = {}
+    for name, w, h in footprints:
+        rel_path = building_path(name, w, h)
+        if (rel_path in listed) if listed is not None else (Path(out_root) / rel_path).exists():
+            textures.setdefault(name, {})[f"{w}x{h}"] = rel_path
+    text = json.dumps({"density": density, "textures": textures}, indent=2, sort_keys=True) + "\n"
+    path = Path(out_root) / BUILDING_INDEX
+    if path.exists() and path.read_text() == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return True
+
+
+# ─── Library API ───
+
+# gen_* functions draw from the module-level random generator, so seeding and
+# drawing one asset must not interleave with another thread doing the same.
+_GEN_LOCK = threading.Lock()
+
+
+def resolve_name(name):
+    """MANIFEST key for "tiles/tree.png", "tiles/tree" or just "tree"."""
+    if name in MANIFEST:
+        return name
+    for candidate in (f"{name}.png", f"tiles/{name}.png", f"characters/{name}.png"):
+        if candidate in MANIFEST:
+            return candidate
+    raise KeyError(f"unknown asset {name!r}")
+
+
+def asset_seed(rel_path, seed=SEED):
+    """Seed the random module is set to while rel_path is drawn."""
+    return f"{seed}:{rel_path}"
+
+
+def _render(rel_path, gen_fn, seed=SEED):
+    """Run gen_fn under the per-asset seed for rel_path."""
+    with _GEN_LOCK:
+        random.seed(asset_seed(rel_path, seed))
+        return gen_fn()
+
+
+def generate(name, seed=SEED, size=None):
+    """Generate one MANIFEST asset in memory and return a PIL RGBA image.
+
+    With the default seed the pixels match what a CLI run writes to disk.
+    size is an int (square) or (w, h). The asset is always drawn on its
+    default canvas (TILE/CHAR_SIZE) and then resampled to size with LANCZOS;
+    it is not redrawn at that size, so small sizes lose fine detail.
+    """
+    rel_path = resolve_name(name)
+    img = _render(rel_path, MANIFEST[rel_path], seed)
+    if size is not None:
+        size = (size, size) if isinstance(size, int) else tuple(size)
+        if size != img.size:
+            img = img.resize(size, Image.LANCZOS)
+    return img
+
+
+def generate_many(specs, seed=SEED, size=None):
+    """Yield (rel_path, image) for each spec in an iterable.
+
+    A spec is a name, or a dict with "name" and optional "seed"/"size" that
+    override the call-level defaults.
+    """
+    for spec in specs:
+        if isinstance(spec, str):
+            spec = {"name": spec}
+        rel_path = resolve_name(spec["name"])
+        yield rel_path, generate(rel_path, seed=spec.get("seed", seed), size=spec.get("size", size))
+
+
+def as_buffer(img):
+    """Raw RGBA8 pixels of img as a read-only memoryview (row-major, 4 bytes per pixel).
+
+    This is the single copy out of Pillow's internal storage (tobytes);
+    everything built on the returned buffer (as_array, bytes consumers)
+    shares it.
+    """
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return memoryview(img.tobytes())
+
+
+def as_array(img):
+    """img as a read-only (h, w, 4) uint8 NumPy array viewing as_buffer(img)'s memory.
+
+    np.array(...) it for a writable copy.
+    """
+    import numpy as np
+    return np.frombuffer(as_buffer(img), dtype=np.uint8).reshape(img.height, img.width, 4)
+
+
+# ─── Writing ───
+
+def pixel_digest(img):
+    """Hash of an image's size and RGBA pixels (not its PNG encoding)."""
+    rgba = img if img.mode == "RGBA" else img.convert("RGBA")
+    h = hashlib.blake2b(f"{rgba.width}x{rgba.height}".encode(), digest_size=16)
+    h.update(rgba.tobytes())
+    return h.digest()
+
+
+def save_if_changed(img, path):
+    """Save img as PNG unless path already holds the same pixels.
+
+    Returns "new", "changed" or "unchanged". Unchanged files keep their
+    mtime, so Godot does not reimport them.
+    """
+    path = Path(path)
+    if not path.exists():
+        status = "new"
+    else:
+        try:
+            with Image.open(path) as old:
+                same = old.size == img.size and pixel_digest(old) == pixel_digest(img)
+        except OSError:
+            same = False
+        if same:
+            return "unchanged"
+        status = "changed"
+    img.save(str(path), "PNG")
+    return status
+
+
+def summarize(statuses):
+    """"3 new, 1 changed, 25 unchanged" from an iterable of save statuses."""
+    statuses = list(statuses)
+    return ", ".join(f"{statuses.count(s)} {s}" for s in ("new", "changed", "unchanged"))
+
+
+def generate_targets(targets, out_root, results=None):
+    """Generate each rel_path -> gen_fn in targets into out_root.
+
+    Every asset is seeded from its own path, so an asset comes out the same
+    whether it is generated alone (--only, --watch, --shard, generate()) or
+    as part of a full run. Files whose pixels did not change are left alone.
+    Returns (ok, fail) counts; if results is a dict, each rel_path's status
+    ("new", "changed", "unchanged" or "failed") is recorded in it.
+    """
+    from godot_import import write_import_settings
+
+    ok, fail = 0, 0
+    for rel_path, gen_fn in targets.items():
+        out_path = out_root / rel_path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            img = _render(rel_path, gen_fn)
+            status = save_if_changed(img, out_path)
+            write_import_settings(out_path, rel_path)
+            print(f"  ✓ {rel_path} ({img.size[0]}×{img.size[1]}, {status})")
+            ok += 1
+        except Exception as e:
+            print(f"  ✗ {rel_path}: {e}")
+            status = "failed"
+            fail += 1
+        if results is not None:
+            results[rel_path] = status
+    return ok, fail
+
+
+# ─── Watch mode ───
+
+def _code_digest(code, h, strings):
+    """Feed a code object (and nested ones) into h; collect its string constants."""
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _code_digest(const, h, strings)
+            continue
+        if isinstance(const, str):
+            strings.add(const)
+        h.update(repr(const).encode())
+
+
+def _globals_used(code):
+    """Names a code object (and nested ones) may look up as globals."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            names |= _globals_used(const)
+    return names
+
+
+def _callables_in(value):
+    """Functions and partials a global refers to, looking inside containers."""
+    if callable(value) and not isinstance(value, type):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set, frozenset)):
+        return []
+    return [fn for item in value for fn in _callables_in(item)]
+
+
+def _stable_repr(value):
+    """repr() with callables replaced by their names (addresses change on reload)."""
+    if isinstance(value, functools.partial):
+        return f"partial({_stable_repr(value.func)}, {_stable_repr(value.args)}, {_stable_repr(value.keywords)})"
+    if callable(value) and not isinstance(value, type):
+        return f"<{getattr(value, '__qualname__', type(value).__name__)}>"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k!r}: {_stable_repr(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + "(" + ", ".join(_stable_repr(v) for v in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_repr(v) for v in value)) + "}"
+    return repr(value)
+
+
+def asset_fingerprints(module, targets=None):
+    """Fingerprint every entry of targets (default: MANIFEST) of a loaded generator module.
+
+    The fingerprint covers the entry's gen_* function, every module-level
+    helper it reaches (directly by name, through functools.partial, or held
+    in a module-level dict/list/tuple), their defaults, and the constants
+    they read. Dict constants such as PAL only contribute the keys the code
+    mentions, so editing one palette colour changes only the assets that use
+    it.
+    """
+    namespace = vars(module)
+    fingerprints = {}
+    for rel_path, gen_fn in (module.MANIFEST if targets is None else targets).items():
+        h = hashlib.sha1(f"{module.SEED}:{rel_path}".encode())
+        strings, constants = set(), set()
+        seen, stack = set(), [gen_fn]
+        while stack:
+            fn = stack.pop()
+            if isinstance(fn, functools.partial):
+                h.update(_stable_repr(fn).encode())
+                stack.extend([fn.func, *_callables_in(fn.args), *_callables_in(fn.keywords)])
+                continue
+            if getattr(fn, "__module__", None) != module.__name__ or not hasattr(fn, "__code__"):
+                continue
+            if fn.__qualname__ in seen:
+                continue
+            seen.add(fn.__qualname__)
+            h.update(fn.__qualname__.encode())
+            h.update(_stable_repr(fn.__defaults__).encode())
+            _code_digest(fn.__code__, h, strings)
+            for name in sorted(_globals_used(fn.__code__)):
+                value = namespace.get(name)
+                if callable(value) and not isinstance(value, type):
+                    stack.append(value)
+                elif isinstance(value, (dict, list, tuple, set, frozenset, int, float, str)):
+                    stack.extend(_callables_in(value))
+                    constants.add(name)
+        for name in sorted(constants):
+            value = namespace[name]
+            if isinstance(value, dict):
+                value = {k: v for k, v in value.items() if k in strings or callable(v)}
+            h.update(f"{name}={_stable_repr(value)}".encode())
+        fingerprints[rel_path] = h.hexdigest()
+    return fingerprints
+
+
+def _load_fresh(path):
+    """Import a fresh copy of the generator module from path."""
+    spec = importlib.util.spec_from_file_location("_procedural_watch", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def watch(out_root, only=None, interval=0.2, footprints=(), density=BUILDING_DENSITY):
+    """Regenerate the MANIFEST entries (and footprint textures) affected by each save of this file."""
+    path = Path(__file__).resolve()
+    module = sys.modules[__name__]
+
+    def watched(module):
+        targets = dict(module.MANIFEST)
+        if footprints:
+            targets.update(module.building_targets(footprints, density))
+        return targets
+
+    prints = asset_fingerprints(module, watched(module))
+    stamp = None
+    print(f"\nWatching {path.name} (Ctrl+C to stop)")
+    try:
+        while True:
+            st = path.stat()
+            if stamp is None:
+                stamp = (st.st_mtime_ns, st.st_size)
+            elif (st.st_mtime_ns, st.st_size) != stamp:
+                stamp = (st.st_mtime_ns, st.st_size)
+                start = time.perf_counter()
+                try:
+                    module = _load_fresh(path)
+                    targets = watched(module)
+                    new_prints = asset_fingerprints(module, targets)
+                except Exception as e:
+                    print(f"  ✗ reload failed: {e}")
+                    time.sleep(interval)
+                    continue
+                changed = [k for k, v in new_prints.items()
+                           if prints.get(k) != v and (not only or k in only)]
+                prints = new_prints
+                if changed:
+                    results = {}
+                    ok, fail = module.generate_targets({k: targets[k] for k in changed}, out_root, results)
+                    if footprints and any(k.startswith("buildings/") for k in changed):
+                        module.write_building_index(out_root, footprints, density)
+                    print(f"  → {ok} regenerated ({summarize(results.values())}), {fail} failed "
+                          f"in {time.perf_counter() - start:.2f}s")
+                else:
+                    print("  (no assets affected)")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Procedural sprite generator — no AI")
     parser.add_argument("--output", "-o", default=None, help="Output root (default: game/assets/ in repo)")
     parser.add_argument("--only", nargs="*", help="Generate only these (e.g. tiles/tree.png characters/player.png)")
+    parser.add_argument("--watch", action="store_true",
+                        help="After generating, regenerate affected assets whenever this file is saved")
+    parser.add_argument("--shard", type=shards.parse_shard, metavar="i/N",
+                        help="Generate only shard i of N and write a shard manifest (see shards.py)")
+    parser.add_argument("--buildings", action="store_true",
+                        help="Also generate footprint-exact building textures for the compiled map")
+    parser.add_argument("--density", type=int, default=BUILDING_DENSITY,
+                        help=f"Texels per map tile for --buildings (default: {BUILDING_DENSITY})")
     args = parser.parse_args()
+    if args.shard and args.watch:
+        parser.error("--watch cannot be combined with --shard")
 
     if args.output:
         out_root = Path(args.output)
+    elif args.shard:
+        out_root = shards.default_root(Path(__file__).parent, "procedural", args.shard)
     else:
         out_root = Path(__file__).parent.parent / "game" / "assets"
 
@@ -645,25 +1127,38 @@ def main():
     print(f"Output: {out_root}")
     print("=" * 60)
 
-    targets = MANIFEST
+    targets = dict(MANIFEST)
+    footprints = []
+    if args.buildings:
+        footprints = building_footprints()
+        targets.update(building_targets(footprints, args.density))
+        print(f"Buildings: {len(footprints)} distinct footprints at {args.density} texels/tile")
     if args.only:
-        targets = {k: v for k, v in MANIFEST.items() if k in args.only}
+        targets = {k: v for k, v in targets.items() if k in args.only}
+    total = len(targets)
+    listed = set(targets) if args.shard else None
+    targets = shards.select(targets, args.shard)
 
-    ok, fail = 0, 0
-    for rel_path, gen_fn in targets.items():
-        out_path = out_root / rel_path
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            img = gen_fn()
-            img.save(str(out_path), "PNG")
-            print(f"  ✓ {rel_path} ({img.size[0]}×{img.size[1]})")
-            ok += 1
-        except Exception as e:
-            print(f"  ✗ {rel_path}: {e}")
-            fail += 1
+    results = {}
+    ok, fail = generate_targets(targets, out_root, results)
+
+    if footprints:
+        changed = write_building_index(out_root, footprints, args.density, listed)
+        print(f"  ✓ {BUILDING_INDEX} ({'written' if changed else 'unchanged'})")
 
-    print(f"\nDone: {ok} generated, {fail} failed")
-    if fail:
+    print(f"\nDone: {ok} generated ({summarize(results.values())}), {fail} failed")
+    if args.shard:
+        failed = [k for k, status in results.items() if status == "failed"]
+        produced = [k for k in targets if k not in failed]
+        if footprints:
+            # Every shard writes the same index; merge sees identical copies
+            produced.append(BUILDING_INDEX)
+            total += 1
+        path = shards.write_manifest(out_root, "procedural", args.shard, total, produced, failed)
+        print(f"Shard {args.shard[0]}/{args.shard[1]} manifest: {path}")
+    if args.watch:
+        watch(out_root, only=args.only, footprints=footprints, density=args.density)
+    elif fail:
         sys.exit(1)
 
 
@@ -17,6 +17,8 @@ All assets target this consistent look:
 
 import os
 import sys
+import time
+import threading
 from pathlib import Path
 
 try:
@@ -39,6 +41,10 @@ try:
 except ImportError:
     OpenAI = None
 
+import shards
+from godot_import import write_import_settings
+from generate_procedural import generate as generate_procedural, save_if_changed, summarize
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -325,8 +331,52 @@ def _generate_with_dalle(client, prompt: str):
     return None
 
 
-def generate_sprite(client, sprite_name: str, prompt: str, aspect_ratio: str, output_path: Path, is_character: bool = False, provider: str = "google"):
-    """Generate a single sprite. Uses selected provider's engines."""
+def _save_sprite(image_bytes, prompt: str, provider: str, output_path: Path, timings=None):
+    """Local half of the pipeline: decode, key out the background, save.
+
+    Returns (image, status) where status is "new", "changed" or "unchanged"
+    (identical pixels are not rewritten; see save_if_changed). If timings is
+    a dict, the seconds spent in each stage are added to its "decode",
+    "transparency" and "save" entries.
+    """
+    clock = time.perf_counter()
+
+    def lap(stage):
+        nonlocal clock
+        now = time.perf_counter()
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + now - clock
+        clock = now
+
+    image = Image.open(io.BytesIO(image_bytes))
+    image.load()
+    lap("decode")
+
+    # Only process manual transparency for non-OpenAI providers
+    # (OpenAI uses native background="transparent" via gpt-image-1.5)
+    if provider != "openai":
+        image = _process_transparency(image, prompt)
+    lap("transparency")
+
+    # Ensure output directory exists
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Save image (skipped if the pixels are unchanged)
+    status = save_if_changed(image, output_path)
+    lap("save")
+    return image, status
+
+
+def generate_sprite(client, sprite_name: str, prompt: str, aspect_ratio: str, output_path: Path, is_character: bool = False, provider: str = "google", record_dir: Path = None):
+    """Generate a single sprite. Uses selected provider's engines.
+
+    Returns the save status ("new", "changed" or "unchanged") on success and
+    False on failure.
+
+    With record_dir set, the raw provider payload is also written to
+    record_dir/<provider>/<category>/<sprite_name> for offline replay
+    (see bench_sprites.py).
+    """
     print(f"Generating {sprite_name}...")
     print(f"  Prompt: {prompt[:80]}...")
     
@@ -338,42 +388,198 @@ def generate_sprite(client, sprite_name: str, prompt: str, aspect_ratio: str, ou
     print(f"  Engine: {engine_name}")
 
     try:
-        if provider == "openai":
-            image_bytes = _generate_with_dalle(client, prompt)
-        else:
-            if is_character:
-                image_bytes = _generate_with_gemini(client, prompt)
-            else:
-                image_bytes = _generate_with_imagen(client, prompt, aspect_ratio)
+        image_bytes = _fetch_image(client, prompt, aspect_ratio, is_character, provider)
 
         if image_bytes is None:
             print(f"  ✗ Failed - no image data returned")
             return False
 
-        image = Image.open(io.BytesIO(image_bytes))
-        
-        # Only process manual transparency for non-OpenAI providers 
-        # (OpenAI uses native background="transparent" via gpt-image-1.5)
-        if provider != "openai":
-            image = _process_transparency(image, prompt)
-
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save image
-        image.save(output_path, 'PNG')
-        print(f"  ✓ Saved {image.size[0]}x{image.size[1]} to {output_path}")
-        return True
+        return _store_image(image_bytes, sprite_name, prompt, output_path, provider, record_dir)
 
     except Exception as e:
         print(f"  ✗ Error: {e}")
         return False
 
 
+def _fetch_image(client, prompt: str, aspect_ratio: str, is_character: bool, provider: str):
+    """The provider call alone: raw image bytes, or None if nothing came back."""
+    if provider == "openai":
+        return _generate_with_dalle(client, prompt)
+    if is_character:
+        return _generate_with_gemini(client, prompt)
+    return _generate_with_imagen(client, prompt, aspect_ratio)
+
+
+def _store_image(image_bytes, sprite_name: str, prompt: str, output_path: Path, provider: str, record_dir: Path = None):
+    """Record (optionally), process and save a provider payload; returns the save status."""
+    if record_dir is not None:
+        record_path = Path(record_dir) / provider / output_path.parent.name / sprite_name
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        record_path.write_bytes(image_bytes)
+
+    image, status = _save_sprite(image_bytes, prompt, provider, output_path)
+    write_import_settings(output_path, f"{output_path.parent.name}/{sprite_name}")
+    print(f"  ✓ Saved {image.size[0]}x{image.size[1]} to {output_path} ({status})")
+    return status
+
+
+# =============================================================================
+# HYBRID MODE
+# =============================================================================
+# Every SPRITES entry also exists in generate_procedural.MANIFEST. In hybrid
+# mode each provider call runs on a daemon thread with a per-sprite deadline;
+# when it misses the deadline or fails, the procedural version is written at
+# once (over any existing asset, unless --keep-existing) so the asset tree
+# is never left with a hole or a stale file. A provider result that arrives
+# later (within the run budget) still replaces it. When the budget is spent,
+# remaining sprites go straight to procedural and calls still in flight are
+# abandoned.
+
+FALLBACK_SIZE = 1024    # provider output size; procedural art is resampled to match
+DEFAULT_DEADLINE = 90   # seconds per sprite
+DEFAULT_BUDGET = 1800   # seconds per run
+
+
+def _write_fallback(rel_path: str, output_path: Path, keep_existing: bool = False):
+    """Write the procedural version of rel_path (skipped if the pixels are unchanged).
+
+    With keep_existing, an asset already at output_path is left in place
+    instead and "kept" is returned; otherwise returns the save status.
+    """
+    if keep_existing and output_path.exists():
+        print(f"  → Keeping existing {output_path.name}")
+        return "kept"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    status = save_if_changed(generate_procedural(rel_path, size=FALLBACK_SIZE), output_path)
+    write_import_settings(output_path, rel_path)
+    print(f"  → Procedural fallback written to {output_path} ({status})")
+    return status
+
+
+def run_hybrid(client, jobs, out_root: Path, provider: str, deadline: float = DEFAULT_DEADLINE,
+               budget: float = DEFAULT_BUDGET, record_dir: Path = None, keep_existing: bool = False):
+    """Generate jobs ({rel_path: (category, filename, prompt, aspect_ratio)}) in hybrid mode.
+
+    Returns {rel_path: (source, status)} where source is "ai", "procedural"
+    or "failed" (neither a provider image nor a fallback could be written).
+
+    A result that lands after its sprite fell back is stored by the worker
+    thread that fetched it, so late results never eat into the deadline of
+    the sprite the main thread is waiting on. Each sprite has a lock that
+    orders its fallback write, late store and abandonment.
+    """
+    end = time.monotonic() + budget
+    outcomes, arrived = {}, {}
+    locks = {rel_path: threading.Lock() for rel_path in jobs}
+    ready = {rel_path: threading.Event() for rel_path in jobs}
+    waiting, abandoned = set(), set()
+    settled = threading.Condition()
+
+    def store(rel_path, image_bytes):
+        category, filename, prompt, _ = jobs[rel_path]
+        status = _store_image(image_bytes, filename, prompt, out_root / category / filename, provider, record_dir)
+        outcomes[rel_path] = ("ai", status)
+
+    def fallback(rel_path):
+        category, filename, _, _ = jobs[rel_path]
+        try:
+            outcomes[rel_path] = ("procedural", _write_fallback(rel_path, out_root / category / filename, keep_existing))
+        except Exception as e:
+            print(f"  ✗ Procedural fallback failed: {e}")
+            outcomes[rel_path] = ("failed", None)
+
+    def late(rel_path, image_bytes, error):
+        """A provider result for a sprite that already fell back (caller holds its lock)."""
+        if image_bytes is None:
+            print(f"  (late {rel_path}: {error or 'no image data'}; keeping fallback)")
+        else:
+            print(f"  Late result for {rel_path} — replacing fallback")
+            try:
+                store(rel_path, image_bytes)
+            except Exception as e:
+                print(f"  ✗ Error: {e}")
+        # Only now, so the run cannot finish while the store is in progress
+        waiting.discard(rel_path)
+
+    def call(rel_path, prompt, aspect_ratio, is_character):
+        try:
+            result = (_fetch_image(client, prompt, aspect_ratio, is_character, provider), None)
+        except Exception as e:
+            result = (None, e)
+        with locks[rel_path]:
+            if rel_path in abandoned:
+                return
+            if rel_path not in waiting:
+                arrived[rel_path] = result
+                ready[rel_path].set()
+                return
+            late(rel_path, *result)
+        with settled:
+            settled.notify_all()
+
+    for rel_path, (category, filename, prompt, aspect_ratio) in jobs.items():
+        print(f"Generating {rel_path}...")
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            print("  Run budget spent — skipping provider")
+            fallback(rel_path)
+            continue
+
+        threading.Thread(target=call, args=(rel_path, prompt, aspect_ratio, category == "characters"),
+                         name=f"sprite:{rel_path}", daemon=True).start()
+        started = time.monotonic()
+        ready[rel_path].wait(min(deadline, remaining))
+        with locks[rel_path]:
+            result = arrived.pop(rel_path, None)
+            if result is None:
+                # Written under the lock, so a late result always lands after it
+                print(f"  ✗ No result after {time.monotonic() - started:.1f}s")
+                waiting.add(rel_path)
+                fallback(rel_path)
+                continue
+
+        image_bytes, error = result
+        if image_bytes is None:
+            print(f"  ✗ {error or 'Failed - no image data returned'}")
+            fallback(rel_path)
+            continue
+        try:
+            store(rel_path, image_bytes)
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+            fallback(rel_path)
+
+    # Give calls that missed their deadline the rest of the budget to land
+    if waiting:
+        print(f"\nWaiting up to {max(0, end - time.monotonic()):.0f}s for {len(waiting)} late result(s)...")
+        with settled:
+            settled.wait_for(lambda: not waiting, timeout=max(0, end - time.monotonic()))
+    for rel_path in sorted(waiting):
+        with locks[rel_path]:
+            if rel_path in waiting:
+                waiting.discard(rel_path)
+                abandoned.add(rel_path)
+                print(f"  Abandoned {rel_path} — keeping fallback")
+    return outcomes
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate sprites for Startup Simulator")
     parser.add_argument("--provider", choices=["google", "openai"], default="google", 
                         help="Image generation provider (default: google)")
+    parser.add_argument("--record", metavar="DIR", default=None,
+                        help="Also save raw provider payloads under DIR for bench_sprites.py replay")
+    parser.add_argument("--output", "-o", default=None, help="Output root (default: game/assets/ in repo)")
+    parser.add_argument("--shard", type=shards.parse_shard, metavar="i/N",
+                        help="Generate only shard i of N and write a shard manifest (see shards.py)")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Fall back to procedural art for sprites that miss --deadline or fail")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE,
+                        help=f"Hybrid: seconds to wait per sprite (default: {DEFAULT_DEADLINE})")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help=f"Hybrid: seconds for the whole run (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--keep-existing", action="store_true",
+                        help="With --hybrid, leave an existing asset in place instead of writing the fallback")
     args = parser.parse_args()
 
     if args.provider == "google":
@@ -407,64 +613,124 @@ def main():
     print("=" * 70)
     print()
 
-    # Determine output path (game repo's assets folder)
+    # Determine output root (the game's assets folder unless overridden)
     tools_root = Path(__file__).parent
-    game_root = tools_root.parent / "startup-game"
+    if args.output:
+        out_root = Path(args.output)
+    elif args.shard:
+        out_root = shards.default_root(tools_root, "sprites", args.shard)
+    else:
+        out_root = tools_root.parent / "game" / "assets"
+
+    jobs = {f"{category}/{filename}": (category, filename, config)
+            for category, sprites in SPRITES.items() for filename, config in sprites.items()}
+    selected = shards.select(jobs, args.shard)
+    if args.shard:
+        print(f"Shard {args.shard[0]}/{args.shard[1]}: {len(selected)} of {len(jobs)} sprites")
 
-    if not game_root.exists():
-        print(f"WARNING: Game directory not found at {game_root}")
-        print("Saving to local output/ directory instead")
-        game_root = tools_root / "output"
+    if args.hybrid:
+        run_hybrid_main(client, selected, out_root, args, len(jobs))
+        return
 
-    total = sum(len(sprites) for sprites in SPRITES.values())
+    total = len(selected)
     generated = 0
     failed = 0
+    failed_paths = []
+    statuses = []
 
     # Generate all sprites
-    for category, sprites in SPRITES.items():
-        print(f"\n--- Generating {category} ---")
-        print("-" * 70)
-
-        is_character = (category == "characters")
-
-        for filename, config in sprites.items():
-            output_path = game_root / "assets" / category / filename
-
-            # Adjust prompt based on provider
-            prompt = config["prompt"]
-            if args.provider == "openai":
-                # Use native transparency instead of magenta keying
-                prompt = prompt.replace(BG_MAGENTA, BG_TRANSPARENT)
-
-            success = generate_sprite(
-                client=client,
-                sprite_name=filename,
-                prompt=prompt,
-                aspect_ratio=config["aspect_ratio"],
-                output_path=output_path,
-                is_character=is_character,
-                provider=args.provider
-            )
-
-            if success:
-                generated += 1
-            else:
-                failed += 1
-
-            print()
+    current = None
+    for rel_path, (category, filename, config) in selected.items():
+        if category != current:
+            current = category
+            print(f"\n--- Generating {category} ---")
+            print("-" * 70)
+
+        output_path = out_root / category / filename
+
+        # Adjust prompt based on provider
+        prompt = _provider_prompt(config, args.provider)
+
+        success = generate_sprite(
+            client=client,
+            sprite_name=filename,
+            prompt=prompt,
+            aspect_ratio=config["aspect_ratio"],
+            output_path=output_path,
+            is_character=(category == "characters"),
+            provider=args.provider,
+            record_dir=args.record
+        )
+
+        if success:
+            generated += 1
+            statuses.append(success)
+        else:
+            failed += 1
+            failed_paths.append(rel_path)
+
+        print()
 
     # Summary
     print("=" * 70)
     print(f"Generation complete!")
-    print(f"  ✓ Generated: {generated}/{total}")
+    print(f"  ✓ Generated: {generated}/{total} ({summarize(statuses)})")
     if failed > 0:
         print(f"  ✗ Failed: {failed}/{total}")
-    print(f"\nAssets saved to: {game_root / 'assets'}")
+    print(f"\nAssets saved to: {out_root}")
+    if args.shard:
+        produced = [k for k in selected if k not in failed_paths]
+        path = shards.write_manifest(out_root, "sprites", args.shard, len(jobs), produced, failed_paths)
+        print(f"Shard manifest: {path}")
     print("=" * 70)
 
     if failed > 0:
         sys.exit(1)
 
 
+def _provider_prompt(config, provider):
+    """A SPRITES prompt adjusted for the provider."""
+    if provider == "openai":
+        # Use native transparency instead of magenta keying
+        return config["prompt"].replace(BG_MAGENTA, BG_TRANSPARENT)
+    return config["prompt"]
+
+
+def run_hybrid_main(client, selected, out_root: Path, args, manifest_size: int):
+    """main() for --hybrid: run, summarise, write the shard manifest, exit 1 on holes."""
+    print(f"Hybrid mode: {args.deadline:g}s per sprite, {args.budget:g}s run budget\n")
+    jobs = {rel_path: (category, filename, _provider_prompt(config, args.provider), config["aspect_ratio"])
+            for rel_path, (category, filename, config) in selected.items()}
+    start = time.monotonic()
+    outcomes = run_hybrid(client, jobs, out_root, args.provider, args.deadline, args.budget, args.record,
+                          args.keep_existing)
+
+    by_source = {}
+    for source, status in outcomes.values():
+        by_source.setdefault(source, []).append(status)
+    failed_paths = [k for k, (source, _) in outcomes.items() if source == "failed"]
+
+    print("=" * 70)
+    print(f"Hybrid generation complete in {time.monotonic() - start:.0f}s")
+    print(f"  ✓ Provider: {len(by_source.get('ai', []))}/{len(jobs)} ({summarize(by_source.get('ai', []))})")
+    fallbacks = [status for status in by_source.get("procedural", []) if status != "kept"]
+    if fallbacks:
+        print(f"  → Procedural: {len(fallbacks)}/{len(jobs)} ({summarize(fallbacks)})")
+    kept = by_source.get("procedural", []).count("kept")
+    if kept:
+        print(f"  → Kept existing (--keep-existing): {kept}/{len(jobs)}")
+    if failed_paths:
+        print(f"  ✗ Failed: {len(failed_paths)}/{len(jobs)}")
+    print(f"\nAssets saved to: {out_root}")
+    if args.shard:
+        produced = [k for k in selected if k not in failed_paths]
+        path = shards.write_manifest(out_root, "sprites", args.shard, manifest_size, produced, failed_paths)
+        print(f"Shard manifest: {path}")
+    print("=" * 70)
+
+    if failed_paths:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Godot Import Settings for Startup Simulator
+Writes a .import sidecar next to each generated PNG so Godot imports it with
+settings that suit its category instead of one default for everything.
+
+Category (from generate_procedural.asset_category) → texture import:
+- ground:     VRAM compressed, mipmaps (large opaque tiles seen at every zoom)
+- building:   VRAM compressed with alpha
+- prop:       VRAM compressed with alpha
+- character:  VRAM compressed with alpha
+- ui:         lossless, no mipmaps (pixel-exact)
+- sdf:        lossless with mipmaps (distance data must not be block-compressed)
+
+Only [params] is ours. If a sidecar already exists, its [remap] and [deps]
+sections (uid, imported paths) are kept as Godot wrote them; for new files
+Godot fills them in on the next import.
+
+The generators call write_import_settings() after every save; run this file
+to (re)write sidecars for an existing tree:
+  python godot_import.py                 # every PNG under game/assets
+  python godot_import.py --dry-run
+"""
+
+from pathlib import Path
+
+from generate_procedural import asset_category
+
+COMPRESS_LOSSLESS = 0
+COMPRESS_VRAM = 2
+
+# Godot 4 texture importer defaults; categories override a few keys below
+DEFAULT_PARAMS = {
+    "compress/mode": COMPRESS_LOSSLESS,
+    "compress/high_quality": "false",
+    "compress/lossy_quality": 0.7,
+    "compress/hdr_compression": 1,
+    "compress/normal_map": 0,
+    "compress/channel_pack": 0,
+    "mipmaps/generate": "false",
+    "mipmaps/limit": -1,
+    "roughness/mode": 0,
+    "roughness/src_normal": '""',
+    "process/fix_alpha_border": "true",
+    "process/premult_alpha": "false",
+    "process/normal_map_invert_y": "false",
+    "process/hdr_as_srgb": "false",
+    "process/hdr_clamp_exposure": "false",
+    "process/size_limit": 0,
+    "detect_3d/compress_to": 1,
+}
+
+CATEGORY_PARAMS = {
+    "ground":    {"compress/mode": COMPRESS_VRAM, "mipmaps/generate": "true",
+                  "process/fix_alpha_border": "false"},
+    "building":  {"compress/mode": COMPRESS_VRAM},
+    "prop":      {"compress/mode": COMPRESS_VRAM},
+    "character": {"compress/mode": COMPRESS_VRAM},
+    "ui":        {"compress/mode": COMPRESS_LOSSLESS},
+    "sdf":       {"compress/mode": COMPRESS_LOSSLESS, "mipmaps/generate": "true",
+                  "process/fix_alpha_border": "false"},
+}
+
+
+def import_params(rel_path):
+    """[params] for an asset path relative to the assets root."""
+    return {**DEFAULT_PARAMS, **CATEGORY_PARAMS[asset_category(rel_path)]}
+
+
+def res_path(path):
+    """res:// path of a file inside a Godot project, or None outside one."""
+    path = Path(path).resolve()
+    for parent in path.parents:
+        if (parent / "project.godot").exists():
+            return "res://" + path.relative_to(parent).as_posix()
+    return None
+
+
+def _sections(text):
+    """Split an existing .import file into {section: body lines}."""
+    sections, current = {}, None
+    for line in text.splitlines():
+        if line.startswith("[") and line.rstrip().endswith("]"):
+            current = line.strip()[1:-1]
+            sections[current] = []
+        elif current is not None:
+            sections[current].append(line)
+    return {name: "\n".join(body).strip() for name, body in sections.items()}
+
+
+def read_params(import_path):
+    """[params] of an existing .import file as {key: raw value string}."""
+    body = _sections(Path(import_path).read_text()).get("params", "")
+    return dict(line.split("=", 1) for line in body.splitlines() if "=" in line)
+
+
+def render_import(png_path, rel_path, existing=None):
+    """Text of the .import sidecar for png_path."""
+    sections = _sections(existing) if existing else {}
+    if "remap" not in sections:
+        sections["remap"] = 'importer="texture"\ntype="CompressedTexture2D"'
+    if "deps" not in sections:
+        source = res_path(png_path)
+        sections["deps"] = f'source_file="{source}"' if source else ""
+    sections["params"] = "\n".join(f"{k}={v}" for k, v in import_params(rel_path).items())
+    return "\n\n".join(f"[{name}]\n\n{body}" if body else f"[{name}]"
+                       for name, body in sections.items() if name in ("remap", "deps", "params")) + "\n"
+
+
+def write_import_settings(png_path, rel_path):
+    """Write or update <png>.import; returns True if the file changed."""
+    import_path = Path(f"{png_path}.import")
+    existing = import_path.read_text() if import_path.exists() else None
+    text = render_import(png_path, rel_path, existing)
+    if text == existing:
+        return False
+    import_path.write_text(text)
+    return True
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Write Godot .import sidecars per asset category")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would change without writing")
+    args = parser.parse_args()
+
+    root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+
+    print("=" * 60)
+    print("Godot Import Settings — Startup Simulator")
+    print(f"Assets: {root}")
+    print("=" * 60)
+
+    changed = 0
+    for png in sorted(root.rglob("*.png")):
+        rel_path = png.relative_to(root).as_posix()
+        category = asset_category(rel_path)
+        if args.dry_run:
+            import_path = Path(f"{png}.import")
+            existing = import_path.read_text() if import_path.exists() else None
+            dirty = render_import(png, rel_path, existing) != existing
+        else:
+            dirty = write_import_settings(png, rel_path)
+        if dirty:
+            changed += 1
+            print(f"  ✓ {rel_path} ({category})")
+
+    verb = "would change" if args.dry_run else "written"
+    print(f"\nDone: {changed} sidecars {verb}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Large Ground Texture Synthesis for Startup Simulator
+Generates non-repeating ground for an arbitrary region, at any size.
+
+Noise is a pure function of global pixel coordinates (hashed value-noise
+lattice), so the texture is continuous across band and block boundaries and
+two adjacent regions rendered separately line up exactly. Output is produced
+band by band and block by block; only one band is ever mapped and only one
+block is ever held as float arrays, so peak RSS stays bounded no matter how
+large the output is.
+
+Output formats:
+- raw:   <name>.rgba (row-major RGBA8, written through a per-band memmap)
+         plus <name>.json with width/height
+- tiles: <name>/<tx>_<ty>.png, one PNG per --tile square
+
+Usage:
+  python ground_synth.py --material grass                # full 60×50 map, raw
+  python ground_synth.py --material dirt --format tiles --tile 320
+  python ground_synth.py --material grass --origin 19200 0 --size 3200 3200
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+try:
+    import resource    # POSIX only
+except ImportError:
+    resource = None
+
+from generate_procedural import PAL, TILE
+
+MAP_TILES = (60, 50)   # MapGenerator map size, in tiles
+
+# base, light, dark, grain variance (matches noise_fill in the tile generators)
+MATERIALS = {
+    "grass":   (PAL["grass"], PAL["grass_light"], PAL["grass_dark"], 12),
+    "park":    (PAL["park_green"], PAL["park_light"], PAL["grass_dark"], 12),
+    "dirt":    (PAL["dirt"], PAL["sand"], PAL["dirt_dark"], 15),
+    "sand":    (PAL["sand"], PAL["cream"], PAL["dirt"], 10),
+    "asphalt": (PAL["asphalt"], PAL["concrete_dk"], PAL["asphalt_dark"], 8),
+}
+
+# (cell size in px, weight) — low-frequency mottling that never visibly repeats
+OCTAVES = [(512, 0.5), (192, 0.3), (64, 0.15), (16, 0.05)]
+GRAIN = 2      # px, the same 2×2 speckle noise_fill draws
+BLOCK = 512    # px, compute granularity inside a band
+
+
+# ─── Coordinate-hashed noise ───
+
+def _hash(ix, iy, salt):
+    """Uniform [0, 1) float per integer lattice point (vectorised integer hash)."""
+    h = ((ix.astype(np.int64) & 0xFFFFFFFF).astype(np.uint32) * np.uint32(0x27D4EB2D)) ^ \
+        ((iy.astype(np.int64) & 0xFFFFFFFF).astype(np.uint32) * np.uint32(0x165667B1)) ^ \
+        np.uint32(salt & 0xFFFFFFFF)
+    h ^= h >> np.uint32(15)
+    h *= np.uint32(0x2C1B3C6D)
+    h ^= h >> np.uint32(12)
+    h *= np.uint32(0x297A2D39)
+    h ^= h >> np.uint32(15)
+    return h.astype(np.float32) * np.float32(1.0 / 2**32)
+
+
+def _value_noise(xs, ys, cell, salt):
+    """Smooth value noise in [-1, 1] over the grid xs × ys (global pixel coords)."""
+    fx, fy = xs / cell, ys / cell
+    ix, iy = np.floor(fx).astype(np.int64), np.floor(fy).astype(np.int64)
+    tx, ty = fx - ix, fy - iy
+    tx = (tx * tx * (3 - 2 * tx)).astype(np.float32)[None, :]
+    ty = (ty * ty * (3 - 2 * ty)).astype(np.float32)[:, None]
+    X, Y = ix[None, :], iy[:, None]
+    top = _hash(X, Y, salt) * (1 - tx) + _hash(X + 1, Y, salt) * tx
+    bot = _hash(X, Y + 1, salt) * (1 - tx) + _hash(X + 1, Y + 1, salt) * tx
+    return (top * (1 - ty) + bot * ty) * 2 - 1
+
+
+def synth_block(x0, y0, w, h, material, seed=42):
+    """RGBA8 array (h, w, 4) of ground at global pixel origin (x0, y0)."""
+    base, light, dark, variance = (np.array(c, dtype=np.float32) if i < 3 else c
+                                   for i, c in enumerate(MATERIALS[material]))
+    xs = np.arange(x0, x0 + w, dtype=np.float64)
+    ys = np.arange(y0, y0 + h, dtype=np.float64)
+
+    low = sum(weight * _value_noise(xs, ys, cell, seed * 7919 + i)
+              for i, (cell, weight) in enumerate(OCTAVES))
+    grain = _hash(np.floor(xs / GRAIN)[None, :], np.floor(ys / GRAIN)[:, None], seed) * 2 - 1
+
+    up, down = np.clip(low, 0, None)[..., None], np.clip(-low, 0, None)[..., None]
+    rgb = base + up * (light - base) + down * (dark - base) + (grain * variance)[..., None]
+
+    out = np.empty((h, w, 4), dtype=np.uint8)
+    out[..., :3] = np.clip(rgb, 0, 255).astype(np.uint8)
+    out[..., 3] = 255
+    return out
+
+
+def synth_band(x0, y0, width, band_h, material, seed=42, block=BLOCK):
+    """Yield (dx, block array) across one band, left to right."""
+    for dx in range(0, width, block):
+        yield dx, synth_block(x0 + dx, y0, min(block, width - dx), band_h, material, seed)
+
+
+# ─── Writers ───
+
+def write_raw(path, origin, size, material, seed=42, band=256, block=BLOCK):
+    """Stream the region into <path>.rgba via one memmap per band."""
+    width, height = size
+    raw = path.with_suffix(".rgba")
+    raw.parent.mkdir(parents=True, exist_ok=True)
+    with open(raw, "wb") as f:
+        f.truncate(width * height * 4)
+    for y in range(0, height, band):
+        band_h = min(band, height - y)
+        mm = np.memmap(raw, dtype=np.uint8, mode="r+", offset=y * width * 4, shape=(band_h, width, 4))
+        for dx, pixels in synth_band(origin[0], origin[1] + y, width, band_h, material, seed, block):
+            mm[:, dx:dx + pixels.shape[1]] = pixels
+        mm.flush()
+        del mm
+        print(f"  … rows {y + band_h}/{height}", end="\r")
+    path.with_suffix(".json").write_text(json.dumps(
+        {"width": width, "height": height, "format": "RGBA8", "material": material,
+         "origin": list(origin), "seed": seed}, indent=2))
+    print()
+    return raw
+
+
+def write_tiles(path, origin, size, material, seed=42, tile=TILE):
+    """Stream the region into <path>/<tx>_<ty>.png, one band per tile row."""
+    width, height = size
+    path.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for ty, y in enumerate(range(0, height, tile)):
+        band_h = min(tile, height - y)
+        for dx, pixels in synth_band(origin[0], origin[1] + y, width, band_h, material, seed, block=tile):
+            Image.fromarray(pixels, "RGBA").save(path / f"{dx // tile}_{ty}.png", "PNG")
+            count += 1
+        print(f"  … tile rows {ty + 1}/{-(-height // tile)}", end="\r")
+    print()
+    return count
+
+
+def peak_rss_mib():
+    """Peak resident set size of this process in MiB, or None where unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux and the BSDs report KiB, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Streaming synthesis of large non-repeating ground textures")
+    parser.add_argument("--material", "-m", choices=list(MATERIALS), default="grass")
+    parser.add_argument("--size", nargs=2, type=int, metavar=("W", "H"),
+                        default=[MAP_TILES[0] * TILE, MAP_TILES[1] * TILE],
+                        help="Region size in px (default: full 60×50-tile map at native resolution)")
+    parser.add_argument("--origin", nargs=2, type=int, metavar=("X", "Y"), default=[0, 0],
+                        help="Global px origin of the region; adjacent regions tile seamlessly")
+    parser.add_argument("--format", choices=["raw", "tiles"], default="raw")
+    parser.add_argument("--tile", type=int, default=TILE, help="Tile size for --format tiles (default: 320)")
+    parser.add_argument("--band", type=int, default=256, help="Rows per band for --format raw (default: 256)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", "-o", default=None,
+                        help="Output path without extension (default: tools/output/ground_<material>)")
+    args = parser.parse_args()
+
+    out = Path(args.output) if args.output else Path(__file__).parent / "output" / f"ground_{args.material}"
+    size, origin = tuple(args.size), tuple(args.origin)
+
+    print("=" * 60)
+    print("Ground Synthesis — Startup Simulator")
+    print(f"Material: {args.material}  Region: {size[0]}×{size[1]} px at {origin}")
+    print(f"Output: {out} ({args.format})")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    if args.format == "raw":
+        raw = write_raw(out, origin, size, args.material, args.seed, band=args.band)
+        print(f"  ✓ {raw} ({raw.stat().st_size / 2**20:.0f} MiB)")
+    else:
+        count = write_tiles(out, origin, size, args.material, args.seed, tile=args.tile)
+        print(f"  ✓ {count} tiles in {out}")
+
+    peak_mib = peak_rss_mib()
+    peak = f"{peak_mib:.0f} MiB" if peak_mib is not None else "n/a"
+    print(f"\nDone in {time.perf_counter() - start:.1f}s, peak RSS {peak}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Lighting Pass for Startup Simulator
+Array-based post-process: height from alpha and surface detail, soft
+directional sun, ambient occlusion and a warm grade, over a whole batch of
+assets at once.
+
+Shipped sprites stay shadowless (docs/art-direction.md §3) and get their
+light from Light2D in game, so this pass writes *variants* outside the Godot
+project: tools/output/variants/lit/<asset>, next to recolor.py's themes. It
+is for lit previews, marketing shots and for trying the look before it is
+moved into Godot. With --normals it also writes <asset>_n.png tangent-space
+normal maps from the same height field, which CanvasTexture can use for
+Light2D.
+
+Height is the blurred alpha (shapes bulge away from their silhouette) with
+luminance detail on top, so dark mortar lines, leaf gaps and seams read as
+creases — fully opaque tiles get relief too. Occlusion darkens the inside
+of the silhouette near its edge and those creases.
+
+All parameters live in LIGHTING below, which is the lighting design intent
+(sun angle, ambient, grade) kept as data, per art-direction §9.4.
+
+Images of the same size are stacked into one (N, H, W) float array and
+every step is a whole-array NumPy operation, so the cost per pixel is fixed
+whatever the assets contain.
+
+Usage:
+  python lighting.py                        # every asset in MANIFEST
+  python lighting.py tiles/tree.png tiles/bench.png --normals
+"""
+
+import sys
+import math
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+from generate_procedural import MANIFEST
+
+LIGHTING = {
+    # Sun: azimuth is the direction *towards* the sun in image space
+    # (0° = right, 90° = down), elevation above the ground plane.
+    "sun_azimuth": 225.0,          # from the upper left
+    "sun_elevation": 50.0,
+    "sun_color": (255, 248, 236),  # warm late-morning sunlight
+    "sun_strength": 0.5,           # max brightening/darkening of slopes vs. flat ground
+    # Height field from alpha and luminance
+    "height_radius": 20,           # px at 320px; scaled with image size
+    "height_scale": 10.0,
+    "height_detail": 0.35,         # share of height from luminance (0 = alpha only)
+    "detail_radius": 2,            # px at 320px; smooths pixel noise out of the detail
+    # Ambient occlusion inside silhouette edges and in height creases
+    "ao_radius": 10,               # px at 320px; scaled with image size
+    "ao_strength": 0.45,
+    # Warm grade
+    "grade_mul": (1.03, 1.0, 0.97),
+    "grade_lift": (0.01, 0.005, 0.0),
+    "saturation": 1.04,
+}
+
+REFERENCE_SIZE = 320   # radii in LIGHTING are given for a 320px tile
+BATCH = 8              # images per stack; bounds peak memory for 1024px assets
+
+
+# ─── Array helpers (all operate on (N, H, W) stacks) ───
+
+def _box_blur(a, radius, axis):
+    """Mean over a 2*radius+1 window along axis, edge-clamped."""
+    if radius < 1:
+        return a
+    pad = [(0, 0)] * a.ndim
+    pad[axis] = (radius + 1, radius)
+    c = np.cumsum(np.pad(a, pad, mode="edge"), axis=axis, dtype=np.float32)
+    hi, lo = [slice(None)] * a.ndim, [slice(None)] * a.ndim
+    hi[axis], lo[axis] = slice(2 * radius + 1, None), slice(0, a.shape[axis])
+    return (c[tuple(hi)] - c[tuple(lo)]) * np.float32(1.0 / (2 * radius + 1))
+
+
+def _blur(a, radius):
+    """Two separable box passes ≈ a Gaussian of the same radius."""
+    r = max(1, radius // 2)
+    for _ in range(2):
+        a = _box_blur(_box_blur(a, r, 1), r, 2)
+    return a
+
+
+def _scaled(px, size):
+    return max(1, round(px * size / REFERENCE_SIZE))
+
+
+def height_field(alpha, luma, params=LIGHTING):
+    """Soft height in [0, 1]: high inside shapes, falling off at edges, lower in dark detail."""
+    size = max(alpha.shape[1:])
+    shape = _blur(alpha, _scaled(params["height_radius"], size))
+    detail = _blur(luma, _scaled(params["detail_radius"], size))
+    # Stretch each image's detail to [0, 1] over its opaque pixels, so relief
+    # does not depend on how much contrast the palette happens to have
+    opaque = alpha > 0.5
+    for i in range(len(detail)):
+        if opaque[i].any():
+            lo, hi = np.percentile(detail[i][opaque[i]], (2, 98))
+            detail[i] = np.clip((detail[i] - lo) / max(hi - lo, 1e-3), 0.0, 1.0)
+    w = np.float32(params["height_detail"])
+    return shape * ((1 - w) + w * detail)
+
+
+def occlusion(alpha, height, params=LIGHTING):
+    """Ambient occlusion in [0, 1] on the opaque pixels of an (N, H, W) stack.
+
+    Two terms, both zero outside the shape: the share of transparent pixels
+    around each pixel (darkens the inside of the silhouette edge) and how far
+    the pixel sits below its blurred neighbourhood (darkens creases).
+    """
+    r = _scaled(params["ao_radius"], max(alpha.shape[1:]))
+    edge = _blur(1.0 - alpha, r)
+    crease = np.clip(_blur(height, r) - height, 0.0, None) * 4.0
+    return np.clip(edge + crease, 0.0, 1.0) * alpha
+
+
+def normals(height, params=LIGHTING):
+    """Unit surface normals (N, H, W, 3) of a height stack, +y down."""
+    dy, dx = np.gradient(height * params["height_scale"], axis=(1, 2))
+    n = np.stack([-dx, -dy, np.ones_like(height)], axis=-1)
+    return n / np.linalg.norm(n, axis=-1, keepdims=True)
+
+
+def sun_vector(params=LIGHTING):
+    az, el = math.radians(params["sun_azimuth"]), math.radians(params["sun_elevation"])
+    return np.array([math.cos(el) * math.cos(az), math.cos(el) * math.sin(az), math.sin(el)],
+                    dtype=np.float32)
+
+
+# ─── Pass ───
+
+def light_stack(rgba, params=LIGHTING, with_normals=False):
+    """Light an (N, H, W, 4) uint8 stack; returns a new uint8 stack, alpha untouched.
+
+    With with_normals, returns (lit, normal maps); the normal maps are
+    tangent-space RGB = xyz·0.5+0.5 with y up, as Godot expects.
+    """
+    rgb = rgba[..., :3].astype(np.float32) * np.float32(1 / 255)
+    alpha = rgba[..., 3].astype(np.float32) * np.float32(1 / 255)
+
+    luma = rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    height = height_field(alpha, luma, params)
+    n = normals(height, params)
+    sun = sun_vector(params)
+    # Relative to flat ground: 1.0 where the surface faces straight up
+    facing = n @ (sun / sun[2])
+    shade = 1.0 + params["sun_strength"] * np.clip(facing - 1.0, -1.0, 1.0)
+
+    shade *= 1.0 - params["ao_strength"] * occlusion(alpha, height, params)
+
+    # Sun colour and warm grade folded into one per-channel gain, then saturation around luma
+    gain = np.array(params["sun_color"], dtype=np.float32) / 255.0 * np.array(params["grade_mul"], dtype=np.float32)
+    lit = rgb * shade[..., None] * gain + np.array(params["grade_lift"], dtype=np.float32)
+    luma = (lit @ np.array([0.299, 0.587, 0.114], dtype=np.float32))[..., None]
+    lit = luma + (lit - luma) * np.float32(params["saturation"])
+
+    out = _to_rgba8(lit, rgba)
+    if not with_normals:
+        return out
+    n[..., 1] *= -1
+    return out, _to_rgba8(n * 0.5 + 0.5, rgba)
+
+
+def _to_rgba8(rgb, source):
+    """Quantise float RGB in [0, 1] and reattach source's alpha."""
+    out = np.empty_like(source)
+    out[..., :3] = np.clip(rgb * 255.0 + 0.5, 0, 255).astype(np.uint8)
+    out[..., 3] = source[..., 3]
+    return out
+
+
+def light_batch(images, params=LIGHTING, with_normals=False, batch=BATCH):
+    """Light a list of PIL images, stacking up to `batch` of equal size at a time.
+
+    Returns a list of lit images in input order, or (lit, normals) lists if
+    with_normals is set.
+    """
+    groups = {}
+    for i, img in enumerate(images):
+        groups.setdefault(img.size, []).append(i)
+    lit, nmaps = [None] * len(images), [None] * len(images)
+    chunks = [same[i:i + batch] for same in groups.values() for i in range(0, len(same), batch)]
+    for indices in chunks:
+        stack = np.stack([np.asarray(images[i].convert("RGBA")) for i in indices])
+        result = light_stack(stack, params, with_normals)
+        for i, arr in zip(indices, result[0] if with_normals else result):
+            lit[i] = Image.fromarray(arr)
+        if with_normals:
+            for i, arr in zip(indices, result[1]):
+                nmaps[i] = Image.fromarray(arr)
+    return (lit, nmaps) if with_normals else lit
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Batched lighting / AO / grade pass over assets")
+    parser.add_argument("assets", nargs="*", help="Asset paths relative to --input (default: every asset in MANIFEST)")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--output", "-o", default=None, help="Output root (default: tools/output/variants/lit)")
+    parser.add_argument("--normals", action="store_true", help="Also write <asset>_n.png normal maps")
+    args = parser.parse_args()
+
+    in_root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+    out_root = Path(args.output) if args.output else Path(__file__).parent / "output" / "variants" / "lit"
+    assets = args.assets or list(MANIFEST)
+
+    print("=" * 60)
+    print("Lighting Pass — Startup Simulator")
+    print(f"Sun: {LIGHTING['sun_azimuth']}° az, {LIGHTING['sun_elevation']}° el  Output: {out_root}")
+    print("=" * 60)
+
+    images, names = [], []
+    for rel_path in assets:
+        try:
+            with Image.open(in_root / rel_path) as img:
+                images.append(img.convert("RGBA"))
+            names.append(rel_path)
+        except Exception as e:
+            print(f"  ✗ {rel_path}: {e}")
+
+    result = light_batch(images, with_normals=args.normals)
+    lit, nmaps = result if args.normals else (result, [None] * len(result))
+    for rel_path, img, nmap in zip(names, lit, nmaps):
+        out_path = out_root / rel_path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        img.save(out_path, "PNG")
+        if nmap is not None:
+            nmap.save(out_path.with_name(out_path.stem + "_n.png"), "PNG")
+        print(f"  ✓ {rel_path}")
+
+    failed = len(assets) - len(names)
+    print(f"\nDone: {len(names)} lit, {failed} failed")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
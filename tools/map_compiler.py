@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Offline Map Compiler for Startup Simulator
+Runs MapGenerator's layout offline and writes a binary map the game loads
+directly, so scene startup skips generation.
+
+The layout is the same as game/scripts/map_generator.gd, step for step. Grid
+work (roads, borders, park fill, block spans) is done with NumPy slicing; the
+random placement steps run in the original order against GodotRNG, a port of
+Godot's RandomNumberGenerator (PCG32, randf, randi_range). Given the same seed
+they therefore draw the same numbers as the GDScript version and produce the
+same map.
+
+Neighbourhoods are data: LAYOUTS maps a name to its road grid, parks and
+schools, plus the scene script whose spawn points it compiles. Add an
+entry, or pass --seed, to build variants.
+
+Spawn points have one source, the scene script (world.gd's PLAYER_SPAWN and
+npc_data positions). Each compiled spawn stores the position it was snapped
+from; world.gd only uses it while that still matches its own data, and
+otherwise warns and snaps at runtime.
+
+Binary format (little-endian, version 2):
+  header     "SSMP" u16 version, u16 width, u16 height, u32 seed,
+             u16 buildings, u16 props, u16 spawns, u16 reserved   (22 bytes)
+  tiles      width × height u8 TileType, row-major
+  buildings  per building: u16 x, u16 y, u8 w, u8 h, u8 wall_type, u8 0
+  props      per prop tile: u16 x, u16 y, u8 TileType, u8 0
+  spawns     per spawn: 16-byte NUL-padded ASCII id, u16 x, u16 y (snapped),
+             u16 x, u16 y (as written in the scene script)
+
+Usage:
+  python map_compiler.py                         # indiranagar → game/resources/maps/
+  python map_compiler.py --seed 7 -o variant.ssmap --preview
+"""
+
+import re
+import sys
+import struct
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install numpy")
+    sys.exit(1)
+
+FORMAT_VERSION = 2
+MAGIC = b"SSMP"
+HEADER = struct.Struct("<4sHHHIHHHH")
+BUILDING = struct.Struct("<HHBBBB")
+PROP = struct.Struct("<HHBB")
+SPAWN = struct.Struct("<16sHHHH")
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# MapGenerator.TileType, in enum order
+TILE_TYPES = [
+    "GROUND", "GROUND_GRASS", "GROUND_DIRT", "GROUND_SAND",
+    "WALL", "WALL_BRICK", "WALL_WOOD", "ROOF",
+    "WALL_SCHOOL", "WALL_OFFICE", "WALL_BUNGALOW", "PARK_GROUND",
+    "TREE", "TREE_PINE", "BUSH", "FLOWERS",
+    "BENCH", "LAMP_POST", "FENCE", "FOUNTAIN", "MAILBOX", "TRASH_CAN", "SIGN_SHOP",
+]
+T = {name: i for i, name in enumerate(TILE_TYPES)}
+
+WALKABLE = {T["GROUND"], T["GROUND_GRASS"], T["GROUND_DIRT"], T["GROUND_SAND"], T["PARK_GROUND"]}
+WALLS = {T["WALL"], T["WALL_BRICK"], T["WALL_WOOD"], T["ROOF"],
+         T["WALL_SCHOOL"], T["WALL_OFFICE"], T["WALL_BUNGALOW"]}
+FENCE_NEIGHBOURS = WALLS - {T["ROOF"]}
+
+
+# ─── Godot RandomNumberGenerator ───
+
+class GodotRNG:
+    """Bit-exact port of Godot 4's RandomNumberGenerator (RandomPCG / pcg32)."""
+
+    MULT = 6364136223846793005
+    INC = 1442695040888963407      # PCG_DEFAULT_INC_64
+    MASK = (1 << 64) - 1
+
+    def __init__(self, seed):
+        # pcg32_srandom_r(seed, INC)
+        self.inc = ((self.INC << 1) | 1) & self.MASK
+        self.state = 0
+        self.rand()
+        self.state = (self.state + seed) & self.MASK
+        self.rand()
+
+    def rand(self):
+        """pcg32_random_r: next uint32."""
+        old = self.state
+        self.state = (old * self.MULT + self.inc) & self.MASK
+        xorshifted = (((old >> 18) ^ old) >> 27) & 0xFFFFFFFF
+        rot = old >> 59
+        return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & 0xFFFFFFFF
+
+    def _bounded(self, bound):
+        """pcg32_boundedrand_r: unbiased uint32 in [0, bound)."""
+        threshold = (-bound & 0xFFFFFFFF) % bound
+        while True:
+            r = self.rand()
+            if r >= threshold:
+                return r % bound
+
+    def randf(self):
+        """RandomPCG::randf: float32 in [0, 1]."""
+        exp_offset = self.rand()
+        if exp_offset == 0:
+            return 0.0
+        clz = 32 - exp_offset.bit_length()
+        return float(np.float32(self.rand() | 0x80000001)) * 2.0 ** (-32 - clz)
+
+    def randi_range(self, lo, hi):
+        """RandomPCG::random: int in [lo, hi]; lo == hi draws nothing."""
+        if lo == hi:
+            return lo
+        return self._bounded(abs(lo - hi) + 1) + min(lo, hi)
+
+
+# ─── Layouts ───
+
+INDIRANAGAR = {
+    "size": (60, 50),
+    "seed": 42,
+    # Two-tile roads, by top row / left column
+    "road_rows": [23, 40, 7, 14, 19, 30, 36, 46],
+    "road_cols": [4, 42, 12, 20, 28, 35, 50, 56],
+    # 100 Feet Road and CMH Road get lamp/tree avenues; other roads get trees
+    "avenue_row": 23,
+    "avenue_col": 4,
+    # Blocks as (x0, x1, y0, y1), inclusive
+    "parks": [
+        {"block": (6, 11, 32, 35), "fountain": (8, 33), "benches": [(7, 32), (9, 34)],
+         "flowers": [(10, 32), (7, 34), (9, 31)], "trees": 6, "tree_area": (6, 11, 31, 35)},
+        {"block": (52, 55, 42, 45), "fountain": (53, 43), "benches": [(52, 42)],
+         "flowers": [(54, 44)], "trees": 4, "tree_area": (51, 55, 41, 45)},
+        {"block": (6, 11, 9, 13), "fountain": (8, 10), "benches": [(7, 9)],
+         "flowers": [(10, 11)], "trees": 5, "tree_area": (6, 11, 8, 13)},
+    ],
+    "schools": [(30, 34, 42, 45), (22, 27, 16, 18)],
+    "commercial_rows": (20, 29),
+    "commercial_cols": (36, 49),
+    # Random scatter passes: attempts per pass
+    "scatter": {"furniture": 25, "bushes": 20, "flowers": 10, "fences": 8, "dirt_paths": 6},
+    # Scene script holding the spawn points (see world_spawns)
+    "script": "game/scripts/world.gd",
+}
+
+LAYOUTS = {"indiranagar": INDIRANAGAR}
+
+
+def _spans(free):
+    """[start, end] index ranges (inclusive) of runs of True in a 1-D mask."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], free.astype(np.int8), [0]))))
+    return [(int(a), int(b) - 1) for a, b in zip(edges[::2], edges[1::2])]
+
+
+def _tree(rng):
+    return T["TREE"] if rng.randf() < 0.7 else T["TREE_PINE"]
+
+
+def world_spawns(script):
+    """{id: (x, y)} from a scene script's PLAYER_SPAWN and npc_data positions."""
+    text = Path(script).read_text()
+    player = re.search(r"const PLAYER_SPAWN = Vector2i\((\d+),\s*(\d+)\)", text)
+    if not player:
+        raise ValueError(f"{script}: no PLAYER_SPAWN constant")
+    spawns = {"player": (int(player[1]), int(player[2]))}
+    for m in re.finditer(r'"id":\s*"(\w+)".*?"position":\s*Vector2i\((\d+),\s*(\d+)\)', text, re.S):
+        spawns[m[1]] = (int(m[2]), int(m[3]))
+    return spawns
+
+
+def compile_map(layout, seed=None):
+    """Run the MapGenerator layout; returns (grid, buildings, props, spawns).
+
+    spawns maps each id to ((x, y) snapped to walkable, (x, y) as requested).
+    """
+    width, height = layout["size"]
+    rng = GodotRNG(layout["seed"] if seed is None else seed)
+    grid = np.full((height, width), T["GROUND_GRASS"], dtype=np.uint8)
+
+    # Roads and border walls
+    road_rows = np.zeros(height, dtype=bool)
+    road_cols = np.zeros(width, dtype=bool)
+    for r in layout["road_rows"]:
+        road_rows[r:r + 2] = True
+    for c in layout["road_cols"]:
+        road_cols[c:c + 2] = True
+    grid[road_rows, :] = T["GROUND"]
+    grid[:, road_cols] = T["GROUND"]
+    grid[[0, -1], :] = T["WALL"]
+    grid[:, [0, -1]] = T["WALL"]
+
+    # Buildings — one per non-park block between roads
+    inner_cols = ~road_cols
+    inner_cols[[0, -1]] = False
+    inner_rows = ~road_rows
+    inner_rows[[0, -1]] = False
+    parks = [p["block"] for p in layout["parks"]]
+    cx0, cx1 = layout["commercial_cols"]
+    cy0, cy1 = layout["commercial_rows"]
+    buildings = []
+    for x0, x1 in _spans(inner_cols):
+        for y0, y1 in _spans(inner_rows):
+            block_w, block_h = x1 - x0 + 1, y1 - y0 + 1
+            if block_w < 3 or block_h < 3 or (x0, x1, y0, y1) in parks:
+                continue
+            if (x0, x1, y0, y1) in layout["schools"]:
+                wt = T["WALL_SCHOOL"]
+            elif (y0 >= cy0 and y1 <= cy1) or (x0 >= cx0 and x1 <= cx1):
+                roll = rng.randf()
+                wt = T["WALL_OFFICE"] if roll < 0.35 else T["WALL_BRICK"] if roll < 0.70 else T["WALL"]
+            else:
+                roll = rng.randf()
+                wt = T["WALL_BUNGALOW"] if roll < 0.35 else T["WALL_WOOD"] if roll < 0.65 else T["WALL_BRICK"]
+
+            bw = max(3, block_w - rng.randi_range(0, 1))
+            bh = max(3, block_h - rng.randi_range(0, 1))
+            bx = x0 + rng.randi_range(0, max(0, block_w - bw))
+            by = y0 + rng.randi_range(0, max(0, block_h - bh))
+            footprint = grid[by:by + bh, bx:bx + bw]
+            if footprint.shape == (bh, bw) and (footprint == T["GROUND_GRASS"]).all():
+                footprint[:] = wt
+                buildings.append({"x": bx, "y": by, "w": bw, "h": bh, "wall_type": wt})
+
+    # Parks
+    for park in layout["parks"]:
+        x0, x1, y0, y1 = park["block"]
+        area = grid[y0:y1 + 1, x0:x1 + 1]
+        area[area == T["GROUND_GRASS"]] = T["PARK_GROUND"]
+    for park in layout["parks"]:
+        fx, fy = park["fountain"]
+        grid[fy, fx] = T["FOUNTAIN"]
+        for kind, spots in (("BENCH", park["benches"]), ("FLOWERS", park["flowers"])):
+            for x, y in spots:
+                if grid[y, x] == T["PARK_GROUND"]:
+                    grid[y, x] = T[kind]
+        ax0, ax1, ay0, ay1 = park["tree_area"]
+        for _ in range(park["trees"]):
+            px = fx + rng.randi_range(-2, 2)
+            py = fy + rng.randi_range(-2, 2)
+            if ax0 <= px <= ax1 and ay0 <= py <= ay1 and grid[py, px] == T["PARK_GROUND"]:
+                grid[py, px] = _tree(rng)
+
+    # Tree-lined streets
+    ar, ac = layout["avenue_row"], layout["avenue_col"]
+    for x in range(2, width - 2, 2):
+        tt = T["LAMP_POST"] if x % 6 == 0 else _tree(rng)
+        for y in (ar - 1, ar + 2):
+            if grid[y, x] == T["GROUND_GRASS"]:
+                grid[y, x] = tt
+    for y in range(2, height - 2, 2):
+        tt = T["LAMP_POST"] if y % 6 == 0 else _tree(rng)
+        for x in (ac - 1, ac + 2):
+            if grid[y, x] == T["GROUND_GRASS"]:
+                grid[y, x] = tt
+    for ry in sorted(r for r in layout["road_rows"] if r != ar):
+        for x in range(2, width - 2, 3):
+            if ry > 1 and grid[ry - 1, x] == T["GROUND_GRASS"]:
+                grid[ry - 1, x] = _tree(rng)
+            if ry + 2 < height - 1 and grid[ry + 2, x] == T["GROUND_GRASS"]:
+                grid[ry + 2, x] = _tree(rng)
+    for rx in sorted(c for c in layout["road_cols"] if c != ac):
+        for y in range(2, height - 2, 3):
+            if rx > 1 and grid[y, rx - 1] == T["GROUND_GRASS"]:
+                grid[y, rx - 1] = _tree(rng)
+            if rx + 2 < width - 1 and grid[y, rx + 2] == T["GROUND_GRASS"]:
+                grid[y, rx + 2] = _tree(rng)
+
+    scatter = layout["scatter"]
+
+    def neighbours(x, y, offsets):
+        for dx, dy in offsets:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                yield grid[ny, nx]
+
+    edge4 = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+    ring8 = [(dx, dy) for dy in range(-1, 2) for dx in range(-1, 2)]
+
+    # Street furniture next to roads
+    furniture = [T["TRASH_CAN"], T["MAILBOX"], T["SIGN_SHOP"], T["BENCH"]]
+    for _ in range(scatter["furniture"]):
+        fx, fy = rng.randi_range(2, width - 3), rng.randi_range(2, height - 3)
+        if grid[fy, fx] != T["GROUND_GRASS"]:
+            continue
+        if any(t == T["GROUND"] for t in neighbours(fx, fy, edge4)):
+            grid[fy, fx] = furniture[rng.randi_range(0, len(furniture) - 1)]
+
+    # Bushes near trees, loose flowers, fences against buildings
+    for _ in range(scatter["bushes"]):
+        bx, by = rng.randi_range(2, width - 3), rng.randi_range(2, height - 3)
+        if grid[by, bx] != T["GROUND_GRASS"]:
+            continue
+        if any(t in (T["TREE"], T["TREE_PINE"]) for t in neighbours(bx, by, ring8)):
+            grid[by, bx] = T["BUSH"]
+    for _ in range(scatter["flowers"]):
+        fx, fy = rng.randi_range(2, width - 3), rng.randi_range(2, height - 3)
+        if grid[fy, fx] == T["GROUND_GRASS"]:
+            grid[fy, fx] = T["FLOWERS"]
+    for _ in range(scatter["fences"]):
+        fx, fy = rng.randi_range(2, width - 3), rng.randi_range(2, height - 3)
+        if grid[fy, fx] != T["GROUND_GRASS"]:
+            continue
+        if any(t in FENCE_NEIGHBOURS for t in neighbours(fx, fy, edge4)):
+            grid[fy, fx] = T["FENCE"]
+
+    # Dirt paths off roads
+    for _ in range(scatter["dirt_paths"]):
+        sx, sy = rng.randi_range(3, width - 4), rng.randi_range(3, height - 4)
+        if grid[sy, sx] != T["GROUND"]:
+            continue
+        dx = rng.randi_range(-1, 1)
+        dy = 1 if dx == 0 else 0
+        cx, cy = sx, sy
+        for _ in range(rng.randi_range(2, 4)):
+            cx += dx
+            cy += dy
+            if 1 < cx < width - 2 and 1 < cy < height - 2 and grid[cy, cx] == T["GROUND_GRASS"]:
+                grid[cy, cx] = T["GROUND_DIRT"]
+
+    walkable = np.isin(grid, list(WALKABLE))
+    props = [(int(x), int(y), int(grid[y, x]))
+             for y, x in zip(*np.nonzero(~walkable & ~np.isin(grid, list(WALLS))))]
+    spawns = {name: (nearest_walkable(walkable, pos), pos)
+              for name, pos in world_spawns(REPO_ROOT / layout["script"]).items()}
+    return grid, buildings, props, spawns
+
+
+def nearest_walkable(walkable, pos):
+    """Same search order as world.gd _find_nearest_walkable."""
+    height, width = walkable.shape
+    x, y = pos
+    if 0 <= x < width and 0 <= y < height and walkable[y, x]:
+        return pos
+    for r in range(1, 20):
+        for dy in range(-r, r + 1):
+            for dx in range(-r, r + 1):
+                cx, cy = x + dx, y + dy
+                if 0 <= cx < width and 0 <= cy < height and walkable[cy, cx]:
+                    return (cx, cy)
+    return pos
+
+
+# ─── Binary map ───
+
+def encode(grid, buildings, props, spawns, seed):
+    height, width = grid.shape
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, width, height, seed,
+                                len(buildings), len(props), len(spawns), 0))
+    out += grid.astype(np.uint8).tobytes()
+    for b in buildings:
+        out += BUILDING.pack(b["x"], b["y"], b["w"], b["h"], b["wall_type"], 0)
+    for x, y, t in props:
+        out += PROP.pack(x, y, t, 0)
+    for name, ((x, y), (from_x, from_y)) in spawns.items():
+        out += SPAWN.pack(name.encode("ascii"), x, y, from_x, from_y)
+    return bytes(out)
+
+
+def decode(data):
+    """Inverse of encode; returns (grid, buildings, props, spawns, seed)."""
+    magic, version, width, height, seed, nb, np_, ns, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a version {FORMAT_VERSION} map (magic {magic!r}, version {version})")
+    offset = HEADER.size
+    grid = np.frombuffer(data, dtype=np.uint8, count=width * height, offset=offset).reshape(height, width)
+    offset += width * height
+    buildings = []
+    for _ in range(nb):
+        x, y, w, h, wt, _ = BUILDING.unpack_from(data, offset)
+        buildings.append({"x": x, "y": y, "w": w, "h": h, "wall_type": wt})
+        offset += BUILDING.size
+    props = [PROP.unpack_from(data, offset + i * PROP.size)[:3] for i in range(np_)]
+    offset += np_ * PROP.size
+    spawns = {}
+    for _ in range(ns):
+        name, x, y, from_x, from_y = SPAWN.unpack_from(data, offset)
+        spawns[name.rstrip(b"\0").decode("ascii")] = ((x, y), (from_x, from_y))
+        offset += SPAWN.size
+    return grid, buildings, props, spawns, seed
+
+
+PREVIEW = {"GROUND": "=", "GROUND_GRASS": ".", "GROUND_DIRT": ":", "GROUND_SAND": "_",
+           "PARK_GROUND": ",", "TREE": "T", "TREE_PINE": "P", "BUSH": "b", "FLOWERS": "*",
+           "BENCH": "n", "LAMP_POST": "l", "FENCE": "f", "FOUNTAIN": "O", "MAILBOX": "m",
+           "TRASH_CAN": "t", "SIGN_SHOP": "s"}
+
+
+def preview(grid):
+    chars = [PREVIEW.get(name, "#") for name in TILE_TYPES]
+    return "\n".join("".join(chars[t] for t in row) for row in grid)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile a map layout into the game's binary map format")
+    parser.add_argument("--layout", choices=list(LAYOUTS), default="indiranagar")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (default: the layout's, 42)")
+    parser.add_argument("--output", "-o", default=None,
+                        help="Output file (default: game/resources/maps/<layout>.ssmap)")
+    parser.add_argument("--preview", action="store_true", help="Print the map as ASCII")
+    args = parser.parse_args()
+
+    layout = LAYOUTS[args.layout]
+    seed = layout["seed"] if args.seed is None else args.seed
+    out = Path(args.output) if args.output else \
+        Path(__file__).parent.parent / "game" / "resources" / "maps" / f"{args.layout}.ssmap"
+
+    print("=" * 60)
+    print("Map Compiler — Startup Simulator")
+    print(f"Layout: {args.layout}  Seed: {seed}")
+    print(f"Output: {out}")
+    print("=" * 60)
+
+    grid, buildings, props, spawns = compile_map(layout, seed)
+    data = encode(grid, buildings, props, spawns, seed)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(data)
+
+    if args.preview:
+        print(preview(grid))
+    print(f"  ✓ {grid.shape[1]}×{grid.shape[0]} tiles, {len(buildings)} buildings, "
+          f"{len(props)} props, {len(spawns)} spawns ({len(data)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Decoded-Pixel Cache for Startup Simulator
+Decode each PNG once; every later stage maps the raw RGBA straight from disk.
+
+Entries live in tools/.pixel_cache/<sha256 of the PNG bytes>.rgba: a 16-byte
+header (magic, width, height) followed by row-major RGBA8. Stages get a
+read-only np.memmap of shape (h, w, 4) — no decode, no copy, and the OS page
+cache shares the pixels between processes running at the same time.
+
+Keys are content hashes, so an edited PNG simply gets a new entry and the
+old one is never read again; `prune` deletes entries no asset refers to,
+and temp files abandoned for over an hour. Entries are written to a temp
+file and renamed into place, so concurrent stages never see a half-written
+entry. A PNG is only hashed when its (path, mtime, size) stamp changes: the
+last key seen for each path is kept in tools/.pixel_cache/stamps/, so a new
+process reaches a cache hit with one stat and one small read.
+
+Usage (library):
+  from pixel_cache import PixelCache
+  cache = PixelCache()
+  rgba = cache.pixels("game/assets/tiles/tree.png")   # (h, w, 4) uint8 view
+  img = cache.image("game/assets/tiles/tree.png")     # PIL image on the same buffer
+
+Usage (CLI):
+  python pixel_cache.py warm          # decode every PNG under game/assets
+  python pixel_cache.py stats
+  python pixel_cache.py prune
+"""
+
+import os
+import sys
+import time
+import struct
+import hashlib
+import tempfile
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+MAGIC = b"RGBA"
+HEADER = struct.Struct("<4sIII")     # magic, width, height, reserved
+DEFAULT_ROOT = Path(__file__).parent / ".pixel_cache"
+STALE_PART_S = 3600                  # prune removes temp files older than this
+
+
+def source_hash(path):
+    """sha256 of the PNG bytes; the cache key."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class PixelCache:
+    """Content-addressed store of decoded RGBA, read through np.memmap."""
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+        self._keys = {}       # resolved path -> (mtime_ns, size, key), skips rehashing within a process
+
+    def stamp_path(self, png_path):
+        """Where the last (mtime_ns, size, key) seen for png_path is kept."""
+        name = hashlib.sha1(str(Path(png_path).resolve()).encode()).hexdigest()
+        return self.root / "stamps" / name
+
+    def key(self, png_path):
+        """Content key of png_path, hashing the file only if its stamp changed."""
+        path = Path(png_path).resolve()
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        memo = self._keys.get(path)
+        if memo is None:
+            try:
+                mtime_ns, size, key = self.stamp_path(path).read_text().split()
+                memo = (int(mtime_ns), int(size), key)
+            except (OSError, ValueError):
+                memo = None
+        if memo and memo[:2] == stamp:
+            self._keys[path] = memo
+            return memo[2]
+        key = source_hash(path)
+        self._keys[path] = (*stamp, key)
+        self._write(self.stamp_path(path), f"{stamp[0]} {stamp[1]} {key}\n".encode())
+        return key
+
+    def entry_path(self, key):
+        return self.root / f"{key}.rgba"
+
+    def _write(self, dest, *chunks):
+        """Write chunks to dest through a temp file renamed into place."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".part")
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, dest)
+
+    def _store(self, png_path, dest):
+        with Image.open(png_path) as img:
+            rgba = img.convert("RGBA")
+        self._write(dest, HEADER.pack(MAGIC, rgba.width, rgba.height, 0), rgba.tobytes())
+
+    def pixels(self, png_path):
+        """Read-only (h, w, 4) uint8 memmap of png_path's decoded RGBA."""
+        entry = self.entry_path(self.key(png_path))
+        if entry.exists():
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._store(png_path, entry)
+        with open(entry, "rb") as f:
+            magic, width, height, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{entry}: not a pixel cache entry")
+        return np.memmap(entry, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(height, width, 4))
+
+    def image(self, png_path):
+        """PIL RGBA image backed by the cached buffer (read-only)."""
+        rgba = self.pixels(png_path)
+        return Image.frombuffer("RGBA", (rgba.shape[1], rgba.shape[0]), rgba, "raw", "RGBA", 0, 1)
+
+    def warm(self, png_paths):
+        for path in png_paths:
+            self.pixels(path)
+
+    def prune(self, png_paths, stale_after=STALE_PART_S):
+        """Delete entries and stamps not belonging to any of png_paths; returns bytes freed.
+
+        Temp files are only removed once they are stale_after seconds old
+        (left behind by a crashed writer); younger ones may still be being
+        written by another process.
+        """
+        keep = {self.entry_path(self.key(p)) for p in png_paths}
+        keep |= {self.stamp_path(p) for p in png_paths}
+        freed = 0
+        stamps = [p for p in self.root.glob("stamps/*") if p.suffix != ".part"]
+        for entry in [*self.root.glob("*.rgba"), *stamps]:
+            if entry not in keep:
+                freed += entry.stat().st_size
+                entry.unlink()
+        cutoff = time.time() - stale_after
+        for tmp in [*self.root.glob("*.part"), *self.root.glob("stamps/*.part")]:
+            try:
+                if tmp.stat().st_mtime < cutoff:
+                    freed += tmp.stat().st_size
+                    tmp.unlink()
+            except FileNotFoundError:
+                pass  # renamed into place or removed meanwhile
+        return freed
+
+    def size_bytes(self):
+        return sum(p.stat().st_size for p in self.root.glob("*.rgba"))
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Decoded-pixel cache for post-processing stages")
+    parser.add_argument("command", choices=["warm", "stats", "prune"])
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--cache", default=str(DEFAULT_ROOT), help="Cache directory (default: tools/.pixel_cache)")
+    args = parser.parse_args()
+
+    in_root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+    cache = PixelCache(args.cache)
+    pngs = sorted(in_root.rglob("*.png"))
+
+    print("=" * 60)
+    print("Pixel Cache — Startup Simulator")
+    print(f"Assets: {in_root}  Cache: {cache.root}")
+    print("=" * 60)
+
+    if args.command == "warm":
+        cache.warm(pngs)
+        print(f"  ✓ {len(pngs)} assets: {cache.misses} decoded, {cache.hits} already cached")
+    elif args.command == "prune":
+        freed = cache.prune(pngs)
+        print(f"  ✓ Freed {freed / 2**20:.1f} MiB")
+    cached = sum(cache.entry_path(cache.key(p)).exists() for p in pngs)
+    print(f"\n{cached}/{len(pngs)} assets cached, {cache.size_bytes() / 2**20:.1f} MiB on disk")
+
+
+if __name__ == "__main__":
+    main()
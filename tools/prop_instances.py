@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Prop Instancing Buffers for Startup Simulator
+Groups the map's props by texture and writes one packed instance buffer per
+texture, so the game draws each prop type with a single MultiMeshInstance2D
+(game/scripts/prop_instancer.gd) instead of one Sprite2D per prop.
+
+The map comes from map_compiler.compile_map (the MapGenerator layout), or
+from an existing compiled map with --map. Each instance is the 12 floats of
+Godot's MultiMesh buffer for TRANSFORM_2D with colours:
+  basis.x.x, basis.y.x, 0, origin.x, basis.x.y, basis.y.y, 0, origin.y,
+  r, g, b, a
+in world pixels, for a unit quad centred on the origin (PropInstancer builds
+it). Instances are sorted top to bottom, then left to right.
+
+--jitter adds per-instance rotation, scale and tint from JITTER. The jitter is
+a hash of (seed, x, y), so an instance keeps its look when others change.
+
+Binary format (little-endian, version 1):
+  header  "SSPI" u16 version, u16 width, u16 height, u16 groups, u32 seed,
+          u16 tile size, u16 floats per instance                   (20 bytes)
+  groups  per texture: u8 TileType, u8 flags (1 = jittered), u16 0,
+          u32 count, then count × floats-per-instance f32
+
+Usage:
+  python prop_instances.py                   # indiranagar → game/resources/maps/
+  python prop_instances.py --jitter --map variant.ssmap -o variant.props
+"""
+
+import sys
+import struct
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install numpy")
+    sys.exit(1)
+
+import map_compiler
+
+FORMAT_VERSION = 1
+MAGIC = b"SSPI"
+HEADER = struct.Struct("<4sHHHHIHH")
+GROUP = struct.Struct("<BBHI")
+FLOATS_PER_INSTANCE = 12     # Transform2D (8) + Color (4)
+TILE_SIZE = 320              # world px per tile, as world.gd
+
+# Per-instance jitter ranges: rotation ± degrees, scale ± fraction, tint =
+# max darkening (also used for a small warm/cool shift). Round foliage can
+# spin freely in a top-down view; built objects only vary in tint.
+FOLIAGE = {"TREE", "TREE_PINE", "BUSH", "FLOWERS"}
+JITTER = {
+    "foliage": {"rotation": 180.0, "scale": 0.12, "tint": 0.10},
+    "object":  {"rotation": 0.0, "scale": 0.0, "tint": 0.05},
+}
+
+_M1, _M2, _GOLDEN = 0xBF58476D1CE4E5B9, 0x94D049BB133111EB, 0x9E3779B97F4A7C15
+
+
+def _hash01(seed, x, y, channel):
+    """Uniform [0, 1) per (seed, x, y, channel), vectorised splitmix64 finaliser."""
+    base = np.uint64((seed * _GOLDEN + channel * _M2) % 2**64)
+    h = base ^ (x.astype(np.uint64) << np.uint64(32)) ^ y.astype(np.uint64)
+    h ^= h >> np.uint64(30)
+    h *= np.uint64(_M1)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(_M2)
+    h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)).astype(np.float64) / 2.0**53
+
+
+def instance_buffer(cells, tile_type, seed, jitter=False, tile_size=TILE_SIZE):
+    """(count, FLOATS_PER_INSTANCE) float32 array for cells [(x, y)] of one tile type."""
+    xy = np.array(sorted(cells, key=lambda c: (c[1], c[0])), dtype=np.int64).reshape(-1, 2)
+    x, y = xy[:, 0], xy[:, 1]
+    n = len(xy)
+    rotation, scale = np.zeros(n), np.ones(n)
+    rgba = np.ones((n, 4))
+    if jitter:
+        params = JITTER["foliage" if map_compiler.TILE_TYPES[tile_type] in FOLIAGE else "object"]
+        rotation = np.radians(params["rotation"]) * (2 * _hash01(seed, x, y, 1) - 1)
+        scale = 1 + params["scale"] * (2 * _hash01(seed, x, y, 2) - 1)
+        value = 1 - params["tint"] * _hash01(seed, x, y, 3)
+        warm = params["tint"] / 2 * (2 * _hash01(seed, x, y, 4) - 1)
+        rgba[:, 0] = np.clip(value + warm, 0, 1)
+        rgba[:, 1] = value
+        rgba[:, 2] = np.clip(value - warm, 0, 1)
+
+    s = scale * tile_size
+    cos, sin = np.cos(rotation) * s, np.sin(rotation) * s
+    out = np.zeros((n, FLOATS_PER_INSTANCE), dtype=np.float32)
+    out[:, 0], out[:, 1], out[:, 3] = cos, -sin, (x + 0.5) * tile_size
+    out[:, 4], out[:, 5], out[:, 7] = sin, cos, (y + 0.5) * tile_size
+    out[:, 8:12] = rgba
+    return out
+
+
+def group_props(props):
+    """{tile_type: [(x, y)]} in TileType order."""
+    groups = {}
+    for x, y, t in props:
+        groups.setdefault(t, []).append((x, y))
+    return dict(sorted(groups.items()))
+
+
+def encode(width, height, seed, buffers, jitter, tile_size=TILE_SIZE):
+    """buffers is {tile_type: instance array}."""
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, width, height, len(buffers), seed,
+                                tile_size, FLOATS_PER_INSTANCE))
+    for tile_type, buf in buffers.items():
+        out += GROUP.pack(tile_type, 1 if jitter else 0, 0, len(buf))
+        out += buf.astype("<f4").tobytes()
+    return bytes(out)
+
+
+def decode(data):
+    """Inverse of encode; returns (width, height, seed, {tile_type: array})."""
+    magic, version, width, height, count, seed, tile_size, floats = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a version {FORMAT_VERSION} prop buffer (magic {magic!r}, version {version})")
+    offset, buffers = HEADER.size, {}
+    for _ in range(count):
+        tile_type, _, _, n = GROUP.unpack_from(data, offset)
+        offset += GROUP.size
+        buffers[tile_type] = np.frombuffer(data, dtype="<f4", count=n * floats, offset=offset).reshape(n, floats)
+        offset += n * floats * 4
+    return width, height, seed, buffers
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Write per-texture prop instance buffers for a map")
+    parser.add_argument("--layout", choices=list(map_compiler.LAYOUTS), default="indiranagar")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (default: the layout's, 42)")
+    parser.add_argument("--map", default=None, help="Read props from a compiled .ssmap instead of compiling")
+    parser.add_argument("--jitter", action="store_true", help="Deterministic per-instance rotation/scale/tint")
+    parser.add_argument("--output", "-o", default=None,
+                        help="Output file (default: game/resources/maps/<layout>.props)")
+    args = parser.parse_args()
+
+    if args.map:
+        grid, _, props, _, seed = map_compiler.decode(Path(args.map).read_bytes())
+    else:
+        layout = map_compiler.LAYOUTS[args.layout]
+        seed = layout["seed"] if args.seed is None else args.seed
+        grid, _, props, _ = map_compiler.compile_map(layout, seed)
+    out = Path(args.output) if args.output else \
+        Path(__file__).parent.parent / "game" / "resources" / "maps" / f"{args.layout}.props"
+
+    print("=" * 60)
+    print("Prop Instancing Buffers — Startup Simulator")
+    print(f"Map: {args.map or args.layout}  Seed: {seed}  Jitter: {'on' if args.jitter else 'off'}")
+    print(f"Output: {out}")
+    print("=" * 60)
+
+    buffers = {t: instance_buffer(cells, t, seed, args.jitter) for t, cells in group_props(props).items()}
+    for tile_type, buf in buffers.items():
+        print(f"  ✓ {map_compiler.TILE_TYPES[tile_type].lower():<10} {len(buf):>4} instances")
+    data = encode(grid.shape[1], grid.shape[0], seed, buffers, args.jitter)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(data)
+    print(f"\n{len(props)} props → {len(buffers)} instanced draws ({len(data)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
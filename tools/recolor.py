@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Palette Recolor Engine for Startup Simulator
+Remaps the PAL colours of a finished asset to a themed palette in one pass.
+
+Each theme turns PAL into a target palette. From the source/target pair we
+precompute a 3D colour lookup table (Pillow's Color3DLUT); applying it is a
+single C-level filter call per image, so one base asset can be fanned out into
+dozens of variants without redrawing any primitives.
+
+The LUT interpolates trilinearly between grid points, which blurs across the
+boundaries between palette entries, so it handles the in-between colours
+(noise, anti-aliasing) only: pixels that are exactly a PAL colour are then
+mapped straight to their target with a NumPy table lookup.
+
+Variants are written outside the Godot project, to tools/output/variants/.
+
+Themes compose with "+": `dusk+rival_blue` is the rival shop at dusk.
+
+Usage:
+  python recolor.py tiles/wall_brick.png --theme dusk --theme monsoon
+  python recolor.py tiles/*.png --all-themes
+"""
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image, ImageFilter
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+from generate_procedural import PAL
+
+LUT_SIZE = 65        # grid points per channel (65 → 4-level spacing)
+REACH = 48           # colours further than this from every PAL entry are left alone
+LUT_CHUNK = 4096     # grid rows per nearest-entry pass in build_lut
+
+
+# ─── Themes (PAL → target palette) ───
+
+def _clamp(v):
+    return max(0, min(255, int(round(v))))
+
+
+def _grade(mul, add=(0, 0, 0)):
+    """Theme that scales every colour by mul and offsets it by add."""
+    def theme(pal):
+        return {k: tuple(_clamp(c * m + a) for c, m, a in zip(rgb, mul, add))
+                for k, rgb in pal.items()}
+    return theme
+
+
+def _swap(**overrides):
+    """Theme that replaces individual palette entries."""
+    def theme(pal):
+        return {**pal, **overrides}
+    return theme
+
+
+THEMES = {
+    # Time of day
+    "morning":     _grade((1.04, 1.02, 0.96), (6, 6, 2)),
+    "dusk":        _grade((1.06, 0.84, 0.74), (12, 0, 6)),
+    "night":       _grade((0.42, 0.48, 0.68)),
+    # Seasons
+    "monsoon":     _swap(grass=(70, 135, 55), grass_light=(90, 155, 68), grass_dark=(52, 112, 42),
+                         park_green=(62, 145, 52), park_light=(82, 165, 64),
+                         dirt=(140, 95, 65), dirt_dark=(118, 78, 52),
+                         asphalt=(110, 106, 100), asphalt_dark=(92, 88, 82)),
+    "summer":      _swap(grass=(140, 150, 80), grass_light=(165, 170, 100), grass_dark=(115, 125, 62),
+                         park_green=(120, 150, 70), park_light=(145, 168, 88),
+                         leaf_green=(110, 140, 60), sand=(225, 205, 170)),
+    # Rival shop colours
+    "rival_blue":  _swap(terracotta=(60, 110, 180), roof_tile=(70, 105, 170), roof_dark=(50, 82, 140),
+                         brick=(55, 80, 130), yellow=(230, 230, 240)),
+    "rival_green": _swap(terracotta=(60, 150, 90), roof_tile=(70, 140, 85), roof_dark=(50, 112, 66),
+                         brick=(45, 100, 60), yellow=(240, 225, 120)),
+    "rival_purple": _swap(terracotta=(130, 70, 160), roof_tile=(120, 72, 150), roof_dark=(95, 55, 122),
+                          brick=(90, 55, 110), yellow=(245, 200, 90)),
+}
+
+
+def theme_palette(theme):
+    """Target palette for a theme name, composing "a+b" left to right."""
+    pal = dict(PAL)
+    for name in theme.split("+"):
+        if name not in THEMES:
+            raise KeyError(f"unknown theme {name!r} (choose from {', '.join(THEMES)})")
+        pal = THEMES[name](pal)
+    return pal
+
+
+# ─── LUT ───
+
+def build_lut(src, dst, size=LUT_SIZE, reach=REACH):
+    """Color3DLUT mapping each src palette colour to its dst counterpart.
+
+    Colours near a palette entry keep their offset from it, so noise and
+    anti-aliasing survive the remap; the shift fades out with distance and
+    colours beyond `reach` of every entry pass through unchanged.
+    """
+    keys = list(src)
+    src_rgb = np.array([src[k] for k in keys], dtype=np.float32)
+    shift = np.array([dst.get(k, src[k]) for k in keys], dtype=np.float32) - src_rgb
+
+    # Grid in Color3DLUT order: red varies fastest, then green, then blue
+    axis = np.linspace(0.0, 255.0, size, dtype=np.float32)
+    b, g, r = np.meshgrid(axis, axis, axis, indexing="ij")
+    grid = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+
+    # Nearest entry per grid colour, LUT_CHUNK rows at a time so the
+    # (rows, keys, 3) distance temporaries stay a few MiB
+    nearest = np.empty(len(grid), dtype=np.intp)
+    dist = np.empty(len(grid), dtype=np.float32)
+    for start in range(0, len(grid), LUT_CHUNK):
+        d2 = ((grid[start:start + LUT_CHUNK, None, :] - src_rgb[None, :, :]) ** 2).sum(axis=2)
+        rows = d2.argmin(axis=1)
+        nearest[start:start + LUT_CHUNK] = rows
+        dist[start:start + LUT_CHUNK] = np.sqrt(d2[np.arange(len(rows)), rows])
+    weight = np.clip(1.0 - dist / reach, 0.0, 1.0)[:, None]
+    table = np.clip((grid + weight * shift[nearest]) / 255.0, 0.0, 1.0)
+    return ImageFilter.Color3DLUT(size, table.ravel())
+
+
+@lru_cache(maxsize=None)
+def theme_lut(theme):
+    """Cached LUT for a theme name."""
+    return build_lut(PAL, theme_palette(theme))
+
+
+def _rgb_codes(rgb):
+    """24-bit 0xRRGGBB codes of an (..., 3) array."""
+    rgb = rgb.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+@lru_cache(maxsize=None)
+def theme_exact(theme):
+    """(sorted PAL colour codes, target RGB per code) for a theme name."""
+    dst = theme_palette(theme)
+    keys = sorted(PAL, key=lambda k: _rgb_codes(np.array(PAL[k])))
+    codes = _rgb_codes(np.array([PAL[k] for k in keys]))
+    return codes, np.array([dst[k] for k in keys], dtype=np.uint8)
+
+
+def recolor(img, theme):
+    """Return img recoloured to theme. Alpha is preserved; PAL colours map exactly."""
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA")
+    out = np.array(img.filter(theme_lut(theme)))
+    codes, targets = theme_exact(theme)
+    src = _rgb_codes(np.asarray(img)[..., :3])
+    idx = np.minimum(np.searchsorted(codes, src), len(codes) - 1)
+    hit = codes[idx] == src
+    out[..., :3][hit] = targets[idx[hit]]
+    return Image.fromarray(out, img.mode)
+
+
+def recolor_variants(img, themes):
+    """Recolour one base image into every theme; returns {theme: image}."""
+    return {theme: recolor(img, theme) for theme in themes}
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Recolor assets into themed palette variants")
+    parser.add_argument("assets", nargs="+", help="Asset paths relative to --input (e.g. tiles/wall_brick.png)")
+    parser.add_argument("--theme", "-t", action="append", default=[],
+                        help=f"Theme to apply, repeatable; combine with + (available: {', '.join(THEMES)})")
+    parser.add_argument("--all-themes", action="store_true", help="Apply every theme in THEMES")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--output", "-o", default=None,
+                        help="Variant root; writes <output>/<theme>/<asset> (default: tools/output/variants)")
+    args = parser.parse_args()
+
+    in_root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+    out_root = Path(args.output) if args.output else Path(__file__).parent / "output" / "variants"
+    themes = list(THEMES) if args.all_themes else args.theme
+    if not themes:
+        parser.error("pass --theme at least once, or --all-themes")
+    for theme in themes:
+        try:
+            theme_palette(theme)
+        except KeyError as e:
+            parser.error(e.args[0])
+
+    print("=" * 60)
+    print("Palette Recolor — Startup Simulator")
+    print(f"Themes: {', '.join(themes)}")
+    print(f"Output: {out_root}")
+    print("=" * 60)
+
+    ok, fail = 0, 0
+    for rel_path in args.assets:
+        try:
+            base = Image.open(in_root / rel_path)
+            base.load()
+        except Exception as e:
+            print(f"  ✗ {rel_path}: {e}")
+            fail += 1
+            continue
+        for theme, img in recolor_variants(base, themes).items():
+            out_path = out_root / theme / rel_path
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(out_path, "PNG")
+            print(f"  ✓ {theme}/{rel_path}")
+            ok += 1
+
+    print(f"\nDone: {ok} variants written, {fail} failed")
+    if fail:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Signed Distance Field Export for Startup Simulator
+Writes a small companion distance texture for each prop and character, so
+selection outlines, glows and soft drop shadows are one shader sample
+(game/shaders/sdf_outline.gdshader) instead of extra sprites or runtime blur.
+
+Pipeline per asset:
+1. Threshold alpha at full resolution.
+2. Exact Euclidean distance transform of the outside and of the inside
+   (Felzenszwalb-Huttenlocher lower envelope of parabolas, run separably
+   over columns then rows; every row is processed in lockstep as arrays).
+3. Signed distance in source pixels (negative inside, edge at 0), box
+   downsampled to --size and stored as 8-bit grey: 128 is the edge, 0 and
+   255 are -/+ SPREAD source pixels.
+
+Sign convention: the distance is negative inside the shape, positive outside
+and 0 on the alpha edge, so texels darker than 128 are inside. The edge lies
+half a pixel from the centres of the boundary pixels on either side.
+sdf_outline.gdshader decodes (v - 0.5) * 2 * spread and relies on this sign
+to put outlines and glow outside the sprite; do not flip it.
+
+Output sits next to the asset (tiles/tree.png → tiles/tree_sdf.png) and gets
+lossless import settings. All channels of a prop's RGBA are in use, so the
+field goes in its own texture rather than a spare channel.
+
+Usage:
+  python sdf.py                          # every prop and character in MANIFEST
+  python sdf.py tiles/bench.png --size 64 --spread 32
+"""
+
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+from generate_procedural import MANIFEST, asset_category, save_if_changed, summarize
+from godot_import import write_import_settings
+from pixel_cache import PixelCache
+
+SDF_SIZE = 128         # longest side of the written field, in px
+SPREAD = 64.0          # source px of distance from the edge to 0 / 255
+ALPHA_CUTOFF = 128     # alpha at or above this is inside
+SDF_SUFFIX = "_sdf"
+TARGETS = ("prop", "character")
+
+_FAR = 1e20            # "no feature" squared distance
+
+
+# ─── Exact EDT ───
+
+def _edt_rows(f):
+    """Squared 1-D distance transform of every row of f (R, n) at once.
+
+    f holds squared distances (0 at features, _FAR elsewhere, or the output
+    of a previous pass). Each row builds the lower envelope of the parabolas
+    rooted at its samples; rows advance in lockstep and only the rows that
+    still need to pop a parabola do work in the inner loop.
+    """
+    rows, n = f.shape
+    r = np.arange(rows)
+    v = np.zeros((rows, n), dtype=np.int64)           # parabola roots in the envelope
+    z = np.empty((rows, n + 1), dtype=np.float64)     # boundaries between them
+    z[:, 0], z[:, 1] = -np.inf, np.inf
+    k = np.zeros(rows, dtype=np.int64)
+
+    def intersect(q, idx, kk):
+        p = v[idx, kk]
+        return ((f[idx, q] + q * q) - (f[idx, p] + p * p)) / (2.0 * (q - p))
+
+    for q in range(1, n):
+        s = intersect(q, r, k)
+        pop = s <= z[r, k]
+        while pop.any():
+            idx = r[pop]
+            k[idx] -= 1
+            s[idx] = intersect(q, idx, k[idx])
+            pop[idx] = s[idx] <= z[idx, k[idx]]
+        k += 1
+        v[r, k] = q
+        z[r, k] = s
+        z[r, k + 1] = np.inf
+
+    out = np.empty_like(f)
+    k[:] = 0
+    for q in range(n):
+        move = z[r, k + 1] < q
+        while move.any():
+            k[move] += 1
+            move = z[r, k + 1] < q
+        p = v[r, k]
+        out[:, q] = (q - p) ** 2 + f[r, p]
+    return out
+
+
+def edt(features):
+    """Exact Euclidean distance from every pixel to the nearest True pixel."""
+    f = np.where(features, 0.0, _FAR)
+    f = _edt_rows(f.T).T          # columns
+    return np.sqrt(_edt_rows(f))  # then rows
+
+
+def signed_distance(inside):
+    """Signed distance in px to the edge between inside and outside (negative inside)."""
+    outside = edt(inside) - 0.5
+    inner = edt(~inside) - 0.5
+    return np.where(inside, -inner, outside).astype(np.float32)
+
+
+# ─── Field texture ───
+
+def sdf_image(rgba, size=SDF_SIZE, spread=SPREAD):
+    """8-bit grey field for an (h, w, 4) RGBA array; longest side is size."""
+    h, w = rgba.shape[:2]
+    d = signed_distance(np.asarray(rgba[..., 3]) >= ALPHA_CUTOFF)
+    scale = size / max(w, h)
+    out_size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    if out_size != (w, h):
+        d = np.asarray(Image.fromarray(d, "F").resize(out_size, Image.BOX))
+    encoded = np.clip(0.5 + d / (2.0 * spread), 0.0, 1.0) * 255.0 + 0.5
+    return Image.fromarray(encoded.astype(np.uint8), "L")
+
+
+def sdf_path(asset_path):
+    """tiles/tree.png → tiles/tree_sdf.png"""
+    asset_path = Path(asset_path)
+    return asset_path.with_name(asset_path.stem + SDF_SUFFIX + asset_path.suffix)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Export signed distance fields from asset alpha")
+    parser.add_argument("assets", nargs="*",
+                        help="Asset paths relative to --input (default: every prop and character in MANIFEST)")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--size", type=int, default=SDF_SIZE, help=f"Field resolution, longest side (default: {SDF_SIZE})")
+    parser.add_argument("--spread", type=float, default=SPREAD,
+                        help=f"Source px mapped to the full 0-255 half range (default: {SPREAD:g})")
+    args = parser.parse_args()
+
+    in_root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+    assets = args.assets or [k for k in MANIFEST if asset_category(k) in TARGETS]
+
+    print("=" * 60)
+    print("SDF Export — Startup Simulator")
+    print(f"Input: {in_root}  Size: {args.size}px  Spread: ±{args.spread:g}px")
+    print("=" * 60)
+
+    cache = PixelCache()
+    statuses, fail = [], 0
+    for rel_path in assets:
+        path = in_root / rel_path
+        try:
+            img = sdf_image(cache.pixels(path), args.size, args.spread)
+            out_path = sdf_path(path)
+            status = save_if_changed(img, out_path)
+            write_import_settings(out_path, sdf_path(rel_path).as_posix())
+            print(f"  ✓ {sdf_path(rel_path).as_posix()} ({img.size[0]}×{img.size[1]}, {status})")
+            statuses.append(status)
+        except Exception as e:
+            print(f"  ✗ {rel_path}: {e}")
+            fail += 1
+
+    print(f"\nDone: {len(statuses)} fields ({summarize(statuses)}), {fail} failed")
+    if fail:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
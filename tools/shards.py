@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Sharded Generation for Startup Simulator
+Splits asset generation across machines and merges the results.
+
+Both generators take `--shard i/N` (1-based). An asset belongs to shard
+1 + (sha256(rel_path) mod N), so the split depends only on the asset's own
+path: it is identical on every machine, and adding or removing assets never
+moves the others to a different shard.
+
+A shard run writes a partial asset tree plus shard-<i>-of-<N>.json listing
+every file it produced (asset and .import sidecar) with its sha256. `merge`
+checks that all N shards are present and agree, re-hashes every file, and
+only then copies the union of the assets into the final tree, staging
+each file beside the shard trees and renaming it into place. Shard
+sidecars are verified but not copied: each merged asset's sidecar is
+re-rendered in place by godot_import, which keeps the uid, [remap] and
+[deps] of the destination project.
+
+Usage:
+  python generate_procedural.py --shard 2/4           # on worker 2
+  python generate_sprites.py --shard 2/4 --provider google
+  python shards.py merge output/shards/procedural-*-of-4 -o ../game/assets
+"""
+
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+
+
+def parse_shard(text):
+    """"i/N" → (i, N); argparse type for --shard."""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {text!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be 1..{count}, got {index}")
+    return index, count
+
+
+def shard_of(rel_path, count):
+    """1-based shard that owns rel_path when split `count` ways."""
+    digest = hashlib.sha256(str(rel_path).encode()).digest()
+    return 1 + int.from_bytes(digest[:8], "big") % count
+
+
+def select(targets, shard):
+    """Subset of a {rel_path: ...} manifest owned by shard (i, N)."""
+    if shard is None:
+        return targets
+    index, count = shard
+    return {k: v for k, v in targets.items() if shard_of(k, count) == index}
+
+
+def default_root(tools_root, generator, shard):
+    """Partial-tree location used when a shard run has no --output."""
+    index, count = shard
+    return Path(tools_root) / "output" / "shards" / f"{generator}-{index}-of-{count}"
+
+
+def manifest_name(shard):
+    index, count = shard
+    return f"shard-{index}-of-{count}.json"
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_manifest(out_root, generator, shard, total, produced, failed=()):
+    """Record the files a shard produced under out_root; returns the manifest path.
+
+    produced are asset rel_paths; each asset's .import sidecar is listed too
+    when present. total is the size of the full (unsharded) manifest.
+    """
+    out_root = Path(out_root)
+    files = {}
+    for rel_path in sorted(produced):
+        for name in (rel_path, f"{rel_path}.import"):
+            path = out_root / name
+            if path.exists():
+                files[name] = {"sha256": file_sha256(path), "bytes": path.stat().st_size}
+    manifest = {
+        "generator": generator,
+        "shard": list(shard),
+        "total": total,
+        "assets": sorted(produced),
+        "failed": sorted(failed),
+        "files": files,
+    }
+    path = out_root / manifest_name(shard)
+    path.write_text(json.dumps(manifest, indent=2))
+    return path
+
+
+# ─── Merge ───
+
+def load_manifests(shard_dirs):
+    """[(dir, manifest)] for every shard-*.json found in shard_dirs."""
+    found = []
+    for d in map(Path, shard_dirs):
+        paths = sorted(d.glob("shard-*-of-*.json"))
+        if not paths:
+            raise ValueError(f"{d}: no shard manifest")
+        found.extend((d, json.loads(p.read_text())) for p in paths)
+    return found
+
+
+def verify(shards, allow_partial=False):
+    """Check shard manifests and file hashes; returns ({name: source path}, problems)."""
+    problems = []
+    generators = {m["generator"] for _, m in shards}
+    counts = {m["shard"][1] for _, m in shards}
+    if len(generators) > 1:
+        problems.append(f"shards come from different generators: {sorted(generators)}")
+    if len(counts) > 1:
+        problems.append(f"shards disagree on N: {sorted(counts)}")
+
+    seen = {}
+    for d, m in shards:
+        seen.setdefault(m["shard"][0], []).append(d)
+    for index, dirs in sorted(seen.items()):
+        if len(dirs) > 1:
+            problems.append(f"shard {index} given more than once: {', '.join(map(str, dirs))}")
+    count = max(counts) if counts else 0
+    missing = sorted(set(range(1, count + 1)) - set(seen))
+    if missing and not allow_partial:
+        problems.append(f"missing shards: {missing} of {count}")
+
+    sources, digests = {}, {}
+    for d, m in shards:
+        for rel_path in m["failed"]:
+            problems.append(f"{rel_path}: failed in shard {m['shard'][0]}")
+        for name, entry in m["files"].items():
+            path = d / name
+            if not path.exists():
+                problems.append(f"{name}: missing from {d}")
+                continue
+            actual = file_sha256(path)
+            if actual != entry["sha256"]:
+                problems.append(f"{name}: hash mismatch in {d}")
+                continue
+            if name in digests and digests[name] != actual:
+                problems.append(f"{name}: conflicting copies in {sources[name].parent} and {d}")
+                continue
+            digests[name], sources[name] = actual, path
+
+    totals = {m["total"] for _, m in shards}
+    if len(totals) > 1:
+        problems.append(f"shards disagree on manifest size: {sorted(totals)}")
+    elif not missing:
+        covered = {a for _, m in shards for a in m["assets"] + m["failed"]}
+        total = next(iter(totals))
+        if len(covered) != total:
+            problems.append(f"shards cover {len(covered)} assets, manifest has {total}")
+    return sources, problems
+
+
+def merge(sources, out_root):
+    """Copy verified assets into out_root; returns the count.
+
+    Each file is staged in a temporary directory beside the shard trees and
+    then renamed into place, so an interrupted merge never leaves partial
+    files where Godot scans for assets.
+
+    .import files are skipped: shards render them outside the Godot project,
+    so they have no uid or [deps] source_file. The destination's sidecars are
+    updated with write_import_settings instead.
+    """
+    from godot_import import write_import_settings  # godot_import → generate_procedural → shards
+
+    out_root = Path(out_root)
+    assets = sorted((name, Path(src)) for name, src in sources.items() if not name.endswith(".import"))
+    if not assets:
+        return 0
+    name, src = assets[0]
+    shard_root = src.parents[len(Path(name).parts) - 1]
+    copied = 0
+    with tempfile.TemporaryDirectory(prefix=".merge-", dir=shard_root.parent) as staging:
+        for name, src in assets:
+            dest = out_root / name
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = Path(staging) / f"{copied}{dest.suffix}"
+            shutil.copyfile(src, tmp)
+            tmp.replace(dest)
+            if dest.suffix == ".png":
+                write_import_settings(dest, name)
+            copied += 1
+    return copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge sharded generator output")
+    sub = parser.add_subparsers(dest="command", required=True)
+    m = sub.add_parser("merge", help="Verify shard trees and assemble the final asset tree")
+    m.add_argument("shards", nargs="+", help="Shard output directories")
+    m.add_argument("--output", "-o", default=None, help="Asset root (default: game/assets/ in repo)")
+    m.add_argument("--allow-partial", action="store_true", help="Merge even if some shards are missing")
+    m.add_argument("--dry-run", action="store_true", help="Verify only, write nothing")
+    args = parser.parse_args()
+
+    out_root = Path(args.output) if args.output else Path(__file__).parent.parent / "game" / "assets"
+
+    print("=" * 60)
+    print("Shard Merge — Startup Simulator")
+    print(f"Output: {out_root}")
+    print("=" * 60)
+
+    try:
+        shards = load_manifests(args.shards)
+    except ValueError as e:
+        print(f"  ✗ {e}")
+        sys.exit(1)
+    for d, manifest in shards:
+        index, count = manifest["shard"]
+        print(f"  {manifest['generator']} shard {index}/{count}: {len(manifest['assets'])} assets ({d})")
+
+    sources, problems = verify(shards, args.allow_partial)
+    if problems:
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        print(f"\nMerge aborted: {len(problems)} problems, nothing written")
+        sys.exit(1)
+
+    if args.dry_run:
+        print(f"\nVerified {len(sources)} files, nothing written (--dry-run)")
+        return
+    copied = merge(sources, out_root)
+    print(f"\n  ✓ Merged {copied} verified assets into {out_root}")
+
+
+if __name__ == "__main__":
+    main()
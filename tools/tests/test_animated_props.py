@@ -0,0 +1,19 @@
+import pytest
+
+import animated_props
+import generate_procedural as gp
+
+
+@pytest.mark.parametrize("rel_path", list(animated_props.ANIMATIONS))
+def test_frame_zero_is_static_asset(rel_path):
+    spec = animated_props.ANIMATIONS[rel_path]
+    sheet = animated_props.render_sheet(spec["rig"](), spec["frames"])
+    frame0 = sheet.crop((0, 0, gp.TILE, gp.TILE))
+    assert frame0.tobytes() == gp.generate(rel_path).tobytes()
+
+
+@pytest.mark.parametrize("rel_path", list(animated_props.ANIMATIONS))
+def test_frames_animate(rel_path):
+    spec = animated_props.ANIMATIONS[rel_path]
+    rig = spec["rig"]()
+    assert rig.draw(0.0).tobytes() != rig.draw(0.5).tobytes()
@@ -0,0 +1,77 @@
+import json
+import socket
+import threading
+import time
+from argparse import Namespace
+
+import pytest
+
+import batch_sprites as bs
+
+ONLY = ["tiles/tree.png", "tiles/bench.png"]
+
+
+@pytest.fixture
+def server():
+    """A fresh stand-in server per test, so its seeded failures do not depend on test order."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    threading.Thread(target=bs.serve, args=(port, 500.0, 0.4, 3), daemon=True).start()
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(200):                      # wait until it accepts connections
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.05).close()
+            return url
+        except OSError:
+            time.sleep(0.01)
+    pytest.fail("stand-in server did not start")
+
+
+def _args(server, out_root, **overrides):
+    args = dict(backend="local", server=server, variants=4, only=ONLY, output=str(out_root), name=None,
+                no_wait=False, poll_min=0.01, poll_max=0.05)
+    return Namespace(**{**args, **overrides})
+
+
+def _run(args):
+    try:
+        bs.run(args)
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def test_run_writes_checkpoints_and_resubmits_only_failures(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(bs, "JOBS_ROOT", tmp_path / "jobs")
+    out_root = tmp_path / "out"
+
+    assert _run(_args(server, out_root)) == 1
+    (job_dir,) = (tmp_path / "jobs").iterdir()
+    state = json.loads((job_dir / "state.json").read_text())
+    assert state["output"] == str(out_root.resolve())
+    assert state["received"] == state["total"] == 8 and state["state"] == "succeeded"
+    written, failed = set(state["written"]), set(state["failed"])
+    assert written and failed and not written & failed
+    assert written | failed == {f"variants/batch/tiles/{s}_v{k}.png" for s in ("tree", "bench") for k in range(1, 5)}
+    for key in written:
+        assert (out_root / key).is_file()
+        assert not (out_root / f"{key}.import").exists()       # not game/assets: no sidecars
+    mtimes = {key: (out_root / key).stat().st_mtime_ns for key in written}
+
+    _run(_args(server, out_root))
+    retried = {json.loads(line)["key"] for line in (job_dir / "retry1.jsonl").read_text().splitlines()}
+    assert retried == failed
+    state = json.loads((job_dir / "state.json").read_text())
+    assert state["attempt"] == 2 and written <= set(state["written"])
+    assert {key: (out_root / key).stat().st_mtime_ns for key in written} == mtimes
+
+
+def test_output_root_is_part_of_the_job(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(bs, "JOBS_ROOT", tmp_path / "jobs")
+    _run(_args(server, tmp_path / "a", variants=1, only=ONLY[:1], no_wait=True))
+    _run(_args(server, tmp_path / "b", variants=1, only=ONLY[:1], no_wait=True))
+    assert len(list((tmp_path / "jobs").iterdir())) == 2
+
+    _run(_args(server, tmp_path / "a", variants=1, only=ONLY[:1], no_wait=True, name="fixed"))
+    assert _run(_args(server, tmp_path / "b", variants=1, only=ONLY[:1], no_wait=True, name="fixed")) == 1
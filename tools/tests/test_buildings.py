@@ -0,0 +1,35 @@
+import json
+
+import generate_procedural as gp
+
+
+def _index(root):
+    data = json.loads((root / gp.BUILDING_INDEX).read_text())
+    return {rel_path for sizes in data["textures"].values() for rel_path in sizes.values()}
+
+
+def test_index_lists_exactly_the_textures_a_run_produced(tmp_path, monkeypatch):
+    footprints = gp.building_footprints()
+    only = [gp.building_path(*f) for f in footprints[:3]]
+    argv = ["generate_procedural.py", "--buildings", "--density", "8", "-o", str(tmp_path), "--only", *only]
+    monkeypatch.setattr("sys.argv", argv)
+    gp.main()
+
+    produced = {p.relative_to(tmp_path).as_posix() for p in (tmp_path / "buildings").glob("*.png")}
+    assert produced == set(only)
+    assert _index(tmp_path) == produced
+
+
+def test_index_drops_textures_removed_from_disk(tmp_path):
+    footprints = gp.building_footprints()[:2]
+    gp.generate_targets(gp.building_targets(footprints, density=8), tmp_path)
+    (tmp_path / gp.building_path(*footprints[0])).unlink()
+    gp.write_building_index(tmp_path, footprints, density=8)
+    assert _index(tmp_path) == {gp.building_path(*footprints[1])}
+
+
+def test_shard_index_lists_the_whole_shard_set(tmp_path):
+    footprints = gp.building_footprints()[:2]
+    listed = {gp.building_path(*f) for f in footprints}
+    gp.write_building_index(tmp_path, footprints, density=8, listed=listed)
+    assert _index(tmp_path) == listed
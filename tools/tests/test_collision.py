@@ -0,0 +1,65 @@
+import math
+import random
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+import collision
+
+
+def _blob(rng, size=64):
+    """RGBA image of a filled convex polygon (hole-free, one region)."""
+    img = Image.new("RGBA", (size, size))
+    points = [(rng.uniform(4, size - 4), rng.uniform(4, size - 4)) for _ in range(8)]
+    ImageDraw.Draw(img).polygon(collision._convex_hull(points), fill=(0, 0, 0, 255))
+    return img
+
+
+def _star(rng, n=12):
+    """Simple, generally non-convex polygon: random radii at increasing angles."""
+    return [(round(32 + rng.uniform(8, 30) * math.cos(2 * math.pi * i / n)),
+             round(32 + rng.uniform(8, 30) * math.sin(2 * math.pi * i / n))) for i in range(n)]
+
+
+def test_trace_outline_of_rectangle():
+    mask = np.zeros((6, 8), dtype=bool)
+    mask[1:4, 2:7] = True
+    assert collision.trace_outline(mask, (2, 1)) == [(2, 1), (7, 1), (7, 4), (2, 4)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_traced_outline_encloses_region_exactly(seed):
+    mask, _ = collision.alpha_mask(_blob(random.Random(seed)))
+    (start, count), = collision._regions(mask, 1)
+    outline = collision.trace_outline(mask, start)
+    assert abs(collision._area2(outline)) / 2 == count
+    assert collision._iou(mask, [outline]) == 1.0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_convex_pieces_tile_the_polygon(seed):
+    poly = _star(random.Random(seed))
+    pieces = collision.convex_decompose(poly)
+    assert all(collision._is_convex(p) for p in pieces)
+    assert sum(abs(collision._area2(p)) for p in pieces) == abs(collision._area2(poly))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_extract_meets_vertex_budget(seed):
+    report = collision.extract(_blob(random.Random(seed)), budget=6)
+    assert report["vertices"] <= 6
+    assert report["iou"] > 0.8
+
+
+def test_over_budget_exits_nonzero(tmp_path, monkeypatch):
+    (tmp_path / "tiles").mkdir()
+    img = Image.new("RGBA", (64, 64))
+    ImageDraw.Draw(img).ellipse((4, 4, 60, 60), fill=(0, 0, 0, 255))
+    img.save(tmp_path / "tiles" / "disc.png")
+    argv = ["collision.py", "tiles/disc.png", "-i", str(tmp_path), "--no-cache", "--budget", "2"]
+    monkeypatch.setattr("sys.argv", argv)
+    with pytest.raises(SystemExit) as exit_info:
+        collision.main()
+    assert exit_info.value.code == 1
+    assert (tmp_path / "tiles" / "disc.collision.json").exists()
@@ -0,0 +1,34 @@
+import numpy as np
+from PIL import Image
+
+import ground_synth as gsyn
+
+
+def _raw(path, origin, size, **kw):
+    raw = gsyn.write_raw(path, origin, size, "grass", **kw)
+    return np.fromfile(raw, dtype=np.uint8).reshape(size[1], size[0], 4)
+
+
+def test_bands_and_blocks_are_seamless(tmp_path):
+    whole = gsyn.synth_block(100, 40, 96, 64, "grass")
+    assert np.array_equal(_raw(tmp_path / "a", (100, 40), (96, 64), band=16, block=32), whole)
+    # uneven band/block sizes leave partial bands and blocks at the edges
+    assert np.array_equal(_raw(tmp_path / "b", (100, 40), (96, 64), band=23, block=41), whole)
+
+
+def test_adjacent_regions_line_up(tmp_path):
+    whole = gsyn.synth_block(0, 0, 96, 64, "dirt")
+    left = gsyn.synth_block(0, 0, 40, 64, "dirt")
+    right = gsyn.synth_block(40, 0, 56, 64, "dirt")
+    top = gsyn.synth_block(0, 0, 96, 30, "dirt")
+    bottom = gsyn.synth_block(0, 30, 96, 34, "dirt")
+    assert np.array_equal(np.concatenate([left, right], axis=1), whole)
+    assert np.array_equal(np.concatenate([top, bottom], axis=0), whole)
+
+
+def test_tiles_reassemble_to_the_region(tmp_path):
+    out = tmp_path / "tiles"
+    assert gsyn.write_tiles(out, (0, 0), (64, 48), "sand", tile=32) == 4
+    rows = [np.concatenate([np.asarray(Image.open(out / f"{tx}_{ty}.png")) for tx in range(2)], axis=1)
+            for ty in range(2)]
+    assert np.array_equal(np.concatenate(rows, axis=0), gsyn.synth_block(0, 0, 64, 48, "sand"))
@@ -0,0 +1,91 @@
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+import bench_sprites as bs
+import generate_sprites as gs
+
+ASSETS = Path(__file__).resolve().parent.parent.parent / "game" / "assets"
+
+
+class Gate:
+    """FakeLatency stand-in: a sprite's provider call blocks until the test opens it.
+
+    run_hybrid names each call's thread "sprite:<rel_path>".
+    """
+    total = longest = 0.0
+
+    def __init__(self):
+        self._events = {}
+        self._lock = threading.Lock()
+
+    def _event(self, rel_path):
+        with self._lock:
+            return self._events.setdefault(rel_path, threading.Event())
+
+    def open(self, rel_path):
+        self._event(rel_path).set()
+
+    def wait(self):
+        self._event(threading.current_thread().name.removeprefix("sprite:")).wait()
+        return 0.0
+
+    def open_all(self):
+        with self._lock:
+            for event in self._events.values():
+                event.set()
+
+
+def _jobs(only, latency):
+    jobs = bs.sprite_jobs("google", only)
+    payloads, _, _ = bs.load_payloads(jobs, "google", Path("/nonexistent"), ASSETS)
+    client = bs.make_client("google", payloads, latency)
+    return client, {f"{c}/{f}": (c, f, p, a) for c, f, p, a in jobs}
+
+
+def _stale(out_root, rel_path):
+    path = out_root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGBA", (4, 4), (1, 2, 3, 255)).save(path)
+    return path
+
+
+def test_fallback_replaces_stale_asset(tmp_path):
+    gate = Gate()
+    client, jobs = _jobs(["tiles/bench.png"], gate)
+    path = _stale(tmp_path, "tiles/bench.png")
+    outcomes = gs.run_hybrid(client, jobs, tmp_path, "google", deadline=0.05, budget=0.2)
+    gate.open_all()
+    assert outcomes["tiles/bench.png"] == ("procedural", "changed")
+    assert Image.open(path).size == (gs.FALLBACK_SIZE, gs.FALLBACK_SIZE)
+
+
+def test_keep_existing_leaves_asset(tmp_path):
+    gate = Gate()
+    client, jobs = _jobs(["tiles/bench.png"], gate)
+    path = _stale(tmp_path, "tiles/bench.png")
+    outcomes = gs.run_hybrid(client, jobs, tmp_path, "google", deadline=0.05, budget=0.2, keep_existing=True)
+    gate.open_all()
+    assert outcomes["tiles/bench.png"] == ("procedural", "kept")
+    assert Image.open(path).size == (4, 4)
+
+
+def test_late_result_replaces_fallback(tmp_path, monkeypatch):
+    # Each provider call is let through only once its sprite has fallen back,
+    # so every result is late however slow the machine is
+    gate = Gate()
+    client, jobs = _jobs(["tiles/bench.png", "tiles/fence.png"], gate)
+    fell_back = []
+    write_fallback = gs._write_fallback
+
+    def fallback_then_release(rel_path, *args):
+        status = write_fallback(rel_path, *args)
+        fell_back.append(rel_path)
+        gate.open(rel_path)
+        return status
+
+    monkeypatch.setattr(gs, "_write_fallback", fallback_then_release)
+    outcomes = gs.run_hybrid(client, jobs, tmp_path, "google", deadline=0.01, budget=60)
+    assert fell_back == ["tiles/bench.png", "tiles/fence.png"]
+    assert {source for source, _ in outcomes.values()} == {"ai"}
@@ -0,0 +1,31 @@
+import numpy as np
+
+import generate_procedural as gp
+
+
+def test_same_seed_same_pixels():
+    a = gp.as_array(gp.generate("tree", seed=7))
+    assert np.array_equal(a, gp.as_array(gp.generate("tiles/tree.png", seed=7)))
+    assert not np.array_equal(a, gp.as_array(gp.generate("tree", seed=8)))
+
+
+def test_size_resamples_to_requested_dimensions():
+    assert gp.generate("bench", size=64).size == (64, 64)
+    assert gp.generate("player", size=(48, 96)).size == (48, 96)
+    assert gp.generate("bench").size == (gp.TILE, gp.TILE)
+
+
+def test_generate_many_matches_sequential_generate():
+    specs = ["tiles/bench.png", {"name": "player", "size": 64}, {"name": "tree", "seed": 3}]
+    batch = list(gp.generate_many(specs, seed=5))
+    assert [rel_path for rel_path, _ in batch] == ["tiles/bench.png", "characters/player.png", "tiles/tree.png"]
+    expected = [gp.generate("bench", seed=5), gp.generate("player", seed=5, size=64), gp.generate("tree", seed=3)]
+    for (_, img), want in zip(batch, expected):
+        assert np.array_equal(gp.as_array(img), gp.as_array(want))
+
+
+def test_as_array_is_a_read_only_view():
+    img = gp.generate("bench", size=16)
+    arr = gp.as_array(img)
+    assert arr.shape == (16, 16, 4) and not arr.flags.writeable
+    assert bytes(gp.as_buffer(img)) == img.tobytes()
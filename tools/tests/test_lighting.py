@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+import lighting
+from generate_procedural import generate
+
+
+@pytest.mark.parametrize("name", ["tiles/tree.png", "tiles/bench.png", "tiles/wall_brick.png", "tiles/ground.png"])
+def test_ao_darkens_opaque_pixels(name):
+    rgba = np.asarray(generate(name).convert("RGBA"))[None]
+    lit = lighting.light_stack(rgba)
+    unoccluded = lighting.light_stack(rgba, {**lighting.LIGHTING, "ao_strength": 0.0})
+
+    opaque = rgba[0, ..., 3] == 255
+    darkening = unoccluded[0, ..., :3].astype(int) - lit[0, ..., :3]
+    assert (darkening >= 0).all()
+    changed = darkening.max(axis=-1)[opaque] > 0
+    assert changed.mean() > 0.2
+    assert darkening.max() >= 16
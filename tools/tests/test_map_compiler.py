@@ -0,0 +1,69 @@
+import numpy as np
+
+import map_compiler as mc
+
+
+class ReferenceStream(mc.GodotRNG):
+    """pcg32-demo's stream: initstate 42, initseq 54.
+
+    Godot's RandomNumberGenerator.seed calls the same pcg32_srandom_r with
+    PCG_DEFAULT_INC_64 as the sequence, so swapping INC reproduces the
+    reference implementation's published output.
+    """
+    INC = 54
+
+
+PCG32_DEMO = [0xA15C02B7, 0x7B47F409, 0xBA1D3330, 0x83D2F293, 0xBFA4784B, 0xCBED606E]
+
+
+def test_pcg32_core_matches_reference_vector():
+    rng = ReferenceStream(42)
+    assert [rng.rand() for _ in PCG32_DEMO] == PCG32_DEMO
+
+
+def test_randf_follows_random_pcg():
+    # RandomPCG::randf: ldexpf((float)(rand() | 0x80000001), -32 - clz(first rand()));
+    # the uint32 → float32 conversion rounds to nearest, keeping 24 bits
+    rng = ReferenceStream(42)
+    assert rng.randf() == 0xFB47F4 / 2**24      # 0xFB47F409, low byte rounds down
+    assert rng.randf() == 0x83D2F3 / 2**24      # 0x83D2F293, low byte rounds up
+
+
+def test_randi_range_follows_random_pcg():
+    # pcg32_boundedrand_r(bound) + min; rejection threshold 2^32 mod bound
+    rng = ReferenceStream(42)
+    assert rng.randi_range(0, 9) == 0xA15C02B7 % 10
+    assert rng.randi_range(2, -2) == 0x7B47F409 % 5 - 2
+    assert rng.randi_range(5, 5) == 5                      # draws nothing
+    assert rng.randi_range(0, 9) == 0xBA1D3330 % 10
+
+
+def test_godot_seeding_uses_default_increment():
+    rng = mc.GodotRNG(42)
+    assert rng.inc == (1442695040888963407 << 1 | 1) & mc.GodotRNG.MASK
+    again = mc.GodotRNG(42)
+    assert [rng.rand() for _ in range(8)] == [again.rand() for _ in range(8)]
+
+
+def test_encode_decode_round_trip():
+    layout = mc.LAYOUTS["indiranagar"]
+    grid, buildings, props, spawns = mc.compile_map(layout)
+    data = mc.encode(grid, buildings, props, spawns, layout["seed"])
+    assert data[:4] == mc.MAGIC and mc.HEADER.size == 22
+    grid2, buildings2, props2, spawns2, seed = mc.decode(data)
+    assert np.array_equal(grid2, grid)
+    assert (buildings2, props2, spawns2, seed) == (buildings, props, spawns, layout["seed"])
+
+
+def test_committed_map_is_current():
+    layout = mc.LAYOUTS["indiranagar"]
+    path = mc.REPO_ROOT / "game" / "resources" / "maps" / "indiranagar.ssmap"
+    assert path.read_bytes() == mc.encode(*mc.compile_map(layout), layout["seed"])
+
+
+def test_spawns_come_from_the_scene_script():
+    requested = mc.world_spawns(mc.REPO_ROOT / "game" / "scripts" / "world.gd")
+    assert requested["player"] == (5, 23)
+    assert set(requested) == {"player", "alex", "jordan", "maya", "sam", "priya"}
+    _, _, _, spawns = mc.compile_map(mc.LAYOUTS["indiranagar"])
+    assert {name: src for name, (_, src) in spawns.items()} == requested
@@ -0,0 +1,48 @@
+import os
+import time
+
+from PIL import Image
+
+import pixel_cache
+from pixel_cache import PixelCache, STALE_PART_S
+
+
+def test_prune_keeps_fresh_temp_files(tmp_path):
+    png = tmp_path / "a.png"
+    Image.new("RGBA", (4, 4), (1, 2, 3, 255)).save(png)
+    cache = PixelCache(tmp_path / "cache")
+    cache.pixels(png)
+
+    fresh = cache.root / "writing.part"
+    stale = cache.root / "crashed.part"
+    fresh.write_bytes(b"x")
+    stale.write_bytes(b"x")
+    old = time.time() - STALE_PART_S - 60
+    os.utime(stale, (old, old))
+
+    cache.prune([png])
+    assert fresh.exists()
+    assert not stale.exists()
+    assert cache.pixels(png).shape == (4, 4, 4)
+
+
+def test_changed_source_invalidates_and_unchanged_hits(tmp_path, monkeypatch):
+    png = tmp_path / "a.png"
+    Image.new("RGBA", (4, 4), (1, 2, 3, 255)).save(png)
+    PixelCache(tmp_path / "cache").pixels(png)
+
+    hashed = []
+    real_hash = pixel_cache.source_hash
+    monkeypatch.setattr(pixel_cache, "source_hash", lambda path: hashed.append(path) or real_hash(path))
+
+    # A fresh process: the stamp matches, so no rehash and a cache hit
+    cache = PixelCache(tmp_path / "cache")
+    assert cache.pixels(png)[0, 0].tolist() == [1, 2, 3, 255]
+    assert (cache.hits, cache.misses, hashed) == (1, 0, [])
+
+    Image.new("RGBA", (4, 4), (9, 9, 9, 255)).save(png)
+    later = time.time() + 5
+    os.utime(png, (later, later))
+    cache = PixelCache(tmp_path / "cache")
+    assert cache.pixels(png)[0, 0].tolist() == [9, 9, 9, 255]
+    assert (cache.hits, cache.misses, len(hashed)) == (0, 1, 1)
@@ -0,0 +1,33 @@
+import numpy as np
+
+import prop_instances as pi
+
+
+def _apply(row, u, v):
+    """Godot's TRANSFORM_2D buffer layout applied to a local point (u, v)."""
+    return (row[0] * u + row[1] * v + row[3], row[4] * u + row[5] * v + row[7])
+
+
+def test_plain_instance_round_trips_the_buffer_layout():
+    buf = pi.instance_buffer([(3, 5)], 0, seed=42, tile_size=320)
+    _, _, _, buffers = pi.decode(pi.encode(10, 8, 42, {0: buf}, jitter=False, tile_size=320))
+    row = buffers[0][0]
+    assert row.tolist() == [320, 0, 0, 3.5 * 320, 0, 320, 0, 5.5 * 320, 1, 1, 1, 1]
+    assert _apply(row, 0.5, 0.5) == (4 * 320, 6 * 320)        # unit quad corner → cell corner
+
+
+def test_jittered_instance_is_a_rotation_and_scale_about_the_cell_centre():
+    tree = pi.map_compiler.TILE_TYPES.index("TREE")
+    cells = [(0, 0), (7, 2), (3, 9)]
+    buf = pi.instance_buffer(cells, tree, seed=7, jitter=True)
+    width, height, seed, buffers = pi.decode(pi.encode(10, 10, 7, {tree: buf}, jitter=True))
+    assert (width, height, seed) == (10, 10, 7)
+    out = buffers[tree]
+    assert out.shape == (3, pi.FLOATS_PER_INSTANCE) and np.array_equal(out, buf)
+    for row, (x, y) in zip(out, sorted(cells, key=lambda c: (c[1], c[0]))):
+        assert row[2] == row[6] == 0
+        assert (row[3], row[7]) == ((x + 0.5) * pi.TILE_SIZE, (y + 0.5) * pi.TILE_SIZE)
+        assert np.isclose(row[0], row[5]) and np.isclose(row[1], -row[4])   # no shear
+        scale = np.hypot(row[0], row[4]) / pi.TILE_SIZE
+        assert abs(scale - 1) <= pi.JITTER["foliage"]["scale"] + 1e-6
+        assert ((0 <= row[8:12]) & (row[8:12] <= 1)).all() and row[11] == 1
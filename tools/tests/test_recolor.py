@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+import recolor
+from generate_procedural import PAL
+
+
+@pytest.mark.parametrize("theme", list(recolor.THEMES) + ["dusk+rival_blue"])
+def test_palette_entries_map_exactly(theme):
+    keys = list(PAL)
+    swatch = np.array([[PAL[k] + (255,) for k in keys]], dtype=np.uint8)
+    out = np.asarray(recolor.recolor(Image.fromarray(swatch, "RGBA"), theme))
+    target = recolor.theme_palette(theme)
+    for i, key in enumerate(keys):
+        assert tuple(out[0, i, :3]) == target[key], key
+    assert (out[..., 3] == 255).all()
+
+
+def test_other_colours_go_through_lut():
+    img = Image.new("RGB", (1, 1), (3, 250, 7))
+    assert recolor.recolor(img, "night").getpixel((0, 0)) == img.filter(recolor.theme_lut("night")).getpixel((0, 0))
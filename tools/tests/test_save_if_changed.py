@@ -0,0 +1,41 @@
+import os
+
+from PIL import Image
+
+from generate_procedural import pixel_digest, save_if_changed
+
+
+def _image(pixel=(10, 20, 30, 255)):
+    img = Image.new("RGBA", (8, 8), (200, 100, 50, 255))
+    img.putpixel((3, 4), pixel)
+    return img
+
+
+def test_identical_pixels_are_not_rewritten(tmp_path):
+    path = tmp_path / "a.png"
+    assert save_if_changed(_image(), path) == "new"
+    # Same pixels with a different PNG encoding still count as unchanged
+    _image().save(path, "PNG", compress_level=0)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    before = path.read_bytes()
+
+    assert save_if_changed(_image(), path) == "unchanged"
+    assert path.stat().st_mtime_ns == 1_000_000_000
+    assert path.read_bytes() == before
+
+
+def test_one_pixel_change_rewrites(tmp_path):
+    path = tmp_path / "a.png"
+    save_if_changed(_image(), path)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert save_if_changed(_image((10, 20, 31, 255)), path) == "changed"
+    assert path.stat().st_mtime_ns != 1_000_000_000
+    with Image.open(path) as saved:
+        assert saved.getpixel((3, 4)) == (10, 20, 31, 255)
+
+
+def test_digest_covers_size_and_pixels():
+    assert pixel_digest(_image()) == pixel_digest(_image().convert("RGBA"))
+    assert pixel_digest(_image()) != pixel_digest(_image((0, 0, 0, 0)))
+    assert pixel_digest(Image.new("RGBA", (2, 8))) != pixel_digest(Image.new("RGBA", (8, 2)))
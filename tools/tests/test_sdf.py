@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import sdf
+
+
+def _brute_edt(features):
+    ys, xs = np.nonzero(features)
+    gy, gx = np.mgrid[:features.shape[0], :features.shape[1]]
+    d2 = (gy[..., None] - ys) ** 2 + (gx[..., None] - xs) ** 2
+    return np.sqrt(d2.min(axis=2))
+
+
+@pytest.mark.parametrize("seed, density", [(0, 0.02), (1, 0.1), (2, 0.5), (3, 0.9)])
+def test_edt_matches_brute_force(seed, density):
+    features = np.random.default_rng(seed).random((23, 31)) < density
+    features[0, 0] = True
+    assert np.allclose(sdf.edt(features), _brute_edt(features), rtol=0, atol=1e-9)
+
+
+def test_signed_distance_is_negative_inside():
+    inside = np.zeros((9, 9), dtype=bool)
+    inside[2:7, 2:7] = True
+    d = sdf.signed_distance(inside)
+    assert (d[inside] < 0).all() and (d[~inside] > 0).all()
+    assert d[4, 4] == -2.5                  # 3 px to the nearest outside pixel, edge half-way
+    assert d[4, 0] == 1.5
+
+    rgba = np.zeros((9, 9, 4), dtype=np.uint8)
+    rgba[..., 3] = inside * 255
+    field = np.asarray(sdf.sdf_image(rgba, size=9, spread=4.0))
+    assert (field[inside] < 128).all() and (field[~inside] > 128).all()
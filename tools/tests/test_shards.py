@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from PIL import Image
+
+import shards
+from godot_import import write_import_settings
+
+
+def test_merge_keeps_destination_sidecars(tmp_path):
+    project = tmp_path / "game"
+    (project / "assets" / "tiles").mkdir(parents=True)
+    (project / "project.godot").write_text("")
+    dest = project / "assets" / "tiles" / "tree.png"
+    Image.new("RGBA", (8, 8)).save(dest)
+    write_import_settings(dest, "tiles/tree.png")
+    sidecar = dest.with_name("tree.png.import")
+    sidecar.write_text(sidecar.read_text().replace('[remap]\n', '[remap]\n\nuid="uid://keepme"\n', 1))
+
+    shard_root = tmp_path / "shard"
+    (shard_root / "tiles").mkdir(parents=True)
+    for name in ("tree.png", "bench.png"):
+        Image.new("RGBA", (8, 8), (0, 255, 0, 255)).save(shard_root / "tiles" / name)
+        write_import_settings(shard_root / "tiles" / name, f"tiles/{name}")
+    shards.write_manifest(shard_root, "procedural", (1, 1), 2, ["tiles/tree.png", "tiles/bench.png"])
+
+    sources, problems = shards.verify(shards.load_manifests([shard_root]))
+    assert not problems
+    assert shards.merge(sources, project / "assets") == 2
+
+    assert 'uid="uid://keepme"' in sidecar.read_text()
+    bench = (project / "assets" / "tiles" / "bench.png.import").read_text()
+    assert 'source_file="res://assets/tiles/bench.png"' in bench
+
+
+def test_merge_stages_outside_the_project(tmp_path, monkeypatch):
+    shard_root = tmp_path / "shards" / "procedural-1-of-1"
+    (shard_root / "tiles").mkdir(parents=True)
+    Image.new("RGBA", (8, 8)).save(shard_root / "tiles" / "tree.png")
+    shards.write_manifest(shard_root, "procedural", (1, 1), 1, ["tiles/tree.png"])
+    sources, _ = shards.verify(shards.load_manifests([shard_root]))
+
+    out_root = tmp_path / "assets"
+    staged = []
+    real_copy = shards.shutil.copyfile
+    monkeypatch.setattr(shards.shutil, "copyfile", lambda src, dst: staged.append(Path(dst)) or real_copy(src, dst))
+    assert shards.merge(sources, out_root) == 1
+
+    assert all(out_root not in path.parents for path in staged)
+    assert all(path.parent.parent == shard_root.parent for path in staged)
+    assert not list(out_root.rglob("*.part"))
+    assert not list(shard_root.parent.glob(".merge-*"))
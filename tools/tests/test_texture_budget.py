@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from PIL import Image
+
+import texture_budget as tb
+from pixel_cache import PixelCache
+
+
+def test_mip_chain_bytes():
+    assert tb.vram_bytes(8, 8, False, False, False) == 8 * 8 * 4
+    assert tb.vram_bytes(8, 8, False, False, True) == (64 + 16 + 4 + 1) * 4
+    assert tb.vram_bytes(8, 8, True, False, True) == (64 + 16 + 4 + 1) * 3
+    # Non-square chains stop at 1×1; the short side stays at 1 meanwhile
+    assert tb.vram_bytes(8, 2, False, False, True) == (16 + 4 + 2 + 1) * 4
+    # Block formats round every level up to whole 4×4 blocks
+    assert tb.vram_bytes(8, 8, True, True, False) == 4 * 8
+    assert tb.vram_bytes(8, 8, True, True, True) == (4 + 1 + 1 + 1) * 8
+    assert tb.vram_bytes(8, 8, False, True, True) == (4 + 1 + 1 + 1) * 16
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    root = tmp_path / "assets"
+    (root / "tiles").mkdir(parents=True)
+    Image.new("RGBA", (64, 64), (90, 140, 60, 255)).save(root / "tiles" / "ground.png")
+    prop = Image.new("RGBA", (64, 64))
+    prop.paste((30, 90, 30, 255), (16, 16, 48, 48))
+    prop.save(root / "tiles" / "tree.png")
+    monkeypatch.setattr(tb, "PixelCache", lambda: PixelCache(tmp_path / "cache"))
+    return root
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr("sys.argv", ["texture_budget.py", *args])
+    tb.main()
+
+
+def test_report_within_budget(tree, tmp_path, monkeypatch):
+    report = tmp_path / "report.json"
+    _run(monkeypatch, "-i", str(tree), "--json", str(report))
+    data = json.loads(report.read_text())
+    rows = {row["asset"]: row for row in data["assets"]}
+    assert rows["tiles/ground.png"]["opaque"]
+    assert rows["tiles/tree.png"]["transparent"] == 0.75
+    # ground defaults to VRAM-compressed with mipmaps
+    assert rows["tiles/ground.png"]["effective"] == tb.vram_bytes(64, 64, True, True, True)
+    assert data["used_bytes"]["total"] == sum(row["effective"] for row in rows.values())
+
+
+def test_over_budget_exits_nonzero(tree, monkeypatch, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        _run(monkeypatch, "-i", str(tree), "--budget", "prop=0.001")
+    assert exit_info.value.code == 1
+    assert "✗ prop:" in capsys.readouterr().out
@@ -0,0 +1,52 @@
+import re
+
+import pytest
+from PIL import Image
+
+import tileset
+from map_compiler import REPO_ROOT, TILE_TYPES, WALKABLE
+from pixel_cache import PixelCache
+
+
+def _sources(text):
+    """{source id: atlas source sub_resource body} from a tiles.tres text."""
+    bodies = dict(re.findall(r'\[sub_resource type="TileSetAtlasSource" id="(\w+)"\]\n(.*?)(?:\n\n|\Z)', text, re.S))
+    return {int(i): bodies[sub] for i, sub in re.findall(r'sources/(\d+) = SubResource\("(\w+)"\)', text)}
+
+
+def _check_shapes(text):
+    sources = _sources(text)
+    assert sorted(sources) == list(range(len(TILE_TYPES)))
+    for tile_type, body in sources.items():
+        navigation = "navigation_layer_0/polygon" in body
+        physics = "physics_layer_0/polygon_0/points" in body
+        assert (navigation, physics) == ((True, False) if tile_type in WALKABLE else (False, True)), TILE_TYPES[tile_type]
+
+
+@pytest.fixture
+def tiles(tmp_path):
+    (tmp_path / "tiles").mkdir()
+    for tile_type, name in enumerate(TILE_TYPES):
+        img = Image.new("RGBA", (32, 32), (90, 140, 60, 255) if tile_type in WALKABLE else (0, 0, 0, 0))
+        if tile_type not in WALKABLE:
+            img.paste((120, 80, 40, 255), (8, 8, 24, 24))
+        img.save(tmp_path / "tiles" / f"{name.lower()}.png")
+    return tmp_path
+
+
+def test_walkable_tiles_navigate_and_others_collide(tiles, tmp_path):
+    text, rows = tileset.build_tileset(tiles, cache=PixelCache(tmp_path / "cache"))
+    _check_shapes(text)
+    tree = _sources(text)[TILE_TYPES.index("TREE")]
+    # The 16px square, centred on the 32px cell
+    assert "PackedVector2Array(-8, -8, 8, -8, 8, 8, -8, 8)" in tree
+
+
+def test_blank_solid_tile_is_an_error(tiles, tmp_path):
+    Image.new("RGBA", (32, 32)).save(tiles / "tiles" / "bench.png")
+    with pytest.raises(ValueError, match="bench.png"):
+        tileset.build_tileset(tiles, cache=PixelCache(tmp_path / "cache"))
+
+
+def test_committed_tileset_shapes():
+    _check_shapes((REPO_ROOT / "game" / "resources" / "tiles.tres").read_text())
@@ -0,0 +1,42 @@
+import generate_procedural as gp
+
+SOURCE = '''
+import functools
+SEED = 1
+def _leaf(): return 1
+def _other(): return 2
+HELPERS = [_leaf]
+def gen_listed(): return HELPERS[0]()
+def gen_bound(w=1): return _other() * w
+MANIFEST = {"listed.png": gen_listed, "bound.png": functools.partial(gen_bound, w=2)}
+'''
+
+
+def _fingerprints(tmp_path, source):
+    path = tmp_path / "gen.py"
+    path.write_text(source)
+    return gp.asset_fingerprints(gp._load_fresh(path))
+
+
+def test_fingerprint_follows_containers_and_partials(tmp_path):
+    base = _fingerprints(tmp_path, SOURCE)
+    assert _fingerprints(tmp_path, SOURCE) == base
+
+    leaf = _fingerprints(tmp_path, SOURCE.replace("return 1", "return 3"))
+    assert leaf["listed.png"] != base["listed.png"]
+    assert leaf["bound.png"] == base["bound.png"]
+
+    other = _fingerprints(tmp_path, SOURCE.replace("return 2", "return 3"))
+    assert other["bound.png"] != base["bound.png"]
+    assert other["listed.png"] == base["listed.png"]
+
+    bound = _fingerprints(tmp_path, SOURCE.replace("w=2)", "w=4)"))
+    assert bound["bound.png"] != base["bound.png"]
+
+
+def test_building_targets_fingerprint_their_roof_helpers():
+    footprints = [("wall_brick", 2, 3), ("wall_brick", 3, 3)]
+    targets = gp.building_targets(footprints)
+    prints = gp.asset_fingerprints(gp, targets)
+    assert len(set(prints.values())) == 2
+    assert gp.asset_fingerprints(gp, targets) == prints
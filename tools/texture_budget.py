@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Texture Budget Report for Startup Simulator
+Scans game/assets and reports what every texture costs on disk and in VRAM.
+
+Per asset: dimensions, PNG bytes on disk, share of fully transparent pixels,
+and estimated VRAM four ways — uncompressed / VRAM-compressed, each with and
+without mipmaps — plus the "effective" figure for the import settings the
+asset actually has (its .import sidecar, or godot_import's category default).
+
+VRAM model (what Godot 4 uploads on desktop; mobile ETC2 sizes are the same):
+- uncompressed: RGBA8, or RGB8 when the texture has no transparency
+- VRAM compressed: BC1/ETC2 RGB (8 bytes per 4×4 block) when opaque,
+  BC3/ETC2 RGBA (16 bytes per block) when it has alpha
+- mipmaps: every level down to 1×1
+
+Budgets (MiB of effective VRAM per category, plus totals) are in BUDGETS and
+can be overridden with --budget. Any overrun exits 1 with a breakdown of
+the biggest assets in the offending category and what would shrink them.
+
+Usage:
+  python texture_budget.py
+  python texture_budget.py --budget prop=8 --budget total=32 --json report.json
+"""
+
+import sys
+import json
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+from generate_procedural import asset_category
+from godot_import import COMPRESS_VRAM, import_params, read_params
+from pixel_cache import PixelCache
+
+MIB = 2**20
+
+# MiB; "total" is effective VRAM over all assets, "disk" is PNG bytes on disk
+BUDGETS = {
+    "ground": 8,
+    "building": 12,    # footprint textures (buildings/) plus the tiles/wall* fallbacks
+    "prop": 16,
+    "character": 8,
+    "ui": 4,
+    "sdf": 2,
+    "total": 40,
+    "disk": 48,
+}
+
+
+# ─── VRAM estimates ───
+
+def _levels(w, h, mipmaps):
+    yield w, h
+    while mipmaps and (w, h) != (1, 1):
+        w, h = max(1, w // 2), max(1, h // 2)
+        yield w, h
+
+
+def vram_bytes(w, h, opaque, compressed, mipmaps):
+    """Estimated VRAM for one texture (see module docstring for the model)."""
+    total = 0
+    for lw, lh in _levels(w, h, mipmaps):
+        if compressed:
+            total += -(-lw // 4) * -(-lh // 4) * (8 if opaque else 16)
+        else:
+            total += lw * lh * (3 if opaque else 4)
+    return total
+
+
+def effective_params(png_path, rel_path):
+    """(compressed, mipmaps, size_limit) from the .import sidecar, else category defaults."""
+    import_path = Path(f"{png_path}.import")
+    params = read_params(import_path) if import_path.exists() else import_params(rel_path)
+    return (int(params.get("compress/mode", 0)) == COMPRESS_VRAM,
+            str(params.get("mipmaps/generate", "false")) == "true",
+            int(params.get("process/size_limit", 0)))
+
+
+def measure(png_path, rel_path, cache):
+    rgba = cache.pixels(png_path)
+    h, w = rgba.shape[:2]
+    alpha = rgba[..., 3]
+    opaque = bool(alpha.min() == 255)
+    compressed, mipmaps, size_limit = effective_params(png_path, rel_path)
+    ew, eh = w, h
+    if size_limit and max(w, h) > size_limit:
+        scale = size_limit / max(w, h)
+        ew, eh = max(1, round(w * scale)), max(1, round(h * scale))
+    return {
+        "asset": rel_path,
+        "category": asset_category(rel_path),
+        "size": [w, h],
+        "disk": png_path.stat().st_size,
+        "transparent": round(float(np.count_nonzero(alpha == 0)) / alpha.size, 4),
+        "opaque": opaque,
+        "vram": {
+            "raw": vram_bytes(w, h, opaque, False, False),
+            "raw_mips": vram_bytes(w, h, opaque, False, True),
+            "compressed": vram_bytes(w, h, opaque, True, False),
+            "compressed_mips": vram_bytes(w, h, opaque, True, True),
+        },
+        "import": {"compressed": compressed, "mipmaps": mipmaps, "size_limit": size_limit},
+        "effective": vram_bytes(ew, eh, opaque, compressed, mipmaps),
+    }
+
+
+# ─── Budgets ───
+
+def check_budgets(rows, budgets):
+    """(over, used): [(name, used bytes, budget bytes)] for each exceeded budget, and usage by name."""
+    used = {}
+    for row in rows:
+        used[row["category"]] = used.get(row["category"], 0) + row["effective"]
+    used["total"] = sum(row["effective"] for row in rows)
+    used["disk"] = sum(row["disk"] for row in rows)
+    return [(name, used.get(name, 0), limit * MIB) for name, limit in budgets.items()
+            if used.get(name, 0) > limit * MIB], used
+
+
+def advice(row):
+    """Cheapest ways to shrink one asset's effective VRAM."""
+    tips = []
+    if not row["import"]["compressed"] and row["category"] != "sdf":   # distance fields stay lossless
+        tips.append(f"VRAM compression → {row['vram']['compressed'] / MIB:.2f} MiB")
+    if row["transparent"] >= 0.5:
+        tips.append(f"{row['transparent']:.0%} transparent: trim or pack into an atlas")
+    if max(row["size"]) > 512:
+        w, h = row["size"]
+        half = vram_bytes(w // 2, h // 2, row["opaque"], row["import"]["compressed"], row["import"]["mipmaps"])
+        tips.append(f"halve to {w // 2}×{h // 2} → {half / MIB:.2f} MiB")
+    return "; ".join(tips)
+
+
+def print_table(rows):
+    print(f"  {'asset':<30} {'size':>9} {'disk':>8} {'transp':>6} "
+          f"{'raw':>7} {'raw+mip':>7} {'vram':>7} {'vram+mip':>8} {'effective':>9}")
+    for row in sorted(rows, key=lambda r: (r["category"], r["asset"])):
+        v = row["vram"]
+        print(f"  {row['asset']:<30} {row['size'][0]:>4}×{row['size'][1]:<4} {row['disk'] / 1024:>6.0f}Ki "
+              f"{row['transparent']:>6.0%} {v['raw'] / MIB:>6.2f}M {v['raw_mips'] / MIB:>6.2f}M "
+              f"{v['compressed'] / MIB:>6.2f}M {v['compressed_mips'] / MIB:>7.2f}M {row['effective'] / MIB:>8.2f}M")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Texture VRAM/disk budget report for game/assets")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--budget", action="append", default=[], metavar="NAME=MIB",
+                        help=f"Override a budget ({', '.join(BUDGETS)}); repeatable")
+    parser.add_argument("--json", help="Write the full report as JSON here")
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS)
+    for item in args.budget:
+        name, _, value = item.partition("=")
+        if name not in budgets or not value:
+            parser.error(f"--budget expects NAME=MIB with NAME in {', '.join(BUDGETS)}")
+        budgets[name] = float(value)
+
+    in_root = Path(args.input) if args.input else Path(__file__).parent.parent / "game" / "assets"
+    cache = PixelCache()
+    rows = [measure(png, png.relative_to(in_root).as_posix(), cache) for png in sorted(in_root.rglob("*.png"))]
+
+    print("=" * 100)
+    print("Texture Budget — Startup Simulator")
+    print(f"Assets: {in_root}  ({len(rows)} textures)")
+    print("=" * 100)
+    print_table(rows)
+
+    over, used = check_budgets(rows, budgets)
+    print("\nBudgets (effective VRAM, disk):")
+    for name, limit in budgets.items():
+        mark = "✗" if any(o[0] == name for o in over) else "✓"
+        print(f"  {mark} {name:<10} {used.get(name, 0) / MIB:>7.2f} / {limit:g} MiB")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"budgets_mib": budgets, "used_bytes": used, "assets": rows}, indent=2))
+        print(f"\nReport saved to {args.json}")
+
+    if over:
+        print("\nOver budget:")
+        for name, amount, limit in over:
+            print(f"  ✗ {name}: {amount / MIB:.2f} MiB, {(amount - limit) / MIB:.2f} MiB over {limit / MIB:g} MiB")
+            key = "disk" if name == "disk" else "effective"
+            members = [r for r in rows if name in ("total", "disk") or r["category"] == name]
+            for row in sorted(members, key=lambda r: r[key], reverse=True)[:5]:
+                tips = "" if name == "disk" else advice(row)
+                tips = f" — {tips}" if tips else ""
+                print(f"      {row['asset']:<30} {row[key] / MIB:6.2f} MiB{tips}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
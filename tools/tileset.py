@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+TileSet Emitter for Startup Simulator
+Builds game/resources/tiles.tres from the generated tile textures, so the
+TileSet never has to be set up by hand in the editor.
+
+- One TileSetAtlasSource per tile texture. Its source id is the tile's
+  MapGenerator.TileType value and its single tile sits at atlas coords
+  (0, 0), so a cell is TileMapLayer.set_cell(pos, tile_type, Vector2i.ZERO).
+- Physics layer 0: collision polygons on every non-walkable tile, taken
+  from the tile's *.collision.json sidecar (tools/collision.py) when it
+  matches the texture, otherwise extracted from alpha on the spot. A
+  non-walkable tile with no solid region is an error, not a tile the
+  player can walk through.
+- Navigation layer 0: a full-cell polygon on every walkable tile.
+
+The TileSet's tile_size is the texture size (every tile texture must share
+it), so polygons stay in texture pixels; scale the TileMapLayer by
+TILE_SIZE / tile_size to put cells on the 320px world grid.
+
+Usage:
+  python tileset.py
+  python tileset.py --convex --dry-run
+"""
+
+import sys
+import json
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    print("ERROR: pip install pillow numpy")
+    sys.exit(1)
+
+from collision import VERTEX_BUDGET, extract, sidecar_path
+from godot_import import res_path
+from map_compiler import TILE_TYPES, WALKABLE
+from pixel_cache import PixelCache
+
+
+def tile_texture(in_root, tile_type):
+    """tiles/<type name>.png for a TileType value."""
+    return Path(in_root) / "tiles" / f"{TILE_TYPES[tile_type].lower()}.png"
+
+
+def collision_polygons(png_path, size, convex=False, budget=VERTEX_BUDGET, cache=None):
+    """Flat source-pixel polygons for one texture: sidecar if current, else from alpha."""
+    key = "convex" if convex else "polygons"
+    sidecar = sidecar_path(png_path)
+    if sidecar.exists():
+        report = json.loads(sidecar.read_text())
+        if report.get("size") == list(size) and key in report:
+            return report[key], "sidecar"
+    rgba = (cache or PixelCache()).pixels(png_path)
+    return extract(rgba, budget, convex=convex)[key], "alpha"
+
+
+def _vectors(flat):
+    return "PackedVector2Array(" + ", ".join(f"{v:g}" for v in flat) + ")"
+
+
+def _centred(flat, size):
+    """Texture-pixel polygon → tile-local coordinates (origin at the cell centre)."""
+    half = (size[0] / 2, size[1] / 2)
+    return [round(v - half[i % 2], 1) for i, v in enumerate(flat)]
+
+
+def build_tileset(in_root, convex=False, budget=VERTEX_BUDGET, cache=None):
+    """(tres text, [(tile_type, polygon count or "nav", origin)]) for every TileType."""
+    cache = cache or PixelCache()
+    sizes, missing = {}, []
+    for tile_type in range(len(TILE_TYPES)):
+        path = tile_texture(in_root, tile_type)
+        if not path.exists():
+            missing.append(path)
+            continue
+        with Image.open(path) as img:
+            sizes[tile_type] = img.size
+    if missing:
+        raise FileNotFoundError("missing tile textures: " + ", ".join(str(p) for p in missing))
+    if len(set(sizes.values())) > 1:
+        raise ValueError(f"tile textures differ in size: {sorted(set(sizes.values()))}")
+    size = next(iter(sizes.values()))
+    w, h = size[0] / 2, size[1] / 2
+    cell = [-w, -h, w, -h, w, h, -w, h]
+
+    ext, subs, sources, rows = [], [], [], []
+    subs.append("\n".join([
+        '[sub_resource type="NavigationPolygon" id="NavigationPolygon_cell"]',
+        f"vertices = {_vectors(cell)}",
+        "polygons = Array[PackedInt32Array]([PackedInt32Array(0, 1, 2, 3)])",
+        f"outlines = Array[PackedVector2Array]([{_vectors(cell)}])",
+    ]))
+    for tile_type, name in enumerate(TILE_TYPES):
+        path = tile_texture(in_root, tile_type)
+        ext_id, sub_id = f"{tile_type + 1}_{name.lower()}", f"TileSetAtlasSource_{name.lower()}"
+        ext.append(f'[ext_resource type="Texture2D" path="{res_path(path)}" id="{ext_id}"]')
+        lines = [
+            f'[sub_resource type="TileSetAtlasSource" id="{sub_id}"]',
+            f'texture = ExtResource("{ext_id}")',
+            f"texture_region_size = Vector2i({size[0]}, {size[1]})",
+            "0:0/0 = 0",
+        ]
+        if tile_type in WALKABLE:
+            lines.append('0:0/0/navigation_layer_0/polygon = SubResource("NavigationPolygon_cell")')
+            rows.append((name, "navigation", "cell"))
+        else:
+            polygons, origin = collision_polygons(path, size, convex, budget, cache)
+            if not polygons:
+                raise ValueError(f"{path.name} is not walkable but has no solid region to collide with")
+            for i, flat in enumerate(polygons):
+                lines.append(f"0:0/0/physics_layer_0/polygon_{i}/points = {_vectors(_centred(flat, size))}")
+            rows.append((name, f"{len(polygons)} polygon(s)", origin))
+        subs.append("\n".join(lines))
+        sources.append(f'sources/{tile_type} = SubResource("{sub_id}")')
+
+    header = f'[gd_resource type="TileSet" load_steps={len(ext) + len(subs) + 1} format=3]'
+    resource = "\n".join([
+        "[resource]",
+        f"tile_size = Vector2i({size[0]}, {size[1]})",
+        "physics_layer_0/collision_layer = 1",
+        "navigation_layer_0/layers = 1",
+        *sources,
+    ])
+    text = "\n\n".join([header, "\n".join(ext), *subs, resource]) + "\n"
+    return text, rows
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Emit the Godot TileSet resource from generated tiles")
+    parser.add_argument("--input", "-i", default=None, help="Asset root (default: game/assets/ in repo)")
+    parser.add_argument("--output", "-o", default=None, help="TileSet path (default: game/resources/tiles.tres)")
+    parser.add_argument("--convex", action="store_true", help="Use convex collision pieces")
+    parser.add_argument("--budget", type=int, default=VERTEX_BUDGET,
+                        help=f"Max vertices per tile when extracting from alpha (default: {VERTEX_BUDGET})")
+    parser.add_argument("--dry-run", action="store_true", help="Report only, write nothing")
+    args = parser.parse_args()
+
+    game_root = Path(__file__).parent.parent / "game"
+    in_root = Path(args.input) if args.input else game_root / "assets"
+    out_path = Path(args.output) if args.output else game_root / "resources" / "tiles.tres"
+
+    print("=" * 60)
+    print("TileSet Emitter — Startup Simulator")
+    print(f"Tiles: {in_root / 'tiles'}  Output: {out_path}")
+    print("=" * 60)
+
+    try:
+        text, rows = build_tileset(in_root, args.convex, args.budget)
+    except (OSError, ValueError) as e:
+        print(f"  ✗ {e}")
+        sys.exit(1)
+    for tile_type, (name, shape, origin) in enumerate(rows):
+        print(f"  ✓ {tile_type:>2} {name:<14} {shape} ({origin})")
+
+    if args.dry_run:
+        print(f"\nDry run: {len(rows)} tiles, nothing written")
+    elif out_path.exists() and out_path.read_text() == text:
+        print(f"\nDone: {len(rows)} tiles, {out_path.name} unchanged")
+    else:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(text)
+        print(f"\nDone: {len(rows)} tiles written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()